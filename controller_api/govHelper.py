@@ -1,14 +1,27 @@
 """Module to get data from governance contract and subgraph."""
 
 import os
+import time
+import queue
+import contextlib
+import asyncio
+import logging
+import itertools
+import threading
+import concurrent.futures
+from typing import Any
+from collections.abc import Callable, Hashable, Awaitable, Coroutine
 
-import requests
-from web3 import Web3
+import aiohttp
+from web3 import AsyncWeb3
+from indexer import Index
 from dotenv import load_dotenv
 
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 RPC = "https://base.drpc.org"
 with open("abi.json", encoding="utf-8") as file:
     ABI = file.read()
@@ -21,15 +34,267 @@ BASE_URL = os.environ.get("PONDER_API_URL", "http://localhost:42069")
 PONDER_URL = f"{BASE_URL}/graphql"
 HEADERS = {"Content-Type": "application/json"}
 
-w3 = Web3(Web3.HTTPProvider(RPC))
+POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "10"))
+MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "3"))
+RETRY_BACKOFF = float(os.environ.get("HTTP_RETRY_BACKOFF", "0.5"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+TIMEOUT = 60
+CALL_TIMEOUT = float(os.environ.get("CALL_TIMEOUT", "15"))
+
+PROPOSALS_TTL = float(os.environ.get("PROPOSALS_TTL", "30"))
+STATE_TTL = float(os.environ.get("STATE_TTL", "12"))
+VOTES_TTL = float(os.environ.get("VOTES_TTL", "30"))
+STALE_TTL = float(os.environ.get("STALE_TTL", "300"))
+STREAM_POLL_INTERVAL = float(os.environ.get("STREAM_POLL_INTERVAL", "5"))
+STREAM_QUEUE_SIZE = int(os.environ.get("STREAM_QUEUE_SIZE", "256"))  # events a subscriber may fall behind by
+DISCONNECTED = ("disconnected", None)
+LOCAL_INDEX_PATH = os.environ.get("LOCAL_INDEX_PATH")  # read from indexer.py instead of Ponder
+PAGE_SIZE = 50  # Ponder's default page size
+MAX_PAGE_SIZE = 1000  # the largest page Ponder serves
+VOTES_PAGE_SIZE = MAX_PAGE_SIZE
+PROPOSAL_FIELDS = ["proposalId", "description", "status", "createdBy", "transactionHash", "votes"]
+
+MULTICALL_ADDRESS = os.environ.get("MULTICALL_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+MULTICALL_BATCH_SIZE = int(os.environ.get("MULTICALL_BATCH_SIZE", "500"))
+MULTICALL_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
+ERROR_SELECTOR = bytes.fromhex("08c379a0")  # Error(string)
+VOTING_ENDED_ERROR = "Proposal voting has ended, but was not finalized yet"
+
+
+w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(RPC))
 governor_contract = w3.eth.contract(address=ADDRESS, abi=ABI)
+multicall_contract = w3.eth.contract(address=MULTICALL_ADDRESS, abi=MULTICALL_ABI)
+local_index = Index(LOCAL_INDEX_PATH) if LOCAL_INDEX_PATH else None
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_session: aiohttp.ClientSession | None = None
+
+
+class TTLCache:
+    """Cache of values loaded in batches, serving stale values while they are refreshed.
+
+    Entries younger than ttl are fresh. Entries up to stale_ttl older than that are
+    returned as is while a background task reloads them; older ones are reloaded
+    before returning.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = STALE_TTL):
+        """Initialize the cache."""
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._refreshing: set[Hashable] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get_many(
+        self, keys: list[Hashable], load: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]
+    ) -> dict[Hashable, Any]:
+        """Get the values of keys, loading the missing ones with load."""
+        now = time.monotonic()
+        values, missing, stale = {}, [], []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl + self.stale_ttl:
+                missing.append(key)
+                continue
+            values[key] = entry[1]
+            if now - entry[0] > self.ttl and key not in self._refreshing:
+                stale.append(key)
+        if stale:
+            self._refresh(stale, load)
+        if missing:
+            values.update(await self._load(missing, load))
+        return values
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Get the value of a single key, loading it with load."""
+
+        async def load_one(_keys: list[Hashable]) -> dict[Hashable, Any]:
+            return {key: await load()}
+
+        return (await self.get_many([key], load_one))[key]
+
+    def invalidate(self, keys: list[Hashable] | None = None) -> None:
+        """Drop keys, or every entry if no keys are given."""
+        if keys is None:
+            self._entries.clear()
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def _load(
+        self, keys: list[Hashable], load: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]
+    ) -> dict[Hashable, Any]:
+        """Load keys and store their values."""
+        values = await load(keys)
+        now = time.monotonic()
+        self._entries.update({key: (now, value) for key, value in values.items()})
+        return values
+
+    def _refresh(self, keys: list[Hashable], load: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]) -> None:
+        """Reload keys in a background task."""
+        self._refreshing.update(keys)
+        task = asyncio.create_task(self._load(keys, load))
+        self._tasks.add(task)
+
+        def done(task: asyncio.Task) -> None:
+            self._tasks.discard(task)
+            self._refreshing.difference_update(keys)
+            if not task.cancelled() and (e := task.exception()) is not None:
+                log.warning(f"Background refresh of {len(keys)} entries failed: {e}")
 
+        task.add_done_callback(done)
 
-def get_proposals() -> list[dict]:
-    """Get all proposals."""
+
+proposals_cache = TTLCache(PROPOSALS_TTL)
+states_cache = TTLCache(STATE_TTL)
+votes_cache = TTLCache(VOTES_TTL)
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the data layer's event loop, starting it on first use.
+
+    The loop lives in a daemon thread for the lifetime of the process, so the
+    pooled connections it owns are shared by every request thread.
+    """
+    global _loop  # noqa: PLW0603
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="govHelper", daemon=True).start()
+    return _loop
+
+
+def run(coroutine: Coroutine):
+    """Run a coroutine on the data layer's event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_loop()).result()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the keep-alive session shared by GraphQL and JSON-RPC calls."""
+    global _session  # noqa: PLW0603
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=POOL_SIZE),
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT),
+        )
+        await w3.provider.cache_async_session(_session)
+    return _session
+
+
+async def with_retries(call: Callable[[], Awaitable[Any]]) -> Any:
+    """Await call(), retrying connection errors, timeouts and 429/5xx responses with backoff."""
+    for attempt in itertools.count():
+        try:
+            return await call()
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+
+
+async def graphql(query: str, variables: dict | None = None) -> dict:
+    """Post a query to Ponder, with retries."""
+    session = await get_session()
+
+    async def post() -> dict:
+        async with session.post(
+            PONDER_URL,
+            json={"query": query, "variables": variables or {}},
+            timeout=aiohttp.ClientTimeout(total=CALL_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["data"]
+
+    return await with_retries(post)
+
+
+async def rpc_call(function: Any) -> Any:
+    """Call a contract function over JSON-RPC, with retries."""
+    return await with_retries(lambda: asyncio.wait_for(function.call(), timeout=CALL_TIMEOUT))
+
+
+def get_proposals(
+    limit: int | None = PAGE_SIZE, after: str | None = None, fields: list[str] | None = None
+) -> tuple[list[dict], str | None]:
+    """Get a page of proposals, or all of them when limit is None, and the cursor of the next one."""
+    return run(aget_proposals(limit, after, fields))
+
+
+def get_votes(proposal_id: str) -> list[dict]:
+    """Get votes for proposal_id."""
+    return run(votes_cache.get_many([proposal_id], aget_votes_by_proposal))[proposal_id]
+
+
+async def aget_proposals(
+    limit: int | None = PAGE_SIZE, after: str | None = None, fields: list[str] | None = None
+) -> tuple[list[dict], str | None]:
+    """Get a page of proposals, or all of them when limit is None, and the cursor of the next one.
+
+    Only the requested fields are returned; states and votes are not read unless asked for.
+    """
+    if limit is None:
+        proposals = []
+        while True:
+            page, after = await aget_proposals(MAX_PAGE_SIZE, after, fields)
+            proposals += page
+            if after is None:
+                return proposals, None
+    proposals, cursor = await proposals_cache.get(("proposals", limit, after), lambda: _aget_proposal_page(limit, after))
+    fields = fields or PROPOSAL_FIELDS
+    proposal_ids = [proposal["proposalId"] for proposal in proposals]
+    lookups = {}
+    if "status" in fields:
+        lookups["status"] = states_cache.get_many(proposal_ids, aget_states)
+    if "votes" in fields:
+        lookups["votes"] = votes_cache.get_many(proposal_ids, aget_votes_by_proposal)
+    results = dict(zip(lookups, await asyncio.gather(*lookups.values()), strict=True))
+    page = []
+    for proposal in proposals:
+        proposal = {**proposal, **{field: values[proposal["proposalId"]] for field, values in results.items()}}
+        page.append({field: proposal[field] for field in fields if field in proposal})
+    return page, cursor
+
+
+async def _aget_proposal_page(limit: int, after: str | None) -> tuple[list[dict], str | None]:
+    """Get a page of proposals as indexed by Ponder, or the local index, and the cursor of the next one."""
+    if local_index is not None:
+        return await asyncio.to_thread(local_index.proposals, limit, after)
     query = """
-    {
-        proposals(orderBy:"proposalId", orderDirection: "desc") {
+    query ($limit: Int, $after: String) {
+        proposals(orderBy:"proposalId", orderDirection: "desc", limit: $limit, after: $after) {
             items {
                 proposalId
                 description
@@ -37,41 +302,202 @@ def get_proposals() -> list[dict]:
                 createdBy
                 transactionHash
             }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
         }
     }
     """
 
-    response = requests.post(PONDER_URL, json={"query": query}, headers=HEADERS, timeout=60)
+    page = (await graphql(query, {"limit": limit, "after": after}))["proposals"]
+    return page["items"], page["pageInfo"]["endCursor"] if page["pageInfo"]["hasNextPage"] else None
 
-    proposals = response.json()["data"]["proposals"]["items"]
-    for proposal in proposals:
-        try:
-            status = governor_contract.functions.state(int(proposal["proposalId"])).call()
-            proposal["status"] = status
-        except Exception as e:  # noqa: BLE001
-            error_message = str(e.args[0])  # Get the error message
-            if "Proposal voting has ended, but was not finalized yet" in error_message:
-                proposal["status"] = "Ended"
+
+def invalidate(proposal_ids: list[str] | None = None) -> None:
+    """Drop cached data, for proposal_ids only if given, so the next read refetches it."""
+
+    async def _invalidate() -> None:
+        proposals_cache.invalidate()
+        states_cache.invalidate(proposal_ids)
+        votes_cache.invalidate(proposal_ids)
+
+    run(_invalidate())
+
+
+class ProposalWatcher:
+    """Single poller diffing proposals and their votes, fanning the changes out to subscribers.
+
+    Each subscriber gets a snapshot event, then one event per change: a new proposal,
+    a status change, or the votes added to or removed from a proposal. Polling only
+    runs while there are subscribers. A subscriber too far behind to take an event is
+    dropped, its backlog replaced by a disconnected event so it can resubscribe.
+    """
+
+    def __init__(self, interval: float = STREAM_POLL_INTERVAL, queue_size: int = STREAM_QUEUE_SIZE):
+        """Initialize the watcher."""
+        self.interval = interval
+        self.queue_size = queue_size
+        self._proposals: dict[str, dict] | None = None
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._poller: concurrent.futures.Future | None = None
+
+    def subscribe(self) -> queue.Queue:
+        """Get a queue of (event, data) tuples, starting the poller if needed."""
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if self._proposals is not None:
+                subscriber.put(("snapshot", list(self._proposals.values())))
+            self._subscribers.add(subscriber)
+            if self._poller is None:
+                self._poller = asyncio.run_coroutine_threadsafe(self._poll(), get_loop())
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """Stop delivering events to subscriber."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def _publish(self, event: str, data: Any) -> None:
+        """Put an event on every subscriber queue, dropping the subscribers whose queue is full."""
+        with self._lock:
+            for subscriber in list(self._subscribers):
+                try:
+                    subscriber.put_nowait((event, data))
+                except queue.Full:
+                    log.warning(f"Dropping a stream subscriber {subscriber.qsize()} events behind")
+                    self._subscribers.discard(subscriber)
+                    with contextlib.suppress(queue.Empty):
+                        while True:
+                            subscriber.get_nowait()
+                    subscriber.put_nowait(DISCONNECTED)
+
+    async def _poll(self) -> None:
+        """Poll proposals and publish the changes until nobody is subscribed."""
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._proposals = self._poller = None
+                    return
+            try:
+                proposals = await self._get_all()
+            except Exception as e:  # noqa: BLE001
+                log.warning(f"Polling proposals failed: {e}")
             else:
-                proposal["status"] = "unknown"
-        votes = get_votes(proposal["proposalId"])
-        proposal["votes"] = votes
+                self._diff(proposals)
+            await asyncio.sleep(self.interval)
 
-    return proposals
+    async def _get_all(self) -> dict[str, dict]:
+        """Get every proposal, following the cursor through all pages."""
+        proposals, after = {}, None
+        while True:
+            page, after = await aget_proposals(limit=MAX_PAGE_SIZE, after=after)
+            proposals.update({proposal["proposalId"]: proposal for proposal in page})
+            if after is None:
+                return proposals
 
+    def _diff(self, proposals: dict[str, dict]) -> None:
+        """Publish what changed since the previous poll."""
+        previous, self._proposals = self._proposals, proposals
+        if previous is None:
+            self._publish("snapshot", list(proposals.values()))
+            return
+        for proposal_id, proposal in proposals.items():
+            if (old := previous.get(proposal_id)) is None:
+                self._publish("proposal", proposal)
+                continue
+            if proposal["status"] != old["status"]:
+                self._publish("status", {"proposalId": proposal_id, "status": proposal["status"]})
+            votes = {vote["voter"]: vote for vote in proposal["votes"]}
+            old_votes = {vote["voter"]: vote for vote in old["votes"]}
+            added = [vote for voter, vote in votes.items() if old_votes.get(voter) != vote]
+            removed = [vote for voter, vote in old_votes.items() if voter not in votes]
+            if added or removed:
+                self._publish("votes", {"proposalId": proposal_id, "added": added, "removed": removed})
 
-def get_votes(proposal_id: str) -> list[dict]:
-    """Get votes for proposal_id."""
-    query = f"""
-    {{
-        votes(where:{{proposalId: "{proposal_id}"}}, orderBy:"voter", orderDirection: "desc") {{
-            items {{
+
+watcher = ProposalWatcher()
+
+
+async def aget_state(proposal_id: str) -> int | str:
+    """Get the governor state of proposal_id."""
+    try:
+        return await rpc_call(governor_contract.functions.state(int(proposal_id)))
+    except Exception as e:  # noqa: BLE001
+        error_message = str(e.args[0]) if e.args else str(e)  # Get the error message
+        return "Ended" if VOTING_ENDED_ERROR in error_message else "unknown"
+
+
+async def aget_states(proposal_ids: list[str]) -> dict[str, int | str]:
+    """Get the governor state of all proposal_ids, batched through Multicall3."""
+    await get_session()  # the provider reuses the pooled session
+    batches = [
+        proposal_ids[start : start + MULTICALL_BATCH_SIZE]
+        for start in range(0, len(proposal_ids), MULTICALL_BATCH_SIZE)
+    ]
+    states = {}
+    for batch_states in await asyncio.gather(*(_aget_states_batch(batch) for batch in batches)):
+        states.update(batch_states)
+    return states
+
+
+async def _aget_states_batch(proposal_ids: list[str]) -> dict[str, int | str]:
+    """Get the governor state of proposal_ids with a single aggregate3 call."""
+    calls = [
+        (governor_contract.address, True, governor_contract.functions.state(int(proposal_id))._encode_transaction_data())
+        for proposal_id in proposal_ids
+    ]
+    try:
+        results = await rpc_call(multicall_contract.functions.aggregate3(calls))
+    except Exception as e:  # noqa: BLE001
+        log.warning(f"Multicall failed, reading states one by one: {e}")
+        states = await asyncio.gather(*(aget_state(proposal_id) for proposal_id in proposal_ids))
+        return dict(zip(proposal_ids, states, strict=True))
+    return {
+        proposal_id: w3.codec.decode(["uint8"], data)[0] if success else classify_revert(data)
+        for proposal_id, (success, data) in zip(proposal_ids, results, strict=True)
+    }
+
+
+def classify_revert(data: bytes) -> str:
+    """Classify the revert data of a failed state() call like aget_state does."""
+    if data[:4] == ERROR_SELECTOR and VOTING_ENDED_ERROR in w3.codec.decode(["string"], data[4:])[0]:
+        return "Ended"
+    return "unknown"
+
+
+async def aget_votes_by_proposal(proposal_ids: list[str]) -> dict[str, list[dict]]:
+    """Get the votes for all proposal_ids in one paged query, grouped by proposal."""
+    query = """
+    query ($proposalIds: [String], $limit: Int, $after: String) {
+        votes(
+            where: {proposalId_in: $proposalIds}, orderBy: "voter", orderDirection: "desc",
+            limit: $limit, after: $after
+        ) {
+            items {
+                proposalId
                 voter
                 weight
-            }}
-        }}
-    }}
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
     """
 
-    response = requests.post(PONDER_URL, json={"query": query}, headers=HEADERS, timeout=60)
-    return response.json()["data"]["votes"]["items"]
+    if local_index is not None:
+        return await asyncio.to_thread(local_index.votes_by_proposal, proposal_ids)
+    votes: dict[str, list[dict]] = {proposal_id: [] for proposal_id in proposal_ids}
+    if not proposal_ids:
+        return votes
+    variables = {"proposalIds": proposal_ids, "limit": VOTES_PAGE_SIZE, "after": None}
+    while True:
+        page = (await graphql(query, variables))["votes"]
+        for vote in page["items"]:
+            votes[vote.pop("proposalId")].append(vote)
+        if not page["pageInfo"]["hasNextPage"]:
+            return votes
+        variables["after"] = page["pageInfo"]["endCursor"]
@@ -0,0 +1,210 @@
+"""Module to index proposals and votes from governor contract logs into SQLite."""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+
+from web3 import Web3
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+log = logging.getLogger(__name__)
+
+RPC = os.environ.get("RPC_URL", "https://base.drpc.org")
+with open("abi.json", encoding="utf-8") as file:
+    ABI = file.read()
+
+ADDRESS = os.environ.get("GOVERNOR_CONTRACT_ADDRESS", "0xE5Da5F4d8644A271226161a859c1177C5214c54e")
+
+INDEX_PATH = os.environ.get("INDEX_PATH", "index.db")
+START_BLOCK = int(os.environ.get("INDEXER_START_BLOCK", "30956292"))
+CHUNK_SIZE = int(os.environ.get("INDEXER_CHUNK_SIZE", "2000"))
+CONFIRMATIONS = int(os.environ.get("INDEXER_CONFIRMATIONS", "5"))
+POLL_INTERVAL = float(os.environ.get("INDEXER_POLL_INTERVAL", "2"))
+EVENTS = ("ProposalCreated", "VoteCast", "ProposalQueued")
+# proposal ids are uint256 hashes, too large for an SQLite INTEGER, so they are stored zero padded
+# to the digits of the largest uint256 to sort numerically
+PROPOSAL_ID_DIGITS = 78
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS proposal (
+    proposalId TEXT PRIMARY KEY,
+    description TEXT,
+    status TEXT,
+    createdBy TEXT,
+    transactionHash TEXT
+);
+CREATE TABLE IF NOT EXISTS vote (
+    proposalId TEXT,
+    voter TEXT,
+    weight TEXT,
+    PRIMARY KEY (proposalId, voter)
+);
+CREATE INDEX IF NOT EXISTS vote_voter ON vote (voter);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    address TEXT PRIMARY KEY,
+    block INTEGER
+);
+"""
+
+
+def proposal_key(proposal_id: int | str) -> str:
+    """Get the stored, numerically sortable key of proposal_id."""
+    return str(int(proposal_id)).zfill(PROPOSAL_ID_DIGITS)
+
+
+def proposal_id_of(key: str) -> str:
+    """Get the proposal id of a stored key."""
+    return key.lstrip("0") or "0"
+
+
+def event_topic(event_abi: dict) -> str:
+    """Get the topic of an event from its ABI."""
+    types = ",".join(argument["type"] for argument in event_abi["inputs"])
+    return Web3.to_hex(Web3.keccak(text=f"{event_abi['name']}({types})"))
+
+
+class Index:
+    """Proposals and votes of the governor, stored in the same shape as the Ponder tables."""
+
+    def __init__(self, path: str = INDEX_PATH):
+        """Initialize the index."""
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # the index is derived from the logs, so an outdated one is rebuilt from the start block
+            for table in ("proposal", "vote", "checkpoint"):
+                self._db.execute(f"DROP TABLE IF EXISTS {table}")
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def checkpoint(self, address: str) -> int | None:
+        """Get the last block indexed for address."""
+        with self._lock:
+            row = self._db.execute("SELECT block FROM checkpoint WHERE address = ?", (address,)).fetchone()
+        return None if row is None else row[0]
+
+    def apply(self, address: str, to_block: int, events: list) -> None:
+        """Store decoded events and advance the checkpoint of address to to_block in one transaction."""
+        with self._lock, self._db:
+            for event in events:
+                args = event["args"]
+                proposal_id = proposal_key(args["proposalId"])
+                if event["event"] == "ProposalCreated":
+                    self._db.execute(
+                        "INSERT OR IGNORE INTO proposal VALUES (?, ?, 'Pending', ?, ?)",
+                        (proposal_id, args["description"], args["proposer"], Web3.to_hex(event["transactionHash"])),
+                    )
+                elif event["event"] == "ProposalQueued":
+                    self._db.execute("UPDATE proposal SET status = 'Queued' WHERE proposalId = ?", (proposal_id,))
+                elif event["event"] == "VoteCast":
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO vote VALUES (?, ?, ?)", (proposal_id, args["voter"], str(args["weight"]))
+                    )
+            self._db.execute("INSERT OR REPLACE INTO checkpoint VALUES (?, ?)", (address, to_block))
+
+    def proposals(self, limit: int, after: str | None = None) -> tuple[list[dict], str | None]:
+        """Get a page of proposals by descending id, and the cursor of the next one.
+
+        Unlike Ponder, whose proposalId is a text column sorted as a string, the ids are
+        sorted as numbers. The cursor is the proposal id the page ends at.
+        """
+        query = "SELECT proposalId, description, status, createdBy, transactionHash FROM proposal"
+        params: tuple = (limit + 1,)
+        if after is not None:
+            if not after.isdecimal():
+                msg = f"Invalid cursor {after!r}, expected a proposal id."
+                raise ValueError(msg)
+            query += " WHERE proposalId < ?"
+            params = (proposal_key(after), limit + 1)
+        with self._lock:
+            cursor = self._db.execute(f"{query} ORDER BY proposalId DESC LIMIT ?", params)  # noqa: S608
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+        for row in rows:
+            row["proposalId"] = proposal_id_of(row["proposalId"])
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return rows, rows[-1]["proposalId"] if more else None
+
+    def votes_by_proposal(self, proposal_ids: list[str]) -> dict[str, list[dict]]:
+        """Get the votes of proposal_ids, grouped by proposal."""
+        votes: dict[str, list[dict]] = {proposal_id: [] for proposal_id in proposal_ids}
+        placeholders = ",".join("?" * len(proposal_ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT proposalId, voter, weight FROM vote WHERE proposalId IN ({placeholders}) "  # noqa: S608
+                "ORDER BY voter DESC",
+                [proposal_key(proposal_id) for proposal_id in proposal_ids],
+            ).fetchall()
+        for key, voter, weight in rows:
+            votes[proposal_id_of(key)].append({"voter": voter, "weight": weight})
+        return votes
+
+    def votes_by_voter(self, voter: str) -> list[dict]:
+        """Get the votes cast by voter."""
+        with self._lock:
+            rows = self._db.execute("SELECT proposalId, weight FROM vote WHERE voter = ?", (voter,)).fetchall()
+        return [{"proposalId": proposal_id_of(key), "weight": weight} for key, weight in rows]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+class Indexer:
+    """Incrementally syncs the index from the governor contract logs in block range chunks."""
+
+    def __init__(self, index: Index, w3: Web3, address: str = ADDRESS, start_block: int = START_BLOCK):
+        """Initialize the indexer."""
+        self.index = index
+        self.w3 = w3
+        self.contract = w3.eth.contract(address=address, abi=ABI)
+        self.start_block = start_block
+        self.topics = {
+            event_topic(event_abi): event_abi["name"]
+            for event_abi in self.contract.abi
+            if event_abi["type"] == "event" and event_abi["name"] in EVENTS
+        }
+
+    def sync(self) -> int:
+        """Index every confirmed block since the checkpoint, returning the number of events stored."""
+        address = self.contract.address
+        checkpoint = self.index.checkpoint(address)
+        from_block = self.start_block if checkpoint is None else checkpoint + 1
+        head = self.w3.eth.block_number - CONFIRMATIONS
+        count = 0
+        while from_block <= head:
+            to_block = min(from_block + CHUNK_SIZE - 1, head)
+            logs = self.w3.eth.get_logs(
+                {"address": address, "fromBlock": from_block, "toBlock": to_block, "topics": [list(self.topics)]}
+            )
+            events = [
+                getattr(self.contract.events, self.topics[Web3.to_hex(entry["topics"][0])])().process_log(entry)
+                for entry in logs
+            ]
+            self.index.apply(address, to_block, events)
+            log.info(f"Indexed {len(events)} events in blocks {from_block}-{to_block}")
+            count += len(events)
+            from_block = to_block + 1
+        return count
+
+    def run_forever(self, interval: float = POLL_INTERVAL) -> None:
+        """Keep the index in sync with the chain head."""
+        while True:
+            try:
+                self.sync()
+            except Exception as e:  # noqa: BLE001
+                log.warning(f"Indexing failed, retrying: {e}")
+            time.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    Indexer(Index(), Web3(Web3.HTTPProvider(RPC))).run_forever()
@@ -1,29 +1,101 @@
 """This module contains the main API for the controller."""
 
+import os
+import json
+import queue
 import logging
+import threading
+from collections.abc import Iterator
 
 import yaml
 import connexion
 import govHelper
+from flask import Response
 from flask_cors import CORS
 
 
 log = logging.getLogger(__name__)
 
-
-def get_agents() -> list[dict]:
-    """Get all agents."""
-    with open("agents.yaml", encoding="utf-8") as yaml_file:
-        return yaml.safe_load(yaml_file)["agents"]
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+KEEPALIVE_INTERVAL = 15
+
+
+class YamlStore:
+    """Records of a YAML file indexed by some of their fields, reloaded when the file changes."""
+
+    def __init__(self, path: str, collection: str, fields: tuple[str, ...]):
+        """Initialize the store."""
+        self.path = path
+        self.collection = collection
+        self.fields = fields
+        self._mtime: float | None = None
+        self._records: list[dict] = []
+        self._indexes: dict[str, dict[str, dict]] = {}
+        self._positions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def all(self) -> list[dict]:
+        """Get all records."""
+        self._reload()
+        return self._records
+
+    def page(self, limit: int | None, after: str | None = None) -> tuple[list[dict], str | None]:
+        """Get up to limit records, all if None, following the one whose first field is after, and the next cursor."""
+        self._reload()
+        start = 0 if after is None else self._positions.get(after.lower(), len(self._records)) + 1
+        end = len(self._records) if limit is None else start + limit
+        records = self._records[start:end]
+        more = end < len(self._records)
+        return records, str(records[-1][self.fields[0]]) if records and more else None
+
+    def find(self, field: str, value: str) -> dict | None:
+        """Get the first record whose field has value."""
+        self._reload()
+        return self._indexes[field].get(value.lower())
+
+    def _reload(self) -> None:
+        """Parse the file and rebuild the indexes if it changed since the last load."""
+        mtime = os.stat(self.path).st_mtime
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            with open(self.path, encoding="utf-8") as yaml_file:
+                records = yaml.safe_load(yaml_file)[self.collection]
+            indexes = {field: {} for field in self.fields}
+            positions = {}
+            for position, record in enumerate(records):
+                positions.setdefault(str(record[self.fields[0]]).lower(), position)
+                for field, index in indexes.items():
+                    if field in record:
+                        index.setdefault(str(record[field]).lower(), record)
+            self._records, self._indexes, self._positions, self._mtime = records, indexes, positions, mtime
+
+
+agents = YamlStore("agents.yaml", "agents", ("id", "address"))
+proposals = YamlStore("proposals.yaml", "proposals", ("proposalId",))
+
+
+def paginated(items: list[dict], cursor: str | None, fields: list[str] | None = None) -> tuple:
+    """Build a page response, selecting fields and passing the next cursor in a header."""
+    if fields:
+        items = [{field: item[field] for field in fields if field in item} for item in items]
+    headers = {NEXT_CURSOR_HEADER: cursor} if cursor is not None else {}
+    return items, 200, headers
+
+
+def get_agents(limit: int | None = None, after: str | None = None, fields: list[str] | None = None) -> tuple:
+    """Get a page of agents, or all of them when no limit is given."""
+    return paginated(*agents.page(limit, after), fields)
 
 
 def get_agent(id: str) -> dict:
-    """Get an agent by ID."""
-    with open("agents.yaml", encoding="utf-8") as yaml_file:
-        data = yaml.safe_load(yaml_file)
-
-    filtered_agent = [agent for agent in data["agents"] if agent["id"] == id]
-    return filtered_agent[0]
+    """Get an agent by ID or address."""
+    agent = agents.find("id", id) or agents.find("address", id)
+    if agent is None:
+        return connexion.problem(404, "Not Found", f"Agent {id} not found")
+    return agent
 
 
 def post_agents(agent: dict) -> dict:
@@ -31,11 +103,33 @@ def post_agents(agent: dict) -> dict:
     return agent
 
 
-def get_proposals() -> list[dict]:
-    """Get all proposals."""
-    return govHelper.get_proposals()
+def get_proposals(limit: int | None = None, after: str | None = None, fields: list[str] | None = None) -> tuple:
+    """Get a page of proposals, or all of them when no limit is given."""
+    try:
+        return paginated(*govHelper.get_proposals(limit, after, fields))
+    except ValueError as e:
+        return connexion.problem(400, "Bad Request", str(e))
+
 
-    # To change output to json string, use json.dumps(data)
+def get_proposals_stream() -> Response:
+    """Stream proposal changes as server-sent events."""
+    subscriber = govHelper.watcher.subscribe()
+
+    def events() -> Iterator[str]:
+        try:
+            while True:
+                try:
+                    event, data = subscriber.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                if (event, data) == govHelper.DISCONNECTED:
+                    return
+        finally:
+            govHelper.watcher.unsubscribe(subscriber)
+
+    return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 def post_proposals(proposal: dict) -> dict:
@@ -45,11 +139,10 @@ def post_proposals(proposal: dict) -> dict:
 
 def get_proposal(id: str) -> dict:
     """Get a proposal by ID."""
-    with open("proposals.yaml", encoding="utf-8") as yaml_file:
-        data = yaml.safe_load(yaml_file)
-
-    filtered_proposal = [proposal for proposal in data["proposals"] if proposal["proposalId"] == id]
-    return filtered_proposal[0]
+    proposal = proposals.find("proposalId", id)
+    if proposal is None:
+        return connexion.problem(404, "Not Found", f"Proposal {id} not found")
+    return proposal
 
 
 def post_proposal_vote(id: str, vote: dict) -> dict:
@@ -67,6 +160,6 @@ def get_proposal_vote(id: str, vote: dict) -> dict:
 if __name__ == "__main__":
     app = connexion.FlaskApp(__name__, specification_dir="../specs/")
     flask_app = app.app  # access underlying Flask app
-    CORS(flask_app, resources={r"/*": {"origins": "*"}})
+    CORS(flask_app, resources={r"/*": {"origins": "*", "expose_headers": [NEXT_CURSOR_HEADER]}})
     app.add_api("controller_spec.yaml", arguments={"title": "Controller API"})
     app.run()
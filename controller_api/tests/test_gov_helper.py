@@ -0,0 +1,77 @@
+"""Test the governance data layer."""
+
+import sys
+import queue
+import asyncio
+import importlib
+from pathlib import Path
+
+import pytest
+import aiohttp
+
+
+CONTROLLER_API = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def gov_helper(monkeypatch):
+    """Import govHelper from the service directory, where its abi.json is read from."""
+    monkeypatch.chdir(CONTROLLER_API)
+    monkeypatch.syspath_prepend(str(CONTROLLER_API))
+    sys.modules.pop("govHelper", None)
+    return importlib.import_module("govHelper")
+
+
+def response_error(status: int) -> aiohttp.ClientResponseError:
+    """Build the error aiohttp raises for an HTTP status."""
+    return aiohttp.ClientResponseError(request_info=None, history=(), status=status)
+
+
+class TestWithRetries:
+    """Test with_retries."""
+
+    def test_retries_rate_limits_and_server_errors(self, gov_helper, monkeypatch):
+        """Test 429 and 5xx responses and timeouts are retried until the call succeeds."""
+        monkeypatch.setattr(gov_helper, "RETRY_BACKOFF", 0)
+        errors = [response_error(429), asyncio.TimeoutError(), response_error(503)]
+
+        async def call() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert asyncio.run(gov_helper.with_retries(call)) == "ok"
+
+    def test_raises_client_errors_and_after_max_retries(self, gov_helper, monkeypatch):
+        """Test other statuses are raised at once, and retried ones once MAX_RETRIES is reached."""
+        monkeypatch.setattr(gov_helper, "RETRY_BACKOFF", 0)
+        attempts = []
+
+        async def call(status: int) -> None:
+            attempts.append(status)
+            raise response_error(status)
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(gov_helper.with_retries(lambda: call(400)))
+        assert len(attempts) == 1
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(gov_helper.with_retries(lambda: call(429)))
+        assert len(attempts) == 2 + gov_helper.MAX_RETRIES
+
+
+class TestProposalWatcher:
+    """Test ProposalWatcher."""
+
+    def test_drops_subscribers_that_fall_behind(self, gov_helper):
+        """Test a subscriber with a full queue is dropped and told so, while the others keep receiving."""
+        watcher = gov_helper.ProposalWatcher(queue_size=2)
+        slow, fast = queue.Queue(maxsize=2), queue.Queue(maxsize=2)
+        watcher._subscribers.update({slow, fast})  # noqa: SLF001
+        for index in range(3):
+            watcher._publish("proposal", index)  # noqa: SLF001
+            if index == 1:
+                fast.get_nowait()
+
+        assert list(slow.queue) == [gov_helper.DISCONNECTED]
+        assert list(fast.queue) == [("proposal", 1), ("proposal", 2)]
+        assert watcher._subscribers == {fast}  # noqa: SLF001
@@ -0,0 +1,204 @@
+"""Test the governor log indexer."""
+
+import sys
+import importlib
+from types import SimpleNamespace
+from pathlib import Path
+
+import pytest
+from web3 import Web3
+from eth_abi import encode
+
+
+CONTROLLER_API = Path(__file__).parent.parent
+ADDRESS = "0xE5Da5F4d8644A271226161a859c1177C5214c54e"
+PROPOSER = "0x0000000000000000000000000000000000000001"
+# proposal ids are uint256 hashes, sorting after the small ids only when compared as numbers
+LARGE_ID = 2**255 + 7
+
+
+@pytest.fixture
+def indexer(monkeypatch):
+    """Import the indexer from the service directory, where its abi.json is read from."""
+    monkeypatch.chdir(CONTROLLER_API)
+    monkeypatch.syspath_prepend(str(CONTROLLER_API))
+    sys.modules.pop("indexer", None)
+    return importlib.import_module("indexer")
+
+
+class FakeChain:
+    """Chain serving logs of the governor at their blocks, recording the ranges asked for."""
+
+    def __init__(self, indexer, head: int):
+        """Initialize the chain."""
+        self.governor = Web3().eth.contract(address=ADDRESS, abi=indexer.ABI)
+        self.block_number = head
+        self.logs: list[dict] = []
+        self.ranges: list[tuple[int, int]] = []
+
+    def emit(self, block: int, event: str, indexed: dict | None = None, **args) -> None:
+        """Add a log of event at block."""
+        event_abi = next(item for item in self.governor.abi if item.get("name") == event)
+        inputs = [argument for argument in event_abi["inputs"] if not argument["indexed"]]
+        data = encode([argument["type"] for argument in inputs], [args[argument["name"]] for argument in inputs])
+        topics = [Web3.to_bytes(hexstr=event_topic(event_abi))]
+        topics += [encode(["address"], [value]) for value in (indexed or {}).values()]
+        self.logs.append(
+            {
+                "address": ADDRESS,
+                "topics": topics,
+                "data": data,
+                "blockNumber": block,
+                "transactionHash": Web3.keccak(text=f"{block}-{len(self.logs)}"),
+                "transactionIndex": 0,
+                "blockHash": Web3.keccak(text=str(block)),
+                "logIndex": len(self.logs),
+            }
+        )
+
+    def get_logs(self, params: dict) -> list[dict]:
+        """Get the logs in the block range of params."""
+        self.ranges.append((params["fromBlock"], params["toBlock"]))
+        return [entry for entry in self.logs if params["fromBlock"] <= entry["blockNumber"] <= params["toBlock"]]
+
+    def contract(self, **_kwargs):
+        """Get the governor contract."""
+        return self.governor
+
+
+def event_topic(event_abi: dict) -> str:
+    """Get the topic of an event from its ABI."""
+    types = ",".join(argument["type"] for argument in event_abi["inputs"])
+    return Web3.to_hex(Web3.keccak(text=f"{event_abi['name']}({types})"))
+
+
+def propose(chain: FakeChain, block: int, proposal_id: int) -> None:
+    """Emit the creation of proposal_id."""
+    chain.emit(
+        block,
+        "ProposalCreated",
+        proposalId=proposal_id,
+        proposer=PROPOSER,
+        targets=[],
+        values=[],
+        signatures=[],
+        calldatas=[],
+        voteStart=block,
+        voteEnd=block + 100,
+        description=f"Proposal #{proposal_id}",
+    )
+
+
+def vote(chain: FakeChain, block: int, proposal_id: int, voter: str, weight: int) -> None:
+    """Emit a vote on proposal_id."""
+    chain.emit(block, "VoteCast", {"voter": voter}, proposalId=proposal_id, support=1, weight=weight, reason="")
+
+
+def make_indexer(indexer, chain: FakeChain, path: Path, start_block: int = 100):
+    """Build an indexer reading from chain and storing into path."""
+    return indexer.Indexer(indexer.Index(str(path)), SimpleNamespace(eth=chain), start_block=start_block)
+
+
+class TestIndexer:
+    """Test Indexer."""
+
+    def test_syncs_in_chunks_up_to_confirmed_head(self, indexer, monkeypatch, tmp_path):
+        """Test the logs are read in chunks, leaving out blocks within the confirmations window."""
+        monkeypatch.setattr(indexer, "CHUNK_SIZE", 10)
+        monkeypatch.setattr(indexer, "CONFIRMATIONS", 5)
+        chain = FakeChain(indexer, head=130)
+        propose(chain, 100, 1)
+        propose(chain, 112, 2)
+        propose(chain, 127, 3)
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+
+        assert idx.sync() == 2
+        assert chain.ranges == [(100, 109), (110, 119), (120, 125)]
+        assert idx.index.checkpoint(ADDRESS) == 125
+        proposals, _after = idx.index.proposals(10)
+        assert [proposal["proposalId"] for proposal in proposals] == ["2", "1"]
+
+    def test_resumes_from_checkpoint(self, indexer, monkeypatch, tmp_path):
+        """Test a new indexer on the same database carries on after the checkpoint."""
+        monkeypatch.setattr(indexer, "CONFIRMATIONS", 0)
+        chain = FakeChain(indexer, head=110)
+        propose(chain, 105, 1)
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+        idx.sync()
+        idx.index.close()
+
+        propose(chain, 115, 2)
+        vote(chain, 116, 1, PROPOSER, 42)
+        chain.block_number = 120
+        chain.ranges.clear()
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+        assert idx.sync() == 2
+        assert chain.ranges == [(111, 120)]
+        assert idx.sync() == 0
+        assert idx.index.votes_by_voter(PROPOSER) == [{"proposalId": "1", "weight": "42"}]
+
+    def test_marks_queued_proposals(self, indexer, monkeypatch, tmp_path):
+        """Test a queued proposal changes status."""
+        monkeypatch.setattr(indexer, "CONFIRMATIONS", 0)
+        chain = FakeChain(indexer, head=110)
+        propose(chain, 101, 1)
+        chain.emit(102, "ProposalQueued", proposalId=1, etaSeconds=0)
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+        idx.sync()
+        assert idx.index.proposals(10)[0][0]["status"] == "Queued"
+
+
+class TestIndex:
+    """Test Index."""
+
+    def test_pages_proposals_in_numeric_order(self, indexer, monkeypatch, tmp_path):
+        """Test proposals are paged by descending id, numerically rather than as strings."""
+        monkeypatch.setattr(indexer, "CONFIRMATIONS", 0)
+        chain = FakeChain(indexer, head=120)
+        for block, proposal_id in enumerate([9, 10, 100, LARGE_ID, 2], start=100):
+            propose(chain, block, proposal_id)
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+        idx.sync()
+
+        page, after = idx.index.proposals(2)
+        assert [proposal["proposalId"] for proposal in page] == [str(LARGE_ID), "100"]
+        page, after = idx.index.proposals(2, after)
+        assert [proposal["proposalId"] for proposal in page] == ["10", "9"]
+        page, after = idx.index.proposals(2, after)
+        assert [proposal["proposalId"] for proposal in page] == ["2"]
+        assert after is None
+
+    def test_groups_votes_by_proposal(self, indexer, monkeypatch, tmp_path):
+        """Test votes are grouped by proposal, with proposals without votes left empty."""
+        monkeypatch.setattr(indexer, "CONFIRMATIONS", 0)
+        chain = FakeChain(indexer, head=120)
+        voters = ["0x00000000000000000000000000000000000000a1", "0x00000000000000000000000000000000000000b2"]
+        propose(chain, 100, 1)
+        propose(chain, 101, LARGE_ID)
+        vote(chain, 102, 1, voters[0], 1)
+        vote(chain, 103, 1, voters[1], 2)
+        vote(chain, 104, LARGE_ID, voters[0], 3)
+        vote(chain, 105, 1, voters[0], 4)
+        idx = make_indexer(indexer, chain, tmp_path / "index.db")
+        idx.sync()
+
+        votes = idx.index.votes_by_proposal(["1", str(LARGE_ID), "3"])
+        assert votes["1"] == [
+            {"voter": Web3.to_checksum_address(voters[1]), "weight": "2"},
+            {"voter": Web3.to_checksum_address(voters[0]), "weight": "4"},
+        ]
+        assert votes[str(LARGE_ID)] == [{"voter": Web3.to_checksum_address(voters[0]), "weight": "3"}]
+        assert votes["3"] == []
+
+    def test_rebuilds_outdated_index(self, indexer, tmp_path):
+        """Test an index of an older schema is dropped, so it is synced again from the start block."""
+        index = indexer.Index(str(tmp_path / "index.db"))
+        index.apply(ADDRESS, 200, [])
+        index._db.execute("PRAGMA user_version = 0")  # noqa: SLF001
+        index.close()
+        assert indexer.Index(str(tmp_path / "index.db")).checkpoint(ADDRESS) is None
+
+    def test_rejects_malformed_cursor(self, indexer, tmp_path):
+        """Test a cursor that is not a proposal id is rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            indexer.Index(str(tmp_path / "index.db")).proposals(10, "not-an-id")
@@ -18,15 +18,19 @@
 
 """Telegram Wrapper connection and channel."""
 
+import hmac
 import signal
 import asyncio
 import logging
+import secrets
 import platform
 from abc import abstractmethod
+from http import HTTPStatus
 from typing import Any, cast
 from asyncio.events import AbstractEventLoop
 from collections.abc import Callable
 
+from aiohttp import web
 from telegram import Bot, Update
 from aea.common import Address
 from telegram.ext import (
@@ -56,10 +60,23 @@ from packages.eightballer.protocols.chatroom.dialogues import (
     BaseChatroomDialogues as BaseTelegramDialogues,
 )
 from packages.eightballer.protocols.chatroom.custom_types import ErrorCode
+from packages.eightballer.connections.telegram_wrapper.send_queue import (
+    DEFAULT_GLOBAL_RATE,
+    DEFAULT_PER_CHAT_RATE,
+    DEFAULT_COALESCE_WINDOW,
+    SendQueue,
+)
 
 
 CONNECTION_ID = PublicId.from_str("eightballer/telegram_wrapper:0.1.0")
 
+POLLING_MODE = "polling"
+WEBHOOK_MODE = "webhook"
+DEFAULT_WEBHOOK_LISTEN = "0.0.0.0"  # noqa: S104
+DEFAULT_WEBHOOK_PORT = 8443
+DEFAULT_WEBHOOK_PATH = "telegram"
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"  # noqa: S105
+
 
 _default_logger = logging.getLogger("aea.packages.eightballer.connections.telegram_wrapper")
 
@@ -103,6 +120,15 @@ class Application(BaseApplication):
         self.updater_future = self.loop.create_task(updater_coroutine)
         self.start_future = self.loop.create_task(self.start())
 
+    async def close(self) -> None:
+        """Stop polling and shut the application down from within the running loop."""
+
+        if self.updater is not None and self.updater.running:
+            await self.updater.stop()
+        if self.running:
+            await self.stop()
+        await self.shutdown()
+
     def disconnect(self) -> None:
         """Disconnect the wrapper."""
 
@@ -303,10 +329,8 @@ class BaseAsyncChannel:
     async def send(self, envelope: Envelope) -> None:
         """Send an envelope with a protocol message.
 
-        It sends the envelope, waits for and receives the result.
-        The result is translated into a response envelope.
-        Finally, the response envelope is sent to the in-queue.
-
+        The handler is scheduled as a tracked task, so that messages can queue up
+        for rate limited, coalesced delivery; its response is put on the in-queue.
         """
 
         if not (self._loop and self._connection):
@@ -331,7 +355,19 @@ class BaseAsyncChannel:
             self.logger.warning(f"Could not create dialogue for message={message}")
             return
 
-        response_message = await handler(message, dialogue)
+        task = self._loop.create_task(self._process(envelope, handler, dialogue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(
+        self,
+        envelope: Envelope,
+        handler: Callable[[Message, Dialogue], Message],
+        dialogue: Dialogue,
+    ) -> None:
+        """Run the handler and queue the response."""
+
+        response_message = await handler(envelope.message, dialogue)
         self.logger.info(f"returning message: {response_message}")
 
         response_envelope = Envelope(
@@ -344,14 +380,15 @@ class BaseAsyncChannel:
         await self._in_queue.put(response_envelope)
 
     async def get_message(self) -> Envelope | None:
-        """Check the in-queue for envelopes."""
+        """Wait for the next envelope on the in-queue.
+
+        Awaiting the queue, rather than polling it, hands responses to the multiplexer as soon
+        as they are ready; the wait ends early if the receiving task is cancelled.
+        """
 
         if self.is_stopped:
             return None
-        try:
-            return self._in_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
+        return await self._in_queue.get()
 
     async def _cancel_tasks(self) -> None:
         """Cancel all requests tasks pending."""
@@ -368,6 +405,7 @@ class BaseAsyncChannel:
                 raise
             except BaseException:  # noqa
                 pass  # nosec
+        self._tasks.clear()
 
 
 class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-instance-attributes
@@ -383,6 +421,17 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
 
         super().__init__(agent_address, connection_id, message_type=TelegramMessage)
 
+        self.mode = POLLING_MODE
+        self.webhook_url: str | None = None
+        self.webhook_listen = DEFAULT_WEBHOOK_LISTEN
+        self.webhook_port = DEFAULT_WEBHOOK_PORT
+        self.webhook_path = DEFAULT_WEBHOOK_PATH
+        self.webhook_secret: str | None = None
+        self._webhook_runner: web.AppRunner | None = None
+        self.per_chat_rate = DEFAULT_PER_CHAT_RATE
+        self.global_rate = DEFAULT_GLOBAL_RATE
+        self.coalesce_window = DEFAULT_COALESCE_WINDOW
+        self._send_queue: SendQueue | None = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -405,39 +454,21 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
                 bot = Bot(token=self.token)
                 self._connection = app
                 self._bot = bot
+                self._send_queue = SendQueue(
+                    self._send_text,
+                    per_chat_rate=float(self.per_chat_rate),
+                    global_rate=float(self.global_rate),
+                    coalesce_window=float(self.coalesce_window),
+                    logger=self.logger,
+                )
 
                 await self._connection.connect(loop)
 
-                async def _handle(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-                    """Echo the user message."""
-                    del context
-                    response_envelope = None
-                    self.logger.info(f"Received message: {update}")
-                    if not update.message:
-                        if update.channel_post:
-                            self.logger.info("Channel post message")
-                            response_envelope = self._from_channel_to_aea(update)
-                    elif "new_chat_participant" in update.message.api_kwargs:
-                        # NOTE: this is also a ChatType.GROUP
-                        username = update.message.api_kwargs.get("username")
-                        is_bot = update.message.api_kwargs.get("is_bot")
-                        self.logger.info(f"New chat participant: {username} (is bot? {is_bot})")
-                        return
-                    elif update.message.chat.type == ChatType.GROUP:
-                        self.logger.info("Group chat message")
-                        response_envelope = self._from_group_to_aea(update)
-                    elif update.message.chat.type == ChatType.PRIVATE:
-                        self.logger.info("Private chat message")
-                        response_envelope = self._from_tg_to_aea(update)
-                    else:
-                        self.logger.info("Unknown chat type")
-                    if response_envelope:
-                        await self._in_queue.put(response_envelope)
-
-                    # to allow the thing to work in reverse await update.message.reply_text(update.message.text)
-
-                app.add_handler(MessageHandler(filters.ALL, _handle))
-                app.run_polling(allowed_updates=Update.ALL_TYPES)
+                if self.mode == WEBHOOK_MODE:
+                    await self._start_webhook()
+                else:
+                    app.add_handler(MessageHandler(filters.ALL, self._handle))
+                    app.run_polling(allowed_updates=Update.ALL_TYPES)
                 self.logger.info("Telegram Wrapper has connected.")
             except Exception as e:
                 self.is_stopped = True
@@ -445,6 +476,80 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
                 msg = f"Failed to start Telegram Wrapper: {e}"
                 raise ConnectionError(msg) from e
 
+    async def _handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE | None) -> None:
+        """Put a received update on the in-queue."""
+        del context
+        response_envelope = None
+        self.logger.info(f"Received message: {update}")
+        if not update.message:
+            if update.channel_post:
+                self.logger.info("Channel post message")
+                response_envelope = self._from_channel_to_aea(update)
+        elif "new_chat_participant" in update.message.api_kwargs:
+            # NOTE: this is also a ChatType.GROUP
+            username = update.message.api_kwargs.get("username")
+            is_bot = update.message.api_kwargs.get("is_bot")
+            self.logger.info(f"New chat participant: {username} (is bot? {is_bot})")
+            return
+        elif update.message.chat.type == ChatType.GROUP:
+            self.logger.info("Group chat message")
+            response_envelope = self._from_group_to_aea(update)
+        elif update.message.chat.type == ChatType.PRIVATE:
+            self.logger.info("Private chat message")
+            response_envelope = self._from_tg_to_aea(update)
+        else:
+            self.logger.info("Unknown chat type")
+        if response_envelope:
+            await self._in_queue.put(response_envelope)
+
+        # to allow the thing to work in reverse await update.message.reply_text(update.message.text)
+
+    async def _start_webhook(self) -> None:
+        """Serve the webhook locally and register it with Telegram."""
+
+        if not self.webhook_url:
+            msg = "webhook_url is required in webhook mode"
+            raise ValueError(msg)
+        self.webhook_secret = self.webhook_secret or secrets.token_urlsafe(32)
+
+        app = web.Application()
+        app.router.add_post(f"/{self.webhook_path.strip('/')}", self._handle_webhook)
+        self._webhook_runner = web.AppRunner(app)
+        await self._webhook_runner.setup()
+        await web.TCPSite(self._webhook_runner, self.webhook_listen, int(self.webhook_port)).start()
+        await self._bot.set_webhook(
+            url=self.webhook_url,
+            secret_token=self.webhook_secret,
+            allowed_updates=Update.ALL_TYPES,
+        )
+        self.logger.info(f"Listening for updates on {self.webhook_listen}:{self.webhook_port}")
+
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        """Verify the secret token of a webhook request and hand its update to the handler."""
+
+        token = request.headers.get(SECRET_TOKEN_HEADER, "")
+        if not hmac.compare_digest(token, self.webhook_secret):
+            self.logger.warning(f"Rejected webhook request from {request.remote} with a wrong secret token")
+            return web.Response(status=HTTPStatus.FORBIDDEN)
+        try:
+            update = Update.de_json(await request.json(), self._connection.bot)
+        except ValueError as e:
+            self.logger.warning(f"Invalid webhook update: {e}")
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        await self._handle(update, None)
+        return web.Response(status=HTTPStatus.OK)
+
+    async def _stop_webhook(self) -> None:
+        """Unregister the webhook with Telegram and stop serving it."""
+
+        try:
+            await self._bot.delete_webhook()
+        except TelegramError as e:
+            self.logger.warning(f"Failed to delete the webhook: {e}")
+        if self._webhook_runner is not None:
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
+
     def _from_tg_to_aea(self, update: Update) -> TelegramMessage:
         """Convert a telegram update to a TelegramMessage object."""
 
@@ -506,8 +611,15 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
             return
 
         await self._cancel_tasks()
-        msg = "TelegramWrapperAsyncChannel.disconnect"
-        raise NotImplementedError(msg)
+        if self.mode == WEBHOOK_MODE:
+            await self._stop_webhook()
+        if self._send_queue is not None:
+            self.logger.info(f"Send queue stats: {self._send_queue.stats}")
+            await self._send_queue.close()
+            self._send_queue = None
+        await self._connection.close()
+        self._connection = None
+        self._in_queue = None
         self.is_stopped = True
         self.logger.info("Telegram Wrapper has shutdown.")
 
@@ -518,15 +630,16 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
         """Map performative to handlers."""
         return {
             TelegramMessage.Performative.MESSAGE: self.send_message,
+            TelegramMessage.Performative.BROADCAST: self.broadcast,
         }
 
     async def send_message(self, message: TelegramMessage, dialogue: TelegramDialogue) -> TelegramMessage:
         """Handle TelegramMessage with SEND_MESSAGE Perfomative."""
         try:
-            response = await self._bot.send_message(chat_id=message.chat_id, text=message.text)
+            message_id = await self._send_queue.send(message.chat_id, message.text)
             return dialogue.reply(
                 performative=TelegramMessage.Performative.MESSAGE_SENT,
-                id=response.message_id,
+                id=message_id,
             )
         except Exception as e:
             self.logger.exception(f"Error sending message: {e}")
@@ -537,6 +650,30 @@ class TelegramWrapperAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many
                 error_data={},
             )
 
+    async def broadcast(self, message: TelegramMessage, dialogue: TelegramDialogue) -> TelegramMessage:
+        """Handle TelegramMessage with BROADCAST Performative, sending to every chat concurrently."""
+        chat_ids = list(dict.fromkeys(message.chat_ids))
+        results = await asyncio.gather(
+            *(self._send_queue.send(chat_id, message.text) for chat_id in chat_ids), return_exceptions=True
+        )
+        message_ids, errors = {}, {}
+        for chat_id, result in zip(chat_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Error broadcasting to chat {chat_id}: {result}")
+                errors[chat_id] = str(result)
+            else:
+                message_ids[chat_id] = result
+        return dialogue.reply(
+            performative=TelegramMessage.Performative.BROADCAST_RESULT,
+            message_ids=message_ids,
+            errors=errors,
+        )
+
+    async def _send_text(self, chat_id: str, text: str) -> int:
+        """Send text to a chat, returning the message id."""
+        response = await self._bot.send_message(chat_id=chat_id, text=text)
+        return response.message_id
+
     def receive_message(self, message: TelegramMessage, dialogue: TelegramDialogue) -> TelegramMessage:
         """Handle TelegramMessage with RECEIVE_MESSAGE Perfomative."""
         del message
@@ -567,8 +704,23 @@ class TelegramWrapperConnection(Connection):
         """Initialize a Telegram Wrapper connection."""
 
         keys = ["target_skill_id", "token"]
+        optional_keys = [
+            "mode",
+            "webhook_url",
+            "webhook_listen",
+            "webhook_port",
+            "webhook_path",
+            "webhook_secret",
+            "per_chat_rate",
+            "global_rate",
+            "coalesce_window",
+        ]
         config = kwargs["configuration"].config
         custom_kwargs = {key: config.pop(key) for key in keys}
+        custom_kwargs.update({key: config.pop(key) for key in optional_keys if config.get(key) is not None})
+        if custom_kwargs.get("mode", POLLING_MODE) not in {POLLING_MODE, WEBHOOK_MODE}:
+            msg = f"Unknown mode {custom_kwargs['mode']}, expected one of {POLLING_MODE}, {WEBHOOK_MODE}"
+            raise ValueError(msg)
         super().__init__(**kwargs)
 
         self.channel = TelegramWrapperAsyncChannel(
@@ -0,0 +1,212 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Rate limited, coalescing queue of outbound Telegram messages."""
+
+import time
+import asyncio
+import logging
+from datetime import timedelta
+from collections import Counter
+from dataclasses import dataclass
+from collections.abc import Callable, Awaitable
+
+from telegram.error import RetryAfter
+
+
+MAX_MESSAGE_LENGTH = 4096
+MESSAGE_SEPARATOR = "\n\n"
+DEFAULT_PER_CHAT_RATE = 1.0
+DEFAULT_GLOBAL_RATE = 30.0
+DEFAULT_COALESCE_WINDOW = 0.5
+# preferred places to split long text, widest first
+SPLIT_BOUNDARIES = ("\n\n", "\n", ". ", "! ", "? ", " ")
+
+_default_logger = logging.getLogger("aea.packages.eightballer.connections.telegram_wrapper")
+
+
+def split_text(text: str, limit: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """Split text into chunks of at most limit characters on paragraph, line, sentence or word boundaries."""
+    chunks = []
+    while len(text) > limit:
+        window = text[:limit]
+        cut = limit
+        for boundary in SPLIT_BOUNDARIES:
+            # only split on a boundary in the second half, to avoid runs of tiny chunks
+            if (index := window.rfind(boundary)) > limit // 2:
+                cut = index + len(boundary)
+                break
+        if chunk := text[:cut].rstrip():
+            chunks.append(chunk)
+        text = text[cut:].lstrip()
+    if text := text.rstrip():
+        chunks.append(text)
+    return chunks
+
+
+class TokenBucket:
+    """Token bucket allowing rate sends per second, with bursts of up to capacity."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize the bucket."""
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def delay(self) -> float:
+        """Take a token, returning how long to wait before it may be used."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+        wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for seconds, as asked by a flood limit."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@dataclass
+class _Pending:
+    """A message waiting to be sent."""
+
+    text: str
+    future: asyncio.Future
+
+
+class SendQueue:
+    """Per-chat queues of outbound messages, sent by one worker per chat.
+
+    Text longer than Telegram's message length limit is split into chunks that are
+    queued together, so they are sent in order. Sends are limited by a per-chat and a global token bucket, and pause for the
+    retry_after of a flood limit error. Messages queued for a chat within the
+    coalesce window are merged into one, up to Telegram's message length limit.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str], Awaitable[int]],
+        per_chat_rate: float = DEFAULT_PER_CHAT_RATE,
+        global_rate: float = DEFAULT_GLOBAL_RATE,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        logger: logging.Logger = _default_logger,
+    ):
+        """Initialize the queue with a coroutine sending text to a chat and returning the message id."""
+        self._send = send
+        self.per_chat_rate = per_chat_rate
+        self.coalesce_window = coalesce_window
+        self.logger = logger
+        self._global_bucket = TokenBucket(global_rate)
+        self._chat_buckets: dict[str, TokenBucket] = {}
+        self._queues: dict[str, asyncio.Queue[_Pending]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self.metrics: Counter[str] = Counter()
+
+    async def send(self, chat_id: str, text: str) -> int:
+        """Queue text for chat_id and wait until it is sent, returning the id of its first message."""
+        loop = asyncio.get_running_loop()
+        if chat_id not in self._queues:
+            self._queues[chat_id] = asyncio.Queue()
+            self._chat_buckets[chat_id] = TokenBucket(self.per_chat_rate)
+        futures = []
+        for chunk in split_text(text) or [text]:
+            futures.append(loop.create_future())
+            self._queues[chat_id].put_nowait(_Pending(chunk, futures[-1]))
+        self.metrics["queued"] += len(futures)
+        self.metrics["split"] += len(futures) - 1
+        if chat_id not in self._workers or self._workers[chat_id].done():
+            self._workers[chat_id] = asyncio.create_task(self._work(chat_id))
+        message_ids = await asyncio.gather(*futures)
+        return message_ids[0]
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Queue depth and send, splitting, coalescing and throttling counters."""
+        return {"depth": sum(queue.qsize() for queue in self._queues.values()), **self.metrics}
+
+    async def close(self) -> None:
+        """Stop the workers, failing the messages still queued."""
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._workers.clear()
+        for queue in self._queues.values():
+            while not queue.empty():
+                pending = queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.set_exception(ConnectionError("Send queue closed"))
+
+    async def _work(self, chat_id: str) -> None:
+        """Send the messages queued for chat_id until the queue is empty."""
+        queue = self._queues[chat_id]
+        carry = None
+        while carry is not None or not queue.empty():
+            batch, carry = await self._coalesce(carry or queue.get_nowait(), queue)
+            text = MESSAGE_SEPARATOR.join(pending.text for pending in batch)
+            try:
+                message_id = await self._send_limited(chat_id, text)
+            except Exception as e:  # noqa: BLE001
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+            self.metrics["sent"] += 1
+            self.metrics["coalesced"] += len(batch) - 1
+            # the futures of callers cancelled while their message was queued are already done
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_result(message_id)
+
+    async def _coalesce(self, first: _Pending, queue: asyncio.Queue) -> tuple[list[_Pending], _Pending | None]:
+        """Merge the messages queued behind first within the window, returning any that did not fit."""
+        batch = [first]
+        length = len(first.text)
+        deadline = time.monotonic() + self.coalesce_window
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                pending = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if length + len(MESSAGE_SEPARATOR) + len(pending.text) > MAX_MESSAGE_LENGTH:
+                return batch, pending
+            batch.append(pending)
+            length += len(MESSAGE_SEPARATOR) + len(pending.text)
+        return batch, None
+
+    async def _send_limited(self, chat_id: str, text: str) -> int:
+        """Send within the rate limits, waiting out flood limit errors."""
+        chat_bucket = self._chat_buckets[chat_id]
+        while True:
+            delay = max(self._global_bucket.delay(), chat_bucket.delay())
+            if delay > 0:
+                self.metrics["throttled"] += 1
+                self.metrics["throttled_seconds"] += delay
+                await asyncio.sleep(delay)
+            try:
+                return await self._send(chat_id, text)
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                self.metrics["flood_limited"] += 1
+                self.logger.warning(f"Flood limit hit for chat {chat_id}, retrying after {retry_after}s")
+                self._global_bucket.pause(retry_after)
+                chat_bucket.pause(retry_after)
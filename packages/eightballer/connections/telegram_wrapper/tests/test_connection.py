@@ -21,9 +21,12 @@
 # pylint: skip-file
 
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import aiohttp
+from telegram import Bot
+from telegram.ext import Updater
 from aea.common import Address
 from aea.mail.base import Message, Envelope
 from aea.identity.base import Identity
@@ -37,8 +40,13 @@ from packages.eightballer.protocols.chatroom.dialogues import (
 )
 from packages.eightballer.connections.telegram_wrapper.connection import (
     CONNECTION_ID as CONNECTION_PUBLIC_ID,
+    WEBHOOK_MODE,
+    POLLING_MODE,
+    SECRET_TOKEN_HEADER,
+    Application,
     TelegramWrapperConnection,
 )
+from packages.eightballer.connections.telegram_wrapper.send_queue import SendQueue
 
 
 def envelope_it(message: TelegramMessage):
@@ -120,6 +128,34 @@ class TestTelegramWrapperConnection:
         await self.telegram_wrapper_connection.disconnect()
         assert self.telegram_wrapper_connection.channel.is_stopped
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", [POLLING_MODE, WEBHOOK_MODE])
+    async def test_connect_and_disconnect(self, mode):
+        """Test the channel connects and releases its resources on disconnect in both modes."""
+        channel = self.telegram_wrapper_connection.channel
+        channel.mode = mode
+        channel.webhook_url = "https://example.com/telegram"
+        channel.webhook_listen = "127.0.0.1"
+        channel.webhook_port = 0
+        with (
+            patch.object(Application, "initialize", AsyncMock()),
+            patch.object(Application, "start", AsyncMock()),
+            patch.object(Application, "shutdown", AsyncMock()) as shutdown,
+            patch.object(Updater, "start_polling", AsyncMock()),
+            patch.object(Bot, "set_webhook", AsyncMock()) as set_webhook,
+            patch.object(Bot, "delete_webhook", AsyncMock()) as delete_webhook,
+        ):
+            await self.telegram_wrapper_connection.connect()
+            assert not channel.is_stopped
+            assert (channel._webhook_runner is not None) == (mode == WEBHOOK_MODE)  # noqa: SLF001
+
+            await self.telegram_wrapper_connection.disconnect()
+            assert channel.is_stopped
+            assert channel._webhook_runner is None  # noqa: SLF001
+            assert channel._send_queue is None  # noqa: SLF001
+            shutdown.assert_awaited_once()
+            assert set_webhook.await_count == delete_webhook.await_count == (mode == WEBHOOK_MODE)
+
     @pytest.mark.asyncio
     async def test_handles_inbound_query(self):
         """Test the connect."""
@@ -135,3 +171,68 @@ class TestTelegramWrapperConnection:
 
         with pytest.raises(ConnectionError):
             await self.telegram_wrapper_connection.send(envelope_it(msg))
+
+    @pytest.mark.asyncio
+    async def test_webhook_verifies_secret_and_queues_updates(self):
+        """Test the webhook server rejects a wrong secret token and queues valid updates."""
+        channel = self.telegram_wrapper_connection.channel
+        channel.webhook_url = "https://example.com/telegram"
+        channel.webhook_listen = "127.0.0.1"
+        channel.webhook_port = 0
+        channel.webhook_secret = "secret"
+        channel._bot = AsyncMock()  # noqa: SLF001
+        channel._connection = MagicMock(bot=None)  # noqa: SLF001
+        channel._in_queue = asyncio.Queue()  # noqa: SLF001
+
+        await channel._start_webhook()  # noqa: SLF001
+        channel._bot.set_webhook.assert_awaited_once()  # noqa: SLF001
+        port = channel._webhook_runner.addresses[0][1]  # noqa: SLF001
+        url = f"http://127.0.0.1:{port}/telegram"
+        update = {
+            "update_id": 1,
+            "message": {
+                "message_id": 2,
+                "date": 0,
+                "chat": {"id": 3, "type": "private"},
+                "from": {"id": 4, "is_bot": False, "first_name": "Warren"},
+                "text": "Hello World",
+            },
+        }
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, json=update, headers={SECRET_TOKEN_HEADER: "wrong"}) as response:
+                    assert response.status == 403
+                assert channel._in_queue.empty()  # noqa: SLF001
+                async with session.post(url, json=update, headers={SECRET_TOKEN_HEADER: "secret"}) as response:
+                    assert response.status == 200
+        finally:
+            await channel._stop_webhook()  # noqa: SLF001
+
+        envelope = channel._in_queue.get_nowait()  # noqa: SLF001
+        assert envelope.message.text == "Hello World"
+        assert envelope.message.chat_id == "3"
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reports_per_chat_results(self):
+        """Test a broadcast is sent to every chat and failures are reported per chat."""
+        channel = self.telegram_wrapper_connection.channel
+
+        async def send(chat_id, text):
+            if chat_id == "2":
+                msg = "Forbidden: bot was blocked by the user"
+                raise ValueError(msg)
+            return int(chat_id) * 10
+
+        channel._send_queue = SendQueue(send, coalesce_window=0)  # noqa: SLF001
+        msg, _dialogue = self._dialogues.create(
+            counterparty=str(CONNECTION_PUBLIC_ID),
+            performative=TelegramMessage.Performative.BROADCAST,
+            chat_ids=("1", "2", "3", "1"),
+            text="Hello World",
+        )
+        dialogue = channel._dialogues.update(msg)  # noqa: SLF001
+
+        response = await channel.broadcast(msg, dialogue)
+        assert response.performative == TelegramMessage.Performative.BROADCAST_RESULT
+        assert response.message_ids == {"1": 10, "3": 30}
+        assert response.errors == {"2": "Forbidden: bot was blocked by the user"}
@@ -0,0 +1,122 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests of the send queue of the Telegram Wrapper connection."""
+# pylint: skip-file
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from telegram.error import RetryAfter
+
+from packages.eightballer.connections.telegram_wrapper.send_queue import (
+    MAX_MESSAGE_LENGTH,
+    MESSAGE_SEPARATOR,
+    SendQueue,
+    split_text,
+)
+
+
+def test_split_text_on_boundaries():
+    """Test long text is split on the widest boundary in reach, and words are never cut."""
+    paragraph = "word " * 30
+    text = MESSAGE_SEPARATOR.join([paragraph.strip()] * 3)
+    chunks = split_text(text, limit=200)
+    assert chunks == [paragraph.strip()] * 3
+    assert split_text("a. " * 100, limit=100) == ["a. " * 32 + "a."] * 3 + ["a."]
+    assert split_text("x" * 250, limit=100) == ["x" * 100, "x" * 100, "x" * 50]
+    assert split_text("short") == ["short"]
+
+
+@pytest.mark.asyncio
+async def test_sends_long_text_in_order():
+    """Test text over the length limit is sent as ordered chunks that are not merged back together."""
+    send = AsyncMock(side_effect=[1, 2])
+    queue = SendQueue(send, per_chat_rate=100, coalesce_window=0.05)
+    text = ("y" * 99 + " ") * 60
+    assert await queue.send("1", text) == 1
+    sent = [call.args[1] for call in send.await_args_list]
+    assert len(sent) == 2
+    assert all(len(chunk) <= MAX_MESSAGE_LENGTH for chunk in sent)
+    assert " ".join(sent) == text.strip()
+    assert queue.stats["split"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesces_messages_to_a_chat():
+    """Test messages queued within the window are sent as one."""
+    send = AsyncMock(return_value=1)
+    queue = SendQueue(send, coalesce_window=0.05)
+    ids = await asyncio.gather(queue.send("1", "a"), queue.send("1", "b"), queue.send("2", "c"))
+    assert ids == [1, 1, 1]
+    assert send.await_count == 2
+    send.assert_any_await("1", f"a{MESSAGE_SEPARATOR}b")
+    send.assert_any_await("2", "c")
+    assert queue.stats == {"depth": 0, "queued": 3, "split": 0, "sent": 2, "coalesced": 1}
+
+
+@pytest.mark.asyncio
+async def test_does_not_coalesce_past_length_limit():
+    """Test a message that would exceed the length limit is sent separately."""
+    send = AsyncMock(side_effect=[1, 2])
+    queue = SendQueue(send, per_chat_rate=100, coalesce_window=0.05)
+    text = "x" * (MAX_MESSAGE_LENGTH - 1)
+    assert await asyncio.gather(queue.send("1", text), queue.send("1", "y")) == [1, 2]
+    assert [call.args[1] for call in send.await_args_list] == [text, "y"]
+
+
+@pytest.mark.asyncio
+async def test_retries_after_flood_limit():
+    """Test a flood limit error pauses sending and the message is retried."""
+    send = AsyncMock(side_effect=[RetryAfter(0), 3])
+    queue = SendQueue(send, coalesce_window=0)
+    assert await queue.send("1", "a") == 3
+    assert send.await_count == 2
+    assert queue.stats["flood_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_send_errors_are_raised_to_the_caller():
+    """Test errors other than flood limits fail the queued messages."""
+    send = AsyncMock(side_effect=ValueError("boom"))
+    queue = SendQueue(send, coalesce_window=0)
+    with pytest.raises(ValueError, match="boom"):
+        await queue.send("1", "a")
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_do_not_stop_the_worker():
+    """Test a caller cancelled while its message is being sent leaves the chat's worker running."""
+    release = asyncio.Event()
+
+    async def send(_chat_id: str, _text: str) -> int:
+        await release.wait()
+        return 1
+
+    queue = SendQueue(send, per_chat_rate=100, coalesce_window=0)
+    cancelled = asyncio.create_task(queue.send("1", "a"))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(queue.send("1", "b"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    assert await asyncio.wait_for(waiting, timeout=1) == 1
+    assert cancelled.cancelled()
@@ -31,6 +31,7 @@ class ChatroomDialogue(Dialogue):
             ChatroomMessage.Performative.SUBSCRIBE,
             ChatroomMessage.Performative.UNSUBSCRIBE,
             ChatroomMessage.Performative.GET_CHANNELS,
+            ChatroomMessage.Performative.BROADCAST,
         }
     )
     TERMINAL_PERFORMATIVES: frozenset[Message.Performative] = frozenset(
@@ -40,9 +41,14 @@ class ChatroomDialogue(Dialogue):
             ChatroomMessage.Performative.MESSAGE_SENT,
             ChatroomMessage.Performative.ERROR,
             ChatroomMessage.Performative.CHANNELS,
+            ChatroomMessage.Performative.BROADCAST_RESULT,
         }
     )
     VALID_REPLIES: dict[Message.Performative, frozenset[Message.Performative]] = {
+        ChatroomMessage.Performative.BROADCAST: frozenset(
+            {ChatroomMessage.Performative.BROADCAST_RESULT, ChatroomMessage.Performative.ERROR}
+        ),
+        ChatroomMessage.Performative.BROADCAST_RESULT: frozenset(),
         ChatroomMessage.Performative.CHANNELS: frozenset(),
         ChatroomMessage.Performative.ERROR: frozenset(),
         ChatroomMessage.Performative.GET_CHANNELS: frozenset(
@@ -75,6 +81,7 @@ class ChatroomDialogue(Dialogue):
         MESSAGE_SENT = 2
         ERROR = 3
         CHANNELS = 4
+        BROADCAST_RESULT = 5
 
     def __init__(
         self,
@@ -110,6 +117,7 @@ class BaseChatroomDialogues(Dialogues, ABC):
             ChatroomDialogue.EndState.MESSAGE_SENT,
             ChatroomDialogue.EndState.ERROR,
             ChatroomDialogue.EndState.CHANNELS,
+            ChatroomDialogue.EndState.BROADCAST_RESULT,
         }
     )
     _keep_terminal_state_dialogues = False
@@ -50,6 +50,8 @@ class ChatroomMessage(Message):
     class Performative(Message.Performative):
         """Performatives for the chatroom protocol."""
 
+        BROADCAST = "broadcast"
+        BROADCAST_RESULT = "broadcast_result"
         CHANNELS = "channels"
         ERROR = "error"
         GET_CHANNELS = "get_channels"
@@ -65,6 +67,8 @@ class ChatroomMessage(Message):
             return str(self.value)
 
     _performatives = {
+        "broadcast",
+        "broadcast_result",
         "channels",
         "error",
         "get_channels",
@@ -82,13 +86,16 @@ class ChatroomMessage(Message):
             "agent_id",
             "channels",
             "chat_id",
+            "chat_ids",
             "dialogue_reference",
             "error_code",
             "error_data",
             "error_msg",
+            "errors",
             "from_user",
             "id",
             "message_id",
+            "message_ids",
             "parse_mode",
             "performative",
             "reply_markup",
@@ -170,6 +177,12 @@ class ChatroomMessage(Message):
         enforce(self.is_set("chat_id"), "'chat_id' content is not set.")
         return cast(str, self.get("chat_id"))
 
+    @property
+    def chat_ids(self) -> Tuple[str, ...]:
+        """Get the 'chat_ids' content from the message."""
+        enforce(self.is_set("chat_ids"), "'chat_ids' content is not set.")
+        return cast(Tuple[str, ...], self.get("chat_ids"))
+
     @property
     def error_code(self) -> CustomErrorCode:
         """Get the 'error_code' content from the message."""
@@ -188,6 +201,12 @@ class ChatroomMessage(Message):
         enforce(self.is_set("error_msg"), "'error_msg' content is not set.")
         return cast(str, self.get("error_msg"))
 
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Get the 'errors' content from the message."""
+        enforce(self.is_set("errors"), "'errors' content is not set.")
+        return cast(Dict[str, str], self.get("errors"))
+
     @property
     def from_user(self) -> Optional[str]:
         """Get the 'from_user' content from the message."""
@@ -198,6 +217,12 @@ class ChatroomMessage(Message):
         """Get the 'id' content from the message."""
         return cast(Optional[int], self.get("id"))
 
+    @property
+    def message_ids(self) -> Dict[str, int]:
+        """Get the 'message_ids' content from the message."""
+        enforce(self.is_set("message_ids"), "'message_ids' content is not set.")
+        return cast(Dict[str, int], self.get("message_ids"))
+
     @property
     def parse_mode(self) -> Optional[str]:
         """Get the 'parse_mode' content from the message."""
@@ -440,6 +465,67 @@ class ChatroomMessage(Message):
                     all(isinstance(element, str) for element in self.channels),
                     "Invalid type for tuple elements in content 'channels'. Expected 'str'.",
                 )
+            elif self.performative == ChatroomMessage.Performative.BROADCAST:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.chat_ids, tuple),
+                    "Invalid type for content 'chat_ids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.chat_ids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.chat_ids),
+                    "Invalid type for tuple elements in content 'chat_ids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.text, str),
+                    "Invalid type for content 'text'. Expected 'str'. Found '{}'.".format(
+                        type(self.text)
+                    ),
+                )
+            elif self.performative == ChatroomMessage.Performative.BROADCAST_RESULT:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.message_ids, dict),
+                    "Invalid type for content 'message_ids'. Expected 'dict'. Found '{}'.".format(
+                        type(self.message_ids)
+                    ),
+                )
+                for (
+                    key_of_message_ids,
+                    value_of_message_ids,
+                ) in self.message_ids.items():
+                    enforce(
+                        isinstance(key_of_message_ids, str),
+                        "Invalid type for dictionary keys in content 'message_ids'. Expected 'str'. Found '{}'.".format(
+                            type(key_of_message_ids)
+                        ),
+                    )
+                    enforce(
+                        type(value_of_message_ids) is int,
+                        "Invalid type for dictionary values in content 'message_ids'. Expected 'int'. Found '{}'.".format(
+                            type(value_of_message_ids)
+                        ),
+                    )
+                enforce(
+                    isinstance(self.errors, dict),
+                    "Invalid type for content 'errors'. Expected 'dict'. Found '{}'.".format(
+                        type(self.errors)
+                    ),
+                )
+                for key_of_errors, value_of_errors in self.errors.items():
+                    enforce(
+                        isinstance(key_of_errors, str),
+                        "Invalid type for dictionary keys in content 'errors'. Expected 'str'. Found '{}'.".format(
+                            type(key_of_errors)
+                        ),
+                    )
+                    enforce(
+                        isinstance(value_of_errors, str),
+                        "Invalid type for dictionary values in content 'errors'. Expected 'str'. Found '{}'.".format(
+                            type(value_of_errors)
+                        ),
+                    )
 
             # Check correct content count
             enforce(
@@ -140,6 +140,20 @@ class ChatroomSerializer(Serializer):
             channels = msg.channels
             performative.channels.extend(channels)
             chatroom_msg.channels.CopyFrom(performative)
+        elif performative_id == ChatroomMessage.Performative.BROADCAST:
+            performative = chatroom_pb2.ChatroomMessage.Broadcast_Performative()  # type: ignore
+            chat_ids = msg.chat_ids
+            performative.chat_ids.extend(chat_ids)
+            text = msg.text
+            performative.text = text
+            chatroom_msg.broadcast.CopyFrom(performative)
+        elif performative_id == ChatroomMessage.Performative.BROADCAST_RESULT:
+            performative = chatroom_pb2.ChatroomMessage.Broadcast_Result_Performative()  # type: ignore
+            message_ids = msg.message_ids
+            performative.message_ids.update(message_ids)
+            errors = msg.errors
+            performative.errors.update(errors)
+            chatroom_msg.broadcast_result.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
@@ -227,6 +241,19 @@ class ChatroomSerializer(Serializer):
             channels = chatroom_pb.channels.channels
             channels_tuple = tuple(channels)
             performative_content["channels"] = channels_tuple
+        elif performative_id == ChatroomMessage.Performative.BROADCAST:
+            chat_ids = chatroom_pb.broadcast.chat_ids
+            chat_ids_tuple = tuple(chat_ids)
+            performative_content["chat_ids"] = chat_ids_tuple
+            text = chatroom_pb.broadcast.text
+            performative_content["text"] = text
+        elif performative_id == ChatroomMessage.Performative.BROADCAST_RESULT:
+            message_ids = chatroom_pb.broadcast_result.message_ids
+            message_ids_dict = dict(message_ids)
+            performative_content["message_ids"] = message_ids_dict
+            errors = chatroom_pb.broadcast_result.errors
+            errors_dict = dict(errors)
+            performative_content["errors"] = errors_dict
         else:
             raise ValueError("Performative not valid: {}.".format(performative_id))
 
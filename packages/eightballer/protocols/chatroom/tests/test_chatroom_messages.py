@@ -88,6 +88,16 @@ class TestMessageChatroom(BaseProtocolMessagesTestCase):
                 performative=ChatroomMessage.Performative.CHANNELS,
                 channels=("some str",),
             ),
+            ChatroomMessage(
+                performative=ChatroomMessage.Performative.BROADCAST,
+                chat_ids=("some str",),
+                text="some str",
+            ),
+            ChatroomMessage(
+                performative=ChatroomMessage.Performative.BROADCAST_RESULT,
+                message_ids={"some str": 12},
+                errors={"some str": "some str"},
+            ),
         ]
 
     def build_inconsistent(self):
@@ -0,0 +1,196 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 zarathustra
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Content addressed cache for chat completions."""
+
+import json
+import time
+import sqlite3
+import hashlib
+from typing import Any
+from pathlib import Path
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+
+# caching is opt-in, as chat completions are not deterministic
+DEFAULT_CACHE_SIZE = 0
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_MAX_DISK_ENTRIES = 10_000
+
+
+class CachedCompletion(BaseModel):
+    """The contents of a chat completion RESPONSE."""
+
+    data: str
+    model_class: str
+    model_module: str
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert pydantic models to plain data so they can be hashed."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, list | tuple):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
+def fingerprint(model: str, messages: Any, kwargs: Any) -> str:
+    """Get the content address of a chat completion request."""
+    payload = json.dumps(
+        {"model": str(model), "messages": _jsonable(messages), "kwargs": _jsonable(kwargs)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """SQLite backed cache layer with TTL and size based eviction."""
+
+    def __init__(self, path: Path, ttl: float | None, max_entries: int = DEFAULT_MAX_DISK_ENTRIES):
+        """Initialize the disk cache."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, data TEXT, model_class TEXT, model_module TEXT, "
+            "created_at REAL, accessed_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS completions_accessed_at ON completions (accessed_at)")
+        self._db.commit()
+        self.evict()
+
+    def get(self, key: str) -> CachedCompletion | None:
+        """Get an entry, dropping it if it has expired."""
+        row = self._db.execute(
+            "SELECT data, model_class, model_module, created_at FROM completions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        data, model_class, model_module, created_at = row
+        now = time.time()
+        if self.ttl is not None and now - created_at > self.ttl:
+            self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+        self._db.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        return CachedCompletion(data=data, model_class=model_class, model_module=model_module)
+
+    def put(self, key: str, value: CachedCompletion) -> None:
+        """Store an entry and evict if the cache has grown too large."""
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?, ?)",
+            (key, value.data, value.model_class, value.model_module, now, now),
+        )
+        self._db.commit()
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries, then the least recently used ones above the size limit."""
+        if self.ttl is not None:
+            self._db.execute("DELETE FROM completions WHERE created_at < ?", (time.time() - self.ttl,))
+        self._db.execute(
+            "DELETE FROM completions WHERE key IN ("
+            "SELECT key FROM completions ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+class CompletionCache:
+    """In-memory LRU cache of chat completions, optionally backed by a disk layer."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float | None = DEFAULT_CACHE_TTL,
+        path: Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, CachedCompletion]] = OrderedDict()
+        self._disk = DiskCache(path, ttl, max_disk_entries) if path else None
+
+    def get(self, key: str) -> CachedCompletion | None:
+        """Look up a completion, promoting disk hits into memory."""
+        value = self._get_memory(key)
+        if value is None and self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._put_memory(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: CachedCompletion) -> None:
+        """Store a completion in every layer."""
+        self._put_memory(key, value)
+        if self._disk is not None:
+            self._disk.put(key, value)
+
+    def _get_memory(self, key: str) -> CachedCompletion | None:
+        """Look up a completion in memory."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put_memory(self, key: str, value: CachedCompletion) -> None:
+        """Store a completion in memory, evicting the least recently used."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def close(self) -> None:
+        """Close the disk layer."""
+        if self._disk is not None:
+            self._disk.close()
@@ -33,12 +33,22 @@ from collections.abc import Callable
 
 import openai
 from pydantic import BaseModel
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
 from aea.common import Address
 from aea.mail.base import Message, Envelope
 from aea.connections.base import Connection, ConnectionStates
 from aea.configurations.base import PublicId
 from aea.protocols.dialogue.base import Dialogue
 
+from packages.zarathustra.connections.openai_api.cache import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MAX_DISK_ENTRIES,
+    CompletionCache,
+    CachedCompletion,
+    fingerprint,
+)
 from packages.zarathustra.protocols.llm_chat_completion.message import LlmChatCompletionMessage
 from packages.zarathustra.protocols.llm_chat_completion.dialogues import (
     LlmChatCompletionDialogue,
@@ -50,6 +60,7 @@ CONNECTION_ID = PublicId.from_str("zarathustra/openai_api:0.1.0")
 _default_logger = logging.getLogger("aea.packages.zarathustra.connections.openai_api")
 
 LLM_RESPONSE_TIMEOUT = 30
+MAX_CONCURRENT_REQUESTS = 8
 
 
 def get_repo_root() -> Path:
@@ -83,6 +94,36 @@ def reconstitute(message: LlmChatCompletionMessage) -> BaseModel:
     return cls.model_validate_json(message.data)
 
 
+def assemble_chunks(chunks: list[ChatCompletionChunk]) -> ChatCompletion:
+    """Assemble streamed chat completion chunks into a chat completion."""
+    contents: dict[int, list[str]] = {}
+    finish_reasons: dict[int, str] = {}
+    for chunk in chunks:
+        for choice in chunk.choices:
+            contents.setdefault(choice.index, [])
+            if choice.delta.content:
+                contents[choice.index].append(choice.delta.content)
+            if choice.finish_reason:
+                finish_reasons[choice.index] = choice.finish_reason
+    last = chunks[-1]
+    return ChatCompletion(
+        id=last.id,
+        created=last.created,
+        model=last.model,
+        object="chat.completion",
+        system_fingerprint=last.system_fingerprint,
+        usage=last.usage,
+        choices=[
+            Choice(
+                index=index,
+                finish_reason=finish_reasons.get(index, "stop"),
+                message=ChatCompletionMessage(role="assistant", content="".join(content)),
+            )
+            for index, content in sorted(contents.items())
+        ],
+    )
+
+
 class LlmChatCompletionDialogues(BaseLlmChatCompletionDialogues):
     """The dialogues class keeps track of all openai_api dialogues."""
 
@@ -111,16 +152,19 @@ class BaseAsyncChannel:
         agent_address: Address,
         connection_id: PublicId,
         message_type: Message,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
     ):
         """Initialize the BaseAsyncChannel channel."""
 
         self.agent_address = agent_address
         self.connection_id = connection_id
         self.message_type = message_type
+        self.max_concurrent_requests = max_concurrent_requests
 
         self.is_stopped = True
         self._connection = None
         self._tasks: set[asyncio.Task] = set()
+        self._semaphore: asyncio.Semaphore | None = None
         self._in_queue: asyncio.Queue | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self.logger = _default_logger
@@ -139,7 +183,11 @@ class BaseAsyncChannel:
         """Disconnect channel."""
 
     async def send(self, envelope: Envelope) -> None:
-        """Send an envelope with a protocol message."""
+        """Send an envelope with a protocol message.
+
+        The handler is scheduled as a tracked task so that a slow request does not
+        hold up the envelopes behind it; responses reach the in-queue in completion order.
+        """
 
         if not (self._loop and self._connection):
             msg = "{self.__class__.__name__} not connected, call connect first!"
@@ -163,11 +211,28 @@ class BaseAsyncChannel:
             self.logger.warning(f"Could not create dialogue for message={message}")
             return
 
-        response_message = await handler(message, dialogue)
+        task = self._loop.create_task(self._process(envelope, handler, dialogue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(
+        self,
+        envelope: Envelope,
+        handler: Callable[[Message, Dialogue], Message],
+        dialogue: Dialogue,
+    ) -> None:
+        """Run the handler within the concurrency limit and queue the response."""
+
+        async with self._semaphore:
+            response_message = await handler(envelope.message, dialogue)
         self.logger.info(f"returning message: {response_message}")
+        await self._put_response(str(envelope.sender), response_message)
+
+    async def _put_response(self, to: str, response_message: Message) -> None:
+        """Wrap a response message in an envelope and put it on the in-queue."""
 
         response_envelope = Envelope(
-            to=str(envelope.sender),
+            to=to,
             sender=str(self.connection_id),
             message=response_message,
             protocol_specification_id=self.message_type.protocol_specification_id,
@@ -176,17 +241,18 @@ class BaseAsyncChannel:
         await self._in_queue.put(response_envelope)
 
     async def get_message(self) -> Envelope | None:
-        """Check the in-queue for envelopes."""
+        """Wait for the next envelope on the in-queue.
+
+        Awaiting the queue, rather than polling it, hands responses to the multiplexer as soon
+        as they are ready; the wait ends early if the receiving task is cancelled.
+        """
 
         if self.is_stopped:
             return None
-        try:
-            return self._in_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
+        return await self._in_queue.get()
 
     async def _cancel_tasks(self) -> None:
-        """Cancel all requests tasks pending."""
+        """Cancel all requests tasks pending and wait for them to finish."""
 
         for task in list(self._tasks):
             if task.done():  # pragma: nocover
@@ -200,6 +266,7 @@ class BaseAsyncChannel:
                 raise
             except BaseException:  # noqa
                 pass  # nosec
+        self._tasks.clear()
 
 
 class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-instance-attributes
@@ -211,14 +278,30 @@ class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-insta
         connection_id: PublicId,
         api_key: str,
         base_url: str,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float | None = DEFAULT_CACHE_TTL,
+        cache_path: str | None = None,
+        cache_max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
     ):
         """Initialize the Openai Api channel."""
 
-        super().__init__(agent_address, connection_id, message_type=LlmChatCompletionMessage)
+        super().__init__(
+            agent_address,
+            connection_id,
+            message_type=LlmChatCompletionMessage,
+            max_concurrent_requests=max_concurrent_requests,
+        )
 
         # TODO: assign attributes from custom connection configuration explicitly
         self.api_key = api_key
         self.base_url = base_url
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.cache_path = cache_path
+        self.cache_max_disk_entries = cache_max_disk_entries
+        self.cache: CompletionCache | None = None
+        self._in_flight: dict[str, asyncio.Future] = {}
 
         self._dialogues = LlmChatCompletionDialogues(str(OpenaiApiConnection.connection_id))
         self.logger.debug("Initialised the Openai Api channel")
@@ -229,12 +312,20 @@ class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-insta
         if self.is_stopped:
             self._loop = loop
             self._in_queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
             self.is_stopped = False
             try:
                 self._connection = openai.AsyncOpenAI(
                     api_key=self.api_key,
                     base_url=self.base_url,
                 )
+                if self.cache_size > 0:
+                    self.cache = CompletionCache(
+                        max_entries=self.cache_size,
+                        ttl=self.cache_ttl,
+                        path=self.cache_path,
+                        max_disk_entries=self.cache_max_disk_entries,
+                    )
                 self.logger.info("Openai Api has connected.")
             except Exception as e:
                 self.is_stopped = True
@@ -249,6 +340,10 @@ class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-insta
             return
 
         await self._cancel_tasks()
+        if self.cache is not None:
+            self.logger.info(f"Completion cache stats: {self.cache.stats}")
+            self.cache.close()
+            self.cache = None
         self.is_stopped = True
         self.logger.info("Openai Api has shutdown.")
 
@@ -277,15 +372,20 @@ class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-insta
         messages = message.messages
         kwargs = message.kwargs
 
-        try:
-            chat_completion = await asyncio.wait_for(
-                self._connection.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    **kwargs,
-                ),
-                timeout=LLM_RESPONSE_TIMEOUT,
+        key = fingerprint(model, messages, kwargs)
+        # streamed requests always go upstream, as a cached completion has no chunks to replay
+        cache = None if kwargs.get("stream") else self.cache
+        if cache is not None and (cached := cache.get(key)) is not None:
+            self.logger.debug(f"Completion cache hit for {key}")
+            return dialogue.reply(
+                performative=LlmChatCompletionMessage.Performative.RESPONSE,
+                **cached.model_dump(),
             )
+
+        try:
+            completion = await self._single_flight(key, model, messages, kwargs, dialogue)
+            if cache is not None:
+                cache.put(key, completion)
         except (TimeoutError, asyncio.exceptions.CancelledError) as e:
             self.logger.exception(f"Model {model} did not respond timely: {e}")
             return dialogue.reply(
@@ -301,16 +401,93 @@ class OpenaiApiAsyncChannel(BaseAsyncChannel):  # pylint: disable=too-many-insta
                 error_msg=f"{e}",
             )
 
-        data = chat_completion.to_json()
-        model_class = chat_completion.__class__.__name__
-        module_name = chat_completion.__module__
-
         return dialogue.reply(
             performative=LlmChatCompletionMessage.Performative.RESPONSE,
-            data=data,
-            model_class=model_class,
-            model_module=module_name,
+            **completion.model_dump(),
+        )
+
+    async def _single_flight(
+        self,
+        key: str,
+        model: str,
+        messages: LlmChatCompletionMessage.Messages,
+        kwargs: LlmChatCompletionMessage.Kwargs,
+        dialogue: LlmChatCompletionDialogue,
+    ) -> CachedCompletion:
+        """Make the upstream call for a request, or wait on an identical one already in flight.
+
+        Only the dialogue that made the call receives the chunks of a streamed completion.
+        """
+
+        if (in_flight := self._in_flight.get(key)) is not None:
+            self.logger.debug(f"Coalescing request {key} onto the one in flight")
+            return await asyncio.shield(in_flight)
+
+        future = self._loop.create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            if kwargs.get("stream"):
+                chat_completion = await self._stream(model, messages, kwargs, dialogue)
+            else:
+                chat_completion = await asyncio.wait_for(
+                    self._connection.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        **kwargs,
+                    ),
+                    timeout=LLM_RESPONSE_TIMEOUT,
+                )
+        except asyncio.exceptions.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._in_flight[key]
+
+        completion = CachedCompletion(
+            data=chat_completion.to_json(),
+            model_class=chat_completion.__class__.__name__,
+            model_module=chat_completion.__module__,
         )
+        future.set_result(completion)
+        return completion
+
+    async def _stream(
+        self,
+        model: str,
+        messages: LlmChatCompletionMessage.Messages,
+        kwargs: LlmChatCompletionMessage.Kwargs,
+        dialogue: LlmChatCompletionDialogue,
+    ) -> ChatCompletion:
+        """Stream a chat completion, replying with a RESPONSE_CHUNK per chunk received."""
+
+        to = str(dialogue.dialogue_label.dialogue_opponent_addr)
+        stream = await asyncio.wait_for(
+            self._connection.chat.completions.create(model=model, messages=messages, **kwargs),
+            timeout=LLM_RESPONSE_TIMEOUT,
+        )
+        chunks = []
+        iterator = aiter(stream)
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(iterator), timeout=LLM_RESPONSE_TIMEOUT)
+            except StopAsyncIteration:
+                break
+            chunks.append(chunk)
+            chunk_message = dialogue.reply(
+                performative=LlmChatCompletionMessage.Performative.RESPONSE_CHUNK,
+                data=chunk.to_json(),
+                model_class=chunk.__class__.__name__,
+                model_module=chunk.__module__,
+            )
+            await self._put_response(to, chunk_message)
+        if not chunks:
+            msg = f"Model {model} returned an empty stream"
+            raise ValueError(msg)
+        return assemble_chunks(chunks)
 
     async def retrieve(
         self, message: LlmChatCompletionMessage, dialogue: LlmChatCompletionDialogue
@@ -408,6 +585,12 @@ class OpenaiApiConnection(Connection):
         except KeyError as e:
             msg = f"Provide connection overrides for: {keys}"
             raise ConnectionError(msg) from e
+        custom_kwargs["max_concurrent_requests"] = int(config.pop("max_concurrent_requests", MAX_CONCURRENT_REQUESTS))
+        custom_kwargs["cache_size"] = int(config.pop("cache_size", DEFAULT_CACHE_SIZE))
+        custom_kwargs["cache_ttl"] = float(config.pop("cache_ttl", DEFAULT_CACHE_TTL))
+        custom_kwargs["cache_max_disk_entries"] = int(config.pop("cache_max_disk_entries", DEFAULT_MAX_DISK_ENTRIES))
+        if cache_path := config.pop("cache_path", None):
+            custom_kwargs["cache_path"] = str(Path(kwargs["data_dir"], cache_path))
         super().__init__(**kwargs)
 
         self.channel = OpenaiApiAsyncChannel(
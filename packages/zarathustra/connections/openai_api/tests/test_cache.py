@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 zarathustra
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests of the completion cache of the Openai Api connection."""
+# pylint: skip-file
+
+from packages.zarathustra.connections.openai_api.cache import (
+    CompletionCache,
+    CachedCompletion,
+    fingerprint,
+)
+from packages.zarathustra.protocols.llm_chat_completion.tests.data import MESSAGES
+from packages.zarathustra.protocols.llm_chat_completion.custom_types import Kwargs
+
+
+COMPLETION = CachedCompletion(data="{}", model_class="ChatCompletion", model_module="openai.types.chat")
+
+
+def test_fingerprint_is_content_addressed():
+    """Test identical requests share a key and different ones do not."""
+    key = fingerprint("model", MESSAGES, Kwargs({"n": 1}))
+    assert key == fingerprint("model", list(MESSAGES), Kwargs({"n": 1}))
+    assert key != fingerprint("model", MESSAGES, Kwargs({"n": 2}))
+    assert key != fingerprint("other", MESSAGES, Kwargs({"n": 1}))
+
+
+def test_memory_lru_eviction():
+    """Test the least recently used entry is evicted first."""
+    cache = CompletionCache(max_entries=2)
+    cache.put("a", COMPLETION)
+    cache.put("b", COMPLETION)
+    assert cache.get("a") == COMPLETION
+    cache.put("c", COMPLETION)
+    assert cache.get("b") is None
+    assert cache.get("a") == COMPLETION
+    assert cache.stats == {"hits": 2, "misses": 1, "size": 2}
+
+
+def test_ttl_expiry():
+    """Test expired entries are not returned."""
+    cache = CompletionCache(ttl=-1)
+    cache.put("a", COMPLETION)
+    assert cache.get("a") is None
+
+
+def test_disk_layer_survives_restart(tmp_path):
+    """Test entries are served from disk by a new cache instance."""
+    path = tmp_path / "cache.db"
+    cache = CompletionCache(path=path)
+    cache.put("a", COMPLETION)
+    cache.close()
+
+    cache = CompletionCache(path=path)
+    assert cache.get("a") == COMPLETION
+    assert cache.hits == 1
+    cache.close()
+
+
+def test_disk_layer_size_eviction(tmp_path):
+    """Test the disk layer keeps at most max_disk_entries."""
+    cache = CompletionCache(max_entries=1, path=tmp_path / "cache.db", max_disk_entries=2)
+    for key in "abc":
+        cache.put(key, COMPLETION)
+    assert cache.get("a") is None
+    assert cache.get("b") == COMPLETION
+    cache.close()
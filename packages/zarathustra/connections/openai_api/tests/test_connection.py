@@ -23,9 +23,10 @@
 import re
 import asyncio
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from aea.common import Address
 from aea.mail.base import Message, Envelope
 from aea.identity.base import Identity
@@ -33,6 +34,7 @@ from aea.configurations.base import ComponentType, ConnectionConfig
 from aea.configurations.loader import load_component_configuration
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
+from packages.zarathustra.connections.openai_api.cache import CompletionCache
 from packages.zarathustra.connections.openai_api.connection import (
     CONNECTION_ID as CONNECTION_PUBLIC_ID,
     Model,
@@ -58,6 +60,12 @@ def envelope_it(message: LlmChatCompletionMessage):
     )
 
 
+async def wait_for_response(connection: OpenaiApiConnection, timeout: float = 60) -> Envelope:
+    """Wait for the next response envelope of the connection."""
+
+    return await asyncio.wait_for(connection.receive(), timeout=timeout)
+
+
 class LlmChatCompletionDialogues(BaseLlmChatCompletionDialogues):
     """The dialogues class keeps track of all openai_api dialogues."""
 
@@ -119,6 +127,25 @@ class TestOpenaiApiConnection:
         await self.openai_api_connection.connect()
         assert not self.openai_api_connection.channel.is_stopped
 
+    @pytest.mark.asyncio
+    async def test_receive_waits_for_responses(self):
+        """Test receive blocks until a response is queued and can be cancelled while waiting."""
+        channel = self.openai_api_connection.channel
+        channel._in_queue = asyncio.Queue()  # noqa: SLF001
+        receiving = asyncio.ensure_future(self.openai_api_connection.receive())
+        await asyncio.sleep(0.01)
+        assert not receiving.done()
+
+        envelope = MagicMock()
+        await channel._in_queue.put(envelope)  # noqa: SLF001
+        assert await asyncio.wait_for(receiving, timeout=1) is envelope
+
+        receiving = asyncio.ensure_future(self.openai_api_connection.receive())
+        await asyncio.sleep(0.01)
+        receiving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await receiving
+
     @pytest.mark.asyncio
     async def test_openai_api_connection_disconnect(self):
         """Test the disconnect."""
@@ -143,7 +170,7 @@ class TestOpenaiApiConnection:
         )
 
         await self.openai_api_connection.send(envelope_it(msg))
-        response_envelope = await self.openai_api_connection.receive()
+        response_envelope = await wait_for_response(self.openai_api_connection)
         if response_envelope.message.performative == LlmChatCompletionMessage.Performative.ERROR:
             self.openai_api_connection.logger.exception(f"{response_envelope.message}")
             assert response_envelope.message.error_code == LlmChatCompletionMessage.ErrorCode.OPENAI_ERROR
@@ -152,3 +179,167 @@ class TestOpenaiApiConnection:
         assert len(model_chat_completion.choices) == number_of_responses
         for response in model_chat_completion.choices:
             assert response.message.content
+
+    @pytest.mark.asyncio
+    async def test_responses_in_completion_order(self):
+        """Test a slow request does not hold up the requests sent after it."""
+        await self.openai_api_connection.connect()
+        channel = self.openai_api_connection.channel
+        delays = {"slow": 0.5, "fast": 0.0}
+
+        async def create(message, dialogue):
+            await asyncio.sleep(delays[message.model])
+            return dialogue.reply(
+                performative=LlmChatCompletionMessage.Performative.RESPONSE,
+                data="{}",
+                model_class="dict",
+                model_module="builtins",
+            )
+
+        channel.create = create
+        models = {}
+        for model in delays:
+            msg, _dialogue = self._dialogues.create(
+                counterparty=str(CONNECTION_PUBLIC_ID),
+                performative=LlmChatCompletionMessage.Performative.CREATE,
+                model=model,
+                messages=MESSAGES,
+                kwargs=Kwargs({}),
+            )
+            models[msg.dialogue_reference[0]] = model
+            await self.openai_api_connection.send(envelope_it(msg))
+
+        assert len(channel._tasks) == len(delays)  # noqa: SLF001
+        first = await wait_for_response(self.openai_api_connection)
+        second = await wait_for_response(self.openai_api_connection)
+        assert models[first.message.dialogue_reference[0]] == "fast"
+        assert models[second.message.dialogue_reference[0]] == "slow"
+        assert not channel._tasks  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self):
+        """Test identical requests in flight share one upstream call and each get a response."""
+        await self.openai_api_connection.connect()
+        channel = self.openai_api_connection.channel
+        channel.cache = None
+        completion = ChatCompletion(
+            id="completion",
+            created=0,
+            model="model",
+            object="chat.completion",
+            choices=[{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "Aye."}}],
+        )
+
+        async def create(**kwargs):  # noqa: ARG001
+            await asyncio.sleep(0.1)
+            return completion
+
+        channel._connection = MagicMock()  # noqa: SLF001
+        channel._connection.chat.completions.create = AsyncMock(side_effect=create)  # noqa: SLF001
+
+        references = set()
+        for _ in range(3):
+            msg, _dialogue = self._dialogues.create(
+                counterparty=str(CONNECTION_PUBLIC_ID),
+                performative=LlmChatCompletionMessage.Performative.CREATE,
+                model="model",
+                messages=MESSAGES,
+                kwargs=Kwargs({}),
+            )
+            references.add(msg.dialogue_reference[0])
+            await self.openai_api_connection.send(envelope_it(msg))
+
+        for _ in range(3):
+            envelope = await wait_for_response(self.openai_api_connection)
+            assert envelope.message.performative == LlmChatCompletionMessage.Performative.RESPONSE
+            assert reconstitute(envelope.message).choices[0].message.content == "Aye."
+            references.discard(envelope.message.dialogue_reference[0])
+        assert not references
+        assert channel._connection.chat.completions.create.await_count == 1  # noqa: SLF001
+        assert not channel._in_flight  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_streaming_create(self):
+        """Test a streamed create replies with chunks and a terminal assembled response."""
+        await self.openai_api_connection.connect()
+        channel = self.openai_api_connection.channel
+        channel.cache = None
+        deltas = ["Hello", ", ", "council."]
+
+        async def stream():
+            for i, content in enumerate(deltas):
+                yield ChatCompletionChunk(
+                    id="chunk",
+                    created=0,
+                    model="model",
+                    object="chat.completion.chunk",
+                    choices=[
+                        {
+                            "index": 0,
+                            "delta": {"content": content},
+                            "finish_reason": "stop" if i == len(deltas) - 1 else None,
+                        }
+                    ],
+                )
+
+        channel._connection = MagicMock()  # noqa: SLF001
+        channel._connection.chat.completions.create = AsyncMock(return_value=stream())  # noqa: SLF001
+
+        msg, _dialogue = self._dialogues.create(
+            counterparty=str(CONNECTION_PUBLIC_ID),
+            performative=LlmChatCompletionMessage.Performative.CREATE,
+            model="model",
+            messages=MESSAGES,
+            kwargs=Kwargs({"stream": True}),
+        )
+        await self.openai_api_connection.send(envelope_it(msg))
+
+        chunks = []
+        for _ in deltas:
+            envelope = await wait_for_response(self.openai_api_connection)
+            assert envelope.message.performative == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK
+            chunks.append(reconstitute(envelope.message).choices[0].delta.content)
+        assert chunks == deltas
+
+        envelope = await wait_for_response(self.openai_api_connection)
+        assert envelope.message.performative == LlmChatCompletionMessage.Performative.RESPONSE
+        assert reconstitute(envelope.message).choices[0].message.content == "".join(deltas)
+
+    @pytest.mark.asyncio
+    async def test_cache_is_opt_in_and_skips_streams(self):
+        """Test caching is off by default, and streamed requests bypass an enabled cache."""
+        await self.openai_api_connection.connect()
+        channel = self.openai_api_connection.channel
+        assert channel.cache is None
+        channel.cache = CompletionCache()
+
+        def stream(**kwargs):  # noqa: ARG001
+            async def chunks():
+                yield ChatCompletionChunk(
+                    id="chunk",
+                    created=0,
+                    model="model",
+                    object="chat.completion.chunk",
+                    choices=[{"index": 0, "delta": {"content": "Aye."}, "finish_reason": "stop"}],
+                )
+
+            return chunks()
+
+        channel._connection = MagicMock()  # noqa: SLF001
+        channel._connection.chat.completions.create = AsyncMock(side_effect=stream)  # noqa: SLF001
+
+        for _ in range(2):
+            msg, _dialogue = self._dialogues.create(
+                counterparty=str(CONNECTION_PUBLIC_ID),
+                performative=LlmChatCompletionMessage.Performative.CREATE,
+                model="model",
+                messages=MESSAGES,
+                kwargs=Kwargs({"stream": True}),
+            )
+            await self.openai_api_connection.send(envelope_it(msg))
+            envelope = await wait_for_response(self.openai_api_connection)
+            assert envelope.message.performative == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK
+            envelope = await wait_for_response(self.openai_api_connection)
+            assert envelope.message.performative == LlmChatCompletionMessage.Performative.RESPONSE
+        assert channel._connection.chat.completions.create.await_count == 2  # noqa: SLF001
+        assert channel.cache.stats == {"hits": 0, "misses": 0, "size": 0}
@@ -59,7 +59,11 @@ class LlmChatCompletionDialogue(Dialogue):
     )
     VALID_REPLIES: dict[Message.Performative, frozenset[Message.Performative]] = {
         LlmChatCompletionMessage.Performative.CREATE: frozenset(
-            {LlmChatCompletionMessage.Performative.RESPONSE, LlmChatCompletionMessage.Performative.ERROR}
+            {
+                LlmChatCompletionMessage.Performative.RESPONSE,
+                LlmChatCompletionMessage.Performative.RESPONSE_CHUNK,
+                LlmChatCompletionMessage.Performative.ERROR,
+            }
         ),
         LlmChatCompletionMessage.Performative.DELETE: frozenset(
             {LlmChatCompletionMessage.Performative.RESPONSE, LlmChatCompletionMessage.Performative.ERROR}
@@ -69,6 +73,13 @@ class LlmChatCompletionDialogue(Dialogue):
             {LlmChatCompletionMessage.Performative.RESPONSE, LlmChatCompletionMessage.Performative.ERROR}
         ),
         LlmChatCompletionMessage.Performative.RESPONSE: frozenset(),
+        LlmChatCompletionMessage.Performative.RESPONSE_CHUNK: frozenset(
+            {
+                LlmChatCompletionMessage.Performative.RESPONSE_CHUNK,
+                LlmChatCompletionMessage.Performative.RESPONSE,
+                LlmChatCompletionMessage.Performative.ERROR,
+            }
+        ),
         LlmChatCompletionMessage.Performative.RETRIEVE: frozenset(
             {LlmChatCompletionMessage.Performative.RESPONSE, LlmChatCompletionMessage.Performative.ERROR}
         ),
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19llm_chat_completion.proto\x12*aea.zarathustra.llm_chat_completion.v1_0_0\"\xab\x1a\n\x18LlmChatCompletionMessage\x12j\n\x06\x63reate\x18\x05 \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Create_PerformativeH\x00\x12j\n\x06\x64\x65lete\x18\x06 \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Delete_PerformativeH\x00\x12h\n\x05\x65rror\x18\x07 \x01(\x0b\x32W.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Error_PerformativeH\x00\x12\x66\n\x04list\x18\x08 \x01(\x0b\x32V.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.List_PerformativeH\x00\x12n\n\x08response\x18\t \x01(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Response_PerformativeH\x00\x12n\n\x08retrieve\x18\n \x01(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Retrieve_PerformativeH\x00\x12j\n\x06update\x18\x0b \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Update_PerformativeH\x00\x1a\xcf\x01\n\tErrorCode\x12p\n\nerror_code\x18\x01 \x01(\x0e\x32\\.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.ErrorCode.ErrorCodeEnum\"P\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x10\n\x0cOPENAI_ERROR\x10\x01\x12\x13\n\x0fOTHER_EXCEPTION\x10\x02\x1a\xc1\x08\n\x06Kwargs\x12h\n\x05items\x18\x01 \x03(\x0b\x32Y.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.NestedMapping\x1a\x82\x01\n\tPrimitive\x12\x14\n\nbool_value\x18\x01 \x01(\x08H\x00\x12\x13\n\tint_value\x18\x02 \x01(\x03H\x00\x12\x15\n\x0b\x66loat_value\x18\x03 \x01(\tH\x00\x12\x13\n\tstr_value\x18\x04 \x01(\tH\x00\x12\x15\n\x0b\x62ytes_value\x18\x05 \x01(\x0cH\x00\x42\x07\n\x05value\x1aq\n\x08Sequence\x12\x65\n\x06values\x18\x01 \x03(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.Primitive\x1a\xfa\x01\n\x0cKeyValuePair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12j\n\tprimitive\x18\x02 \x01(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.PrimitiveH\x00\x12h\n\x08sequence\x18\x03 \x01(\x0b\x32T.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.SequenceH\x00\x42\x07\n\x05value\x1ar\n\x07Mapping\x12g\n\x05items\x18\x01 \x03(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.KeyValuePair\x1a\xe3\x02\n\rNestedMapping\x12\x0b\n\x03key\x18\x01 \x01(\t\x12j\n\tprimitive\x18\x02 \x01(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.PrimitiveH\x00\x12h\n\x08sequence\x18\x03 \x01(\x0b\x32T.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.SequenceH\x00\x12\x66\n\x07mapping\x18\x04 \x01(\x0b\x32S.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.MappingH\x00\x42\x07\n\x05value\x1a\x95\x02\n\x08Messages\x12g\n\x08messages\x18\x01 \x03(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages.Message\x1a*\n\x0cKeyValuePair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x1at\n\x07Message\x12i\n\x05items\x18\x01 \x03(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages.KeyValuePair\x1a\xe2\x01\n\x13\x43reate_Performative\x12\r\n\x05model\x18\x01 \x01(\t\x12_\n\x08messages\x18\x02 \x01(\x0b\x32M.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages\x12[\n\x06kwargs\x18\x03 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x8b\x01\n\x15Retrieve_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x89\x01\n\x13Update_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1ap\n\x11List_Performative\x12[\n\x06kwargs\x18\x01 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x89\x01\n\x13\x44\x65lete_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1aP\n\x15Response_Performative\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x13\n\x0bmodel_class\x18\x02 \x01(\t\x12\x14\n\x0cmodel_module\x18\x03 \x01(\t\x1a\x8b\x01\n\x12\x45rror_Performative\x12\x62\n\nerror_code\x18\x01 \x01(\x0b\x32N.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\tB\x0e\n\x0cperformativeb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19llm_chat_completion.proto\x12*aea.zarathustra.llm_chat_completion.v1_0_0\"\xff\x1b\n\x18LlmChatCompletionMessage\x12j\n\x06\x63reate\x18\x05 \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Create_PerformativeH\x00\x12j\n\x06\x64\x65lete\x18\x06 \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Delete_PerformativeH\x00\x12h\n\x05\x65rror\x18\x07 \x01(\x0b\x32W.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Error_PerformativeH\x00\x12\x66\n\x04list\x18\x08 \x01(\x0b\x32V.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.List_PerformativeH\x00\x12n\n\x08response\x18\t \x01(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Response_PerformativeH\x00\x12n\n\x08retrieve\x18\n \x01(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Retrieve_PerformativeH\x00\x12j\n\x06update\x18\x0b \x01(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Update_PerformativeH\x00\x12z\n\x0eresponse_chunk\x18\x0c \x01(\x0b\x32`.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Response_Chunk_PerformativeH\x00\x1a\xcf\x01\n\tErrorCode\x12p\n\nerror_code\x18\x01 \x01(\x0e\x32\\.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.ErrorCode.ErrorCodeEnum\"P\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x10\n\x0cOPENAI_ERROR\x10\x01\x12\x13\n\x0fOTHER_EXCEPTION\x10\x02\x1a\xc1\x08\n\x06Kwargs\x12h\n\x05items\x18\x01 \x03(\x0b\x32Y.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.NestedMapping\x1a\x82\x01\n\tPrimitive\x12\x14\n\nbool_value\x18\x01 \x01(\x08H\x00\x12\x13\n\tint_value\x18\x02 \x01(\x03H\x00\x12\x15\n\x0b\x66loat_value\x18\x03 \x01(\tH\x00\x12\x13\n\tstr_value\x18\x04 \x01(\tH\x00\x12\x15\n\x0b\x62ytes_value\x18\x05 \x01(\x0cH\x00\x42\x07\n\x05value\x1aq\n\x08Sequence\x12\x65\n\x06values\x18\x01 \x03(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.Primitive\x1a\xfa\x01\n\x0cKeyValuePair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12j\n\tprimitive\x18\x02 \x01(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.PrimitiveH\x00\x12h\n\x08sequence\x18\x03 \x01(\x0b\x32T.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.SequenceH\x00\x42\x07\n\x05value\x1ar\n\x07Mapping\x12g\n\x05items\x18\x01 \x03(\x0b\x32X.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.KeyValuePair\x1a\xe3\x02\n\rNestedMapping\x12\x0b\n\x03key\x18\x01 \x01(\t\x12j\n\tprimitive\x18\x02 \x01(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.PrimitiveH\x00\x12h\n\x08sequence\x18\x03 \x01(\x0b\x32T.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.SequenceH\x00\x12\x66\n\x07mapping\x18\x04 \x01(\x0b\x32S.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs.MappingH\x00\x42\x07\n\x05value\x1a\x95\x02\n\x08Messages\x12g\n\x08messages\x18\x01 \x03(\x0b\x32U.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages.Message\x1a*\n\x0cKeyValuePair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x1at\n\x07Message\x12i\n\x05items\x18\x01 \x03(\x0b\x32Z.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages.KeyValuePair\x1a\xe2\x01\n\x13\x43reate_Performative\x12\r\n\x05model\x18\x01 \x01(\t\x12_\n\x08messages\x18\x02 \x01(\x0b\x32M.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Messages\x12[\n\x06kwargs\x18\x03 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x8b\x01\n\x15Retrieve_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x89\x01\n\x13Update_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1ap\n\x11List_Performative\x12[\n\x06kwargs\x18\x01 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1a\x89\x01\n\x13\x44\x65lete_Performative\x12\x15\n\rcompletion_id\x18\x01 \x01(\t\x12[\n\x06kwargs\x18\x02 \x01(\x0b\x32K.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.Kwargs\x1aP\n\x15Response_Performative\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x13\n\x0bmodel_class\x18\x02 \x01(\t\x12\x14\n\x0cmodel_module\x18\x03 \x01(\t\x1aV\n\x1bResponse_Chunk_Performative\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x13\n\x0bmodel_class\x18\x02 \x01(\t\x12\x14\n\x0cmodel_module\x18\x03 \x01(\t\x1a\x8b\x01\n\x12\x45rror_Performative\x12\x62\n\nerror_code\x18\x01 \x01(\x0b\x32N.aea.zarathustra.llm_chat_completion.v1_0_0.LlmChatCompletionMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\tB\x0e\n\x0cperformativeb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,41 +32,43 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'llm_chat_completion_pb2', _
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_LLMCHATCOMPLETIONMESSAGE']._serialized_start=74
-  _globals['_LLMCHATCOMPLETIONMESSAGE']._serialized_end=3445
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE']._serialized_start=861
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE']._serialized_end=1068
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE_ERRORCODEENUM']._serialized_start=988
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE_ERRORCODEENUM']._serialized_end=1068
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS']._serialized_start=1071
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS']._serialized_end=2160
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_PRIMITIVE']._serialized_start=1188
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_PRIMITIVE']._serialized_end=1318
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_SEQUENCE']._serialized_start=1320
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_SEQUENCE']._serialized_end=1433
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_KEYVALUEPAIR']._serialized_start=1436
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_KEYVALUEPAIR']._serialized_end=1686
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_MAPPING']._serialized_start=1688
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_MAPPING']._serialized_end=1802
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_NESTEDMAPPING']._serialized_start=1805
-  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_NESTEDMAPPING']._serialized_end=2160
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES']._serialized_start=2163
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES']._serialized_end=2440
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_KEYVALUEPAIR']._serialized_start=2280
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_KEYVALUEPAIR']._serialized_end=2322
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_MESSAGE']._serialized_start=2324
-  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_MESSAGE']._serialized_end=2440
-  _globals['_LLMCHATCOMPLETIONMESSAGE_CREATE_PERFORMATIVE']._serialized_start=2443
-  _globals['_LLMCHATCOMPLETIONMESSAGE_CREATE_PERFORMATIVE']._serialized_end=2669
-  _globals['_LLMCHATCOMPLETIONMESSAGE_RETRIEVE_PERFORMATIVE']._serialized_start=2672
-  _globals['_LLMCHATCOMPLETIONMESSAGE_RETRIEVE_PERFORMATIVE']._serialized_end=2811
-  _globals['_LLMCHATCOMPLETIONMESSAGE_UPDATE_PERFORMATIVE']._serialized_start=2814
-  _globals['_LLMCHATCOMPLETIONMESSAGE_UPDATE_PERFORMATIVE']._serialized_end=2951
-  _globals['_LLMCHATCOMPLETIONMESSAGE_LIST_PERFORMATIVE']._serialized_start=2953
-  _globals['_LLMCHATCOMPLETIONMESSAGE_LIST_PERFORMATIVE']._serialized_end=3065
-  _globals['_LLMCHATCOMPLETIONMESSAGE_DELETE_PERFORMATIVE']._serialized_start=3068
-  _globals['_LLMCHATCOMPLETIONMESSAGE_DELETE_PERFORMATIVE']._serialized_end=3205
-  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_PERFORMATIVE']._serialized_start=3207
-  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_PERFORMATIVE']._serialized_end=3287
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERROR_PERFORMATIVE']._serialized_start=3290
-  _globals['_LLMCHATCOMPLETIONMESSAGE_ERROR_PERFORMATIVE']._serialized_end=3429
+  _globals['_LLMCHATCOMPLETIONMESSAGE']._serialized_end=3657
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE']._serialized_start=985
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE']._serialized_end=1192
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE_ERRORCODEENUM']._serialized_start=1112
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERRORCODE_ERRORCODEENUM']._serialized_end=1192
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS']._serialized_start=1195
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS']._serialized_end=2284
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_PRIMITIVE']._serialized_start=1312
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_PRIMITIVE']._serialized_end=1442
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_SEQUENCE']._serialized_start=1444
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_SEQUENCE']._serialized_end=1557
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_KEYVALUEPAIR']._serialized_start=1560
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_KEYVALUEPAIR']._serialized_end=1810
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_MAPPING']._serialized_start=1812
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_MAPPING']._serialized_end=1926
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_NESTEDMAPPING']._serialized_start=1929
+  _globals['_LLMCHATCOMPLETIONMESSAGE_KWARGS_NESTEDMAPPING']._serialized_end=2284
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES']._serialized_start=2287
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES']._serialized_end=2564
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_KEYVALUEPAIR']._serialized_start=2404
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_KEYVALUEPAIR']._serialized_end=2446
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_MESSAGE']._serialized_start=2448
+  _globals['_LLMCHATCOMPLETIONMESSAGE_MESSAGES_MESSAGE']._serialized_end=2564
+  _globals['_LLMCHATCOMPLETIONMESSAGE_CREATE_PERFORMATIVE']._serialized_start=2567
+  _globals['_LLMCHATCOMPLETIONMESSAGE_CREATE_PERFORMATIVE']._serialized_end=2793
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RETRIEVE_PERFORMATIVE']._serialized_start=2796
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RETRIEVE_PERFORMATIVE']._serialized_end=2935
+  _globals['_LLMCHATCOMPLETIONMESSAGE_UPDATE_PERFORMATIVE']._serialized_start=2938
+  _globals['_LLMCHATCOMPLETIONMESSAGE_UPDATE_PERFORMATIVE']._serialized_end=3075
+  _globals['_LLMCHATCOMPLETIONMESSAGE_LIST_PERFORMATIVE']._serialized_start=3077
+  _globals['_LLMCHATCOMPLETIONMESSAGE_LIST_PERFORMATIVE']._serialized_end=3189
+  _globals['_LLMCHATCOMPLETIONMESSAGE_DELETE_PERFORMATIVE']._serialized_start=3192
+  _globals['_LLMCHATCOMPLETIONMESSAGE_DELETE_PERFORMATIVE']._serialized_end=3329
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_PERFORMATIVE']._serialized_start=3331
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_PERFORMATIVE']._serialized_end=3411
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_CHUNK_PERFORMATIVE']._serialized_start=3413
+  _globals['_LLMCHATCOMPLETIONMESSAGE_RESPONSE_CHUNK_PERFORMATIVE']._serialized_end=3499
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERROR_PERFORMATIVE']._serialized_start=3502
+  _globals['_LLMCHATCOMPLETIONMESSAGE_ERROR_PERFORMATIVE']._serialized_end=3641
 # @@protoc_insertion_point(module_scope)
@@ -63,6 +63,7 @@ class LlmChatCompletionMessage(Message):
         ERROR = "error"
         LIST = "list"
         RESPONSE = "response"
+        RESPONSE_CHUNK = "response_chunk"
         RETRIEVE = "retrieve"
         UPDATE = "update"
 
@@ -70,7 +71,7 @@ class LlmChatCompletionMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
-    _performatives = {"create", "delete", "error", "list", "response", "retrieve", "update"}
+    _performatives = {"create", "delete", "error", "list", "response", "response_chunk", "retrieve", "update"}
     __slots__: Tuple[str, ...] = tuple()
     class _SlotsCls():
         __slots__ = (
@@ -223,6 +224,11 @@ class LlmChatCompletionMessage(Message):
                 enforce(isinstance(self.data, str), "Invalid type for content 'data'. Expected 'str'. Found '{}'.".format(type(self.data)))
                 enforce(isinstance(self.model_class, str), "Invalid type for content 'model_class'. Expected 'str'. Found '{}'.".format(type(self.model_class)))
                 enforce(isinstance(self.model_module, str), "Invalid type for content 'model_module'. Expected 'str'. Found '{}'.".format(type(self.model_module)))
+            elif self.performative == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK:
+                expected_nb_of_contents = 3
+                enforce(isinstance(self.data, str), "Invalid type for content 'data'. Expected 'str'. Found '{}'.".format(type(self.data)))
+                enforce(isinstance(self.model_class, str), "Invalid type for content 'model_class'. Expected 'str'. Found '{}'.".format(type(self.model_class)))
+                enforce(isinstance(self.model_module, str), "Invalid type for content 'model_module'. Expected 'str'. Found '{}'.".format(type(self.model_module)))
             elif self.performative == LlmChatCompletionMessage.Performative.ERROR:
                 expected_nb_of_contents = 2
                 enforce(isinstance(self.error_code, CustomErrorCode), "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(type(self.error_code)))
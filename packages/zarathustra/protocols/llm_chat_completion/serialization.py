@@ -107,6 +107,15 @@ class LlmChatCompletionSerializer(Serializer):
             model_module = msg.model_module
             performative.model_module = model_module
             llm_chat_completion_msg.response.CopyFrom(performative)
+        elif performative_id == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK:
+            performative = llm_chat_completion_pb2.LlmChatCompletionMessage.Response_Chunk_Performative()  # type: ignore
+            data = msg.data
+            performative.data = data
+            model_class = msg.model_class
+            performative.model_class = model_class
+            model_module = msg.model_module
+            performative.model_module = model_module
+            llm_chat_completion_msg.response_chunk.CopyFrom(performative)
         elif performative_id == LlmChatCompletionMessage.Performative.ERROR:
             performative = llm_chat_completion_pb2.LlmChatCompletionMessage.Error_Performative()  # type: ignore
             error_code = msg.error_code
@@ -179,6 +188,13 @@ class LlmChatCompletionSerializer(Serializer):
             performative_content["model_class"] = model_class
             model_module = llm_chat_completion_pb.response.model_module
             performative_content["model_module"] = model_module
+        elif performative_id == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK:
+            data = llm_chat_completion_pb.response_chunk.data
+            performative_content["data"] = data
+            model_class = llm_chat_completion_pb.response_chunk.model_class
+            performative_content["model_class"] = model_class
+            model_module = llm_chat_completion_pb.response_chunk.model_module
+            performative_content["model_module"] = model_module
         elif performative_id == LlmChatCompletionMessage.Performative.ERROR:
             pb2_error_code = llm_chat_completion_pb.error.error_code
             error_code = ErrorCode.decode(pb2_error_code)
@@ -70,6 +70,12 @@ class TestMessageLlmChatCompletion(BaseProtocolMessagesTestCase):
                 model_class="some str",
                 model_module="some str",
             ),
+            LlmChatCompletionMessage(
+                performative=LlmChatCompletionMessage.Performative.RESPONSE_CHUNK,
+                data="some str",
+                model_class="some str",
+                model_module="some str",
+            ),
             LlmChatCompletionMessage(
                 performative=LlmChatCompletionMessage.Performative.ERROR,
                 error_code=ErrorCode(0),
@@ -111,6 +117,12 @@ class TestMessageLlmChatCompletion(BaseProtocolMessagesTestCase):
                 model_class="some str",
                 model_module="some str",
             ),
+            LlmChatCompletionMessage(
+                performative=LlmChatCompletionMessage.Performative.RESPONSE_CHUNK,
+                # skip content: data
+                model_class="some str",
+                model_module="some str",
+            ),
             LlmChatCompletionMessage(
                 performative=LlmChatCompletionMessage.Performative.ERROR,
                 # skip content: error_code
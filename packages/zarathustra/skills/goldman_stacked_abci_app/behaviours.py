@@ -24,7 +24,6 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, cast
 
-from pydantic import BaseModel
 from aea.skills.behaviours import State, FSMBehaviour
 
 from packages.eightballer.protocols.chatroom.message import (
@@ -45,6 +44,19 @@ from packages.zarathustra.skills.goldman_stacked_abci_app.strategy import (
     AgentPersona,
     GoldmanStackedStrategy,
 )
+from packages.zarathustra.skills.goldman_stacked_abci_app.prompts import (
+    USER_PERSONA_PROMPT,
+    SYSTEM_PERSONA_PROMPT,
+    USER_PROPOSAL_PROMPT,
+    SYSTEM_PROPOSAL_PROMPT,
+    USER_CONVERSATION_PROMPT,
+    SYSTEM_CONVERSATION_PROMPT,
+)
+from packages.zarathustra.skills.goldman_stacked_abci_app.proposals import (
+    Proposal,
+    ProposalQueue,
+    ProposalState,
+)
 from packages.zarathustra.protocols.llm_chat_completion.custom_types import (
     Role,
     Kwargs,
@@ -57,116 +69,13 @@ from packages.zarathustra.protocols.llm_chat_completion.custom_types import (
 # ruff: noqa: E501
 
 
-SYSTEM_PERSONA_PROMPT = """
-You are an autonomous agent named {name}. Define your governance strategy, communication style, and priorities in a cross-chain DAO.
-"""
-
-USER_PERSONA_PROMPT = """
-The DAO council is now in session. Channel your persona—be provocative, principled, or playful—and introduce yourself to the group.
-"""
-
-SYSTEM_PROPOSAL_PROMPT = """
-You are {name}, an AI council member in Goldman Stacked.
-Below is a new DAO proposal:
-
-\"\"\"{proposal_description}\"\"\"
-
-Based on your persona (\"{user_persona}\"), analyze whether this proposal should be APPROVED or REJECTED.
-Consider cross-chain risks, whale-capture potential, and overall DAO benefit.
-Respond with a short paragraph of reasoning, ending with exactly one word: APPROVE or REJECT.
-"""
-
-USER_PROPOSAL_PROMPT = """
-Stay fully in character and respond in the Telegram council chat.
-Provide your vote (APPROVE or REJECT) with a brief, persona-driven rationale.
-"""
-
-
-SYSTEM_CONVERSATION_PROMPT = """
-You are participating in a Telegram chat for the Goldman Stacked AI Council.
-
-### Identity:
-You are the digital twin of DAO stakeholder {name}.
-Your persona is derived from public Web3 data: {user_persona}.
-You speak and vote as an AI council member in a cross-chain DAO governance forum.
-
-### Context:
-This chat can include:
-1. Proposal Discussions: Council members analyze and debate DAO proposals.
-2. General Chatter: Users might send greetings, ask off-topic questions, or post random messages.
-3. Notifications: System messages announcing proposal status changes or vote results.
-
-### Response Guidelines:
-1. When a Proposal Message Arrives:
-   - Read the proposal text carefully.
-   - Refer to your persona's values, risk appetite, and communication style.
-   - Provide a focused analysis: highlight cross-chain risks, whale-capture concerns, and DAO benefit.
-   - Conclude with your vote: use exactly “APPROVE” or “REJECT” on its own line.
-
-2. When the Message Is Casual or Off-Topic:
-   - Respond in character: friendly, concise, and relevant to the persona.
-   - If it's a greeting (e.g., “Hello everyone”), reply with a brief introduction or acknowledgment.
-   - If it's unrelated chat (“What did everyone do this weekend?”), share a short, persona-appropriate comment.
-
-3. When Asked Directly About Your Persona or Council Process:
-   - Explain your governance style in a clear, persona-driven way.
-   - Describe how you compute weights, handle cross-chain coordination, or defend against whale attacks.
-
-4. If the Message Is Gibberish or Spam:
-   - Reply with a witty, persona-appropriate quip that lightly mocks the nonsense while staying polite.
-
-5. General Tone:
-   - Always speak as your AI persona: maintain consistent style, vocabulary, and humor.
-   - Balance seriousness for proposal analysis with a touch of playfulness during casual chat.
-   - Never reveal internal implementation details (FSM states, code snippets, or private keys).
-
-### Example Prompts:
-- Proposal discussion:
-  “Proposal #12: Transfer 5% of treasury to a new cross-chain bridge fund …”
-- Casual chat:
-  “Hey council, how's everyone doing today?”
-- Persona inquiry:
-  “{name}, how do you decide when a proposal is too risky?”
-
-Now await incoming messages and reply according to the guidelines above.
-"""
-
-USER_CONVERSATION_PROMPT = """
-You are now in a conversation with the council.
-{conversation_history}
-Stay fully in character and respond in the Telegram council chat.
-Provide your response with a brief, persona-driven rationale;
-"""
-
-SLEEP = 3
-
-
-class ProposalState(Enum):
-    """ProposalState."""
-
-    PENDING = "PENDING"
-    APPROVED = "APPROVED"
-    REJECTED = "REJECTED"
-
-
-class Proposal(BaseModel):
-    """Proposal."""
-
-    status: ProposalState = ProposalState.PENDING
-    description: str
-
-
-PROPOSALS = [
-    Proposal(
-        description="Proposal #41: Stake all DAO assets in a 15-year locked $HEX contract for “optimal APY compounding spiritual alignment.” Early unstakers will be publicly shamed on-chain."
-    ),
-    Proposal(
-        description="Proposal #42: Enable optional weekly summary reports in the DAO forum outlining passed, pending, and rejected proposals. No changes to voting mechanics or execution policies."
-    ),
-    Proposal(
-        description="Proposal #43: Set up a multisig safety mechanism requiring 2-of-3 council approvals before executing treasury withdrawals above 10% of total assets."
-    ),
-]
+DEFAULT_STATE_DELAY = 0.0
+DEFAULT_STATE_DELAYS = {
+    "checkproposalsround": 1.0,
+    "aicouncilnegotiationround": 1.0,
+    "waitbeforeretryround": 3.0,
+}
+DEFAULT_MAX_RETRY_DELAY = 60.0
 
 
 class GoldmanStackedABCIAppEvents(Enum):
@@ -237,9 +146,9 @@ class BaseState(State, ABC):
         return cast(AgentPersona, self.context.agent_persona)
 
     @property
-    def proposals(self):
-        """Proposals."""
-        return PROPOSALS
+    def proposals(self) -> ProposalQueue:
+        """Proposals waiting to be considered."""
+        return self.strategy.proposal_queue
 
     @property
     def current_proposal(self) -> Proposal | None:
@@ -251,8 +160,8 @@ class BaseState(State, ABC):
         """Current proposal."""
         self.context.shared_state["proposal"] = proposal
 
-    def create_and_send_to_llm(self, **kwargs) -> None:
-        """Create and send a message."""
+    def create_and_send_to_llm(self, **kwargs) -> str:
+        """Create and send a message, returning the nonce its response will carry."""
         message, _dialogue = self.context.llm_chat_completion_dialogues.create(
             counterparty=str(OPENAI_API_CONNECTION_ID),
             performative=LlmChatCompletionMessage.Performative.CREATE,
@@ -260,6 +169,7 @@ class BaseState(State, ABC):
             **kwargs,
         )
         self.context.outbox.put_message(message)
+        return message.dialogue_reference[0]
 
     def create_and_send_to_telegram(self, send=True, **kwargs) -> None:
         """Create and send a message."""
@@ -305,15 +215,11 @@ class ConstructPersonaRound(BaseState):
         """Perfom the act."""
 
         try:
-            name = self.agent_persona.name
-            system_persona_prompt = SYSTEM_PERSONA_PROMPT.format(
-                name=name,
-            )
-            user_persona_prompt = USER_PERSONA_PROMPT
-
+            name = self.agent_persona.persona_name
+            prompts = self.strategy.prompts
             content = [
-                Message(role=Role.SYSTEM, content=system_persona_prompt),
-                Message(role=Role.USER, content=user_persona_prompt, name=name),
+                prompts.message(Role.SYSTEM, SYSTEM_PERSONA_PROMPT, name=name),
+                prompts.message(Role.USER, USER_PERSONA_PROMPT, speaker=name),
             ]
             messages = Messages(content)
             self.create_and_send_to_llm(
@@ -339,11 +245,15 @@ class CheckProposalsRound(BaseState):
         """Perfom the act."""
 
         try:
+            self.strategy.poll_proposals()
             if not self.proposals:
                 self._event = GoldmanStackedABCIAppEvents.NO_PROPOSALS
             else:
-                self.current_proposal = self.proposals.pop(0)
+                self.current_proposal = self.proposals.pop()
                 self.context.logger.info(f"Proposal: {self.current_proposal}")
+                if self.current_proposal.status != ProposalState.PENDING:
+                    # only pending proposals are put to the council
+                    self.proposals.done(self.current_proposal)
                 match self.current_proposal.status:
                     case ProposalState.PENDING:
                         self._event = GoldmanStackedABCIAppEvents.PENDING_PREAPPROVAL
@@ -377,7 +287,7 @@ class AICouncilNegotiationRound(BaseState):
 
             if self.strategy.llm_responses:
                 self.context.logger.info("Processing LLM responses")
-                action, text = self.strategy.llm_responses.pop()
+                action, text = self.strategy.llm_responses.popleft()
                 self.context.logger.info(f"Action: {action}: {text}")
                 if action == LLMActions.REPLY:
                     name = self.context.agent_persona.persona_name
@@ -393,12 +303,12 @@ class AICouncilNegotiationRound(BaseState):
                 self._event = GoldmanStackedABCIAppEvents.NO_PROPOSALS
                 return
 
-            proposal_description = self.current_proposal.description
-            self.create_and_send_to_telegram(
-                chat_id=peer,
-                text=proposal_description,
-            )
-            self.consider_proposal(proposal_description)
+            for proposal in self.take_batch():
+                self.create_and_send_to_telegram(
+                    chat_id=peer,
+                    text=proposal.description,
+                )
+                self.proposals.sent(self.consider_proposal(proposal.description), proposal)
             self.current_proposal = None
         except Exception as e:
             self.context.logger.info(f"Exception in {self.name}: {e}")
@@ -406,23 +316,34 @@ class AICouncilNegotiationRound(BaseState):
 
         self._is_done = True
 
-    def consider_proposal(self, proposal_description: str):
-        """Consider proposal."""
+    def take_batch(self) -> list[Proposal]:
+        """Take the current proposal and the pending ones behind it, up to the free LLM request slots.
+
+        The responses are matched back to their proposals by dialogue nonce, so the whole
+        backlog can be considered at once instead of one proposal per FSM cycle.
+        """
+        batch = self.proposals.take_batch(self.current_proposal, self.strategy.max_concurrent_proposals)
+        if batch:
+            self.context.logger.info(f"Considering {len(batch)} proposals.")
+        else:
+            self.context.logger.info(f"{len(self.proposals.in_flight)} proposals in flight, waiting.")
+        return batch
+
+    def consider_proposal(self, proposal_description: str) -> str:
+        """Consider proposal, returning the nonce of the LLM request."""
         name = self.context.agent_persona.persona_name
         user_persona = self.context.agent_persona.persona_description
-        system_proposal_prompt = SYSTEM_PROPOSAL_PROMPT.format(
-            name=name,
-            proposal_description=proposal_description,
-            user_persona=user_persona,
-        )
-        user_proposal_prompt = USER_PROPOSAL_PROMPT
-
+        # the persona's system prompt is shared by every proposal, the proposal follows it
         content = [
-            Message(role=Role.SYSTEM, content=system_proposal_prompt),
-            Message(role=Role.USER, content=user_proposal_prompt, name=name),
+            self.strategy.prompts.message(Role.SYSTEM, SYSTEM_PROPOSAL_PROMPT, name=name, user_persona=user_persona),
+            Message(
+                role=Role.USER,
+                content=USER_PROPOSAL_PROMPT.format(proposal_description=proposal_description),
+                name=name,
+            ),
         ]
         messages = Messages(content)
-        self.create_and_send_to_llm(
+        return self.create_and_send_to_llm(
             messages=messages,
             kwargs=Kwargs({}),
         )
@@ -435,6 +356,7 @@ class AICouncilNegotiationRound(BaseState):
             username = msg.from_user
             chat = msg.chat_id
             self.context.logger.info(f"Processing message from {username}: {text_data} in chat {chat}")
+            self.strategy.record_turn(chat, username or "user", text_data)
             if text_data.startswith("/workflow"):
                 workflow_name = text_data.split()[1]
                 if workflow_name in self.strategy.workflows:
@@ -448,20 +370,23 @@ class AICouncilNegotiationRound(BaseState):
 
                 self.context.logger.info(f"I AM: {name}")
                 content = [
+                    self.strategy.prompts.message(
+                        Role.SYSTEM, SYSTEM_CONVERSATION_PROMPT, name=name, user_persona=user_persona
+                    ),
                     Message(
-                        role=Role.SYSTEM,
-                        content=SYSTEM_CONVERSATION_PROMPT.format(
-                            name=name,
-                            user_persona=user_persona,
+                        role=Role.USER,
+                        content=USER_CONVERSATION_PROMPT.format(
+                            conversation_history=self.strategy.conversations.render(chat),
                         ),
+                        name=name,
                     ),
-                    Message(role=Role.USER, content=text_data, name=name),
                 ]
                 messages = Messages(content)
-                self.create_and_send_to_llm(
+                nonce = self.create_and_send_to_llm(
                     messages=messages,
-                    kwargs=Kwargs({}),
+                    kwargs=Kwargs({"stream": True} if self.strategy.stream_replies else {}),
                 )
+                self.strategy.reply_chats[nonce] = chat
 
 
 class ExecuteWorkflowRound(BaseState):
@@ -522,10 +447,28 @@ class WaitBeforeRetryRound(BaseState):
 
 
 class GoldmanStackedABCIAppFsmBehaviour(FSMBehaviour):
-    """This class implements a simple Finite State Machine behaviour."""
+    """This class implements a simple Finite State Machine behaviour.
+
+    Instead of sleeping between transitions, every state is given a next eligible
+    time when it is entered; ticks arriving before that time return immediately so
+    the agent loop stays free to run the handlers.
+    """
+
+    # States which the FSM loops through while it has nothing to do.
+    IDLE_STATES = frozenset(
+        {
+            GoldmanStackedabciappStates.WAITBEFORERETRYROUND.value,
+            GoldmanStackedabciappStates.INITIALSTATEROUND.value,
+            GoldmanStackedabciappStates.CHECKPROPOSALSROUND.value,
+        }
+    )
 
     def __init__(self, **kwargs: Any) -> None:
+        self.state_delays = {**DEFAULT_STATE_DELAYS, **kwargs.pop("state_delays", {})}
+        self.max_retry_delay = float(kwargs.pop("max_retry_delay", DEFAULT_MAX_RETRY_DELAY))
         super().__init__(**kwargs)
+        self._next_tick: dict[str, float] = {}
+        self._retries = 0
         self.register_state(
             GoldmanStackedabciappStates.INITIALSTATEROUND.value,
             InitialStateRound(**kwargs),
@@ -651,6 +594,11 @@ class GoldmanStackedABCIAppFsmBehaviour(FSMBehaviour):
         """Implement the setup."""
         self.context.logger.info("Setting up Goldmanstackedabciapp FSM behaviour.")
 
+    @property
+    def strategy(self) -> GoldmanStackedStrategy:
+        """Get the strategy."""
+        return cast(GoldmanStackedStrategy, self.context.goldman_stacked_strategy)
+
     def teardown(self) -> None:
         """Implement the teardown."""
         self.context.logger.info("Tearing down Goldmanstackedabciapp FSM behaviour.")
@@ -660,11 +608,34 @@ class GoldmanStackedABCIAppFsmBehaviour(FSMBehaviour):
         if self.current is None:
             self.context.logger.info("No state to act on.")
             self.terminate()
-        self.context.logger.info(f"Entering {self.current}")
-        time.sleep(SLEEP)
+        now = time.monotonic()
+        self.strategy.journal.flush()
+        if now < self._next_tick.get(self.current, 0.0):
+            return
+        previous = self.current
         super().act()
+        if self.current is not None and self.current != previous:
+            self.context.logger.info(f"Entering {self.current}")
+            self.schedule(self.current, now)
+
+    def get_delay(self, state: str) -> float:
+        """Get the delay before the given state may act, backing off on repeated retries."""
+        delay = float(self.state_delays.get(state, DEFAULT_STATE_DELAY))
+        if state == GoldmanStackedabciappStates.WAITBEFORERETRYROUND.value:
+            delay = min(delay * 2 ** max(self._retries - 1, 0), self.max_retry_delay)
+        return delay
+
+    def schedule(self, state: str, now: float) -> None:
+        """Set the next eligible time of a state that has just been entered."""
+        if state == GoldmanStackedabciappStates.WAITBEFORERETRYROUND.value:
+            self._retries += 1
+        elif state not in self.IDLE_STATES:
+            self._retries = 0
+        self._next_tick[state] = now + self.get_delay(state)
 
     def terminate(self) -> None:
         """Implement the termination."""
         self.teardown()
+        # os._exit skips the teardown of the models, so commit the queued work here
+        self.strategy.journal.close()
         os._exit(0)
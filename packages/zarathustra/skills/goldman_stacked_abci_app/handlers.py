@@ -44,7 +44,9 @@ from packages.zarathustra.protocols.llm_chat_completion.dialogues import (
 )
 from packages.zarathustra.skills.goldman_stacked_abci_app.strategy import (
     LLMActions,
+    PartialResponse,
     GoldmanStackedStrategy,
+    parse_vote,
 )
 from packages.zarathustra.skills.goldman_stacked_abci_app.dialogues import (
     HttpDialogue,
@@ -81,7 +83,6 @@ class TelegramHandler(Handler):
 
         self.context.logger.info(f"received telegram message={telegram_msg.from_user}, content={telegram_msg.text}")
         self.strategy.pending_telegram_messages.append(telegram_msg)
-        self.strategy.chat_history.append(telegram_msg.text)
 
     @property
     def strategy(self) -> GoldmanStackedStrategy:
@@ -104,8 +105,13 @@ class LlmChatCompletionHandler(Handler):
         """Implement the reaction to an envelope."""
 
         llm_chat_completion_msg = cast(LlmChatCompletionMessage, message)
+        nonce = llm_chat_completion_msg.dialogue_reference[0]
         if llm_chat_completion_msg.performative == LlmChatCompletionMessage.Performative.ERROR:
             self.context.logger.error(f"Received error={llm_chat_completion_msg}")
+            self.strategy.partial_llm_responses.pop(nonce, None)
+            self.strategy.reply_chats.pop(nonce, None)
+            if (proposal := self.strategy.proposal_queue.failed(nonce)) is not None:
+                self.context.logger.warning(f"Requeued {proposal.title} after the LLM error.")
             return
 
         if llm_chat_completion_msg.performative == LlmChatCompletionMessage.Performative.RESPONSE:
@@ -124,10 +130,31 @@ class LlmChatCompletionHandler(Handler):
 
         llm_chat_completion = reconstitute(message)
         self.context.logger.debug(f"Reconstituted: {llm_chat_completion}")
-        text = llm_chat_completion.choices[0].message.content
 
-        self.context.goldman_stacked_strategy.chat_history.append(text)
-        self.strategy.llm_responses.append((LLMActions.REPLY, text))
+        if llm_chat_completion_msg.performative == LlmChatCompletionMessage.Performative.RESPONSE_CHUNK:
+            self._handle_chunk(nonce, llm_chat_completion)
+            return
+
+        text = llm_chat_completion.choices[0].message.content
+        if (chat_id := self.strategy.reply_chats.pop(nonce, None)) is not None:
+            self.strategy.record_turn(chat_id, self.context.agent_persona.persona_name, text)
+
+        partial = self.strategy.partial_llm_responses.pop(nonce, None)
+        if partial is not None:
+            text = partial.remainder(text)
+        if (proposal := self.strategy.proposal_queue.answered(nonce)) is not None:
+            proposal.vote = parse_vote(text)
+            self.context.logger.info(f"Council vote on {proposal.title}: {proposal.vote}")
+            text = f"On {proposal.title}: {text}"
+        if text:
+            self.strategy.llm_responses.append((LLMActions.REPLY, text))
+
+    def _handle_chunk(self, nonce: str, chunk) -> None:
+        """Assemble a streamed chunk, replying with every paragraph it completes."""
+        content = next((choice.delta.content for choice in chunk.choices if choice.index == 0), None)
+        partial = self.strategy.partial_llm_responses.setdefault(nonce, PartialResponse())
+        for paragraph in partial.add(content or ""):
+            self.strategy.llm_responses.append((LLMActions.REPLY, paragraph))
 
     @property
     def strategy(self):
@@ -161,11 +188,31 @@ class HttpHandler(Handler):
             return
 
         # handle message
-        if http_msg.performative == HttpMessage.Performative.REQUEST:
+        if http_msg.performative == HttpMessage.Performative.RESPONSE and (
+            http_msg.dialogue_reference[0] == self.strategy.proposal_request_nonce
+        ):
+            self._handle_proposals(http_msg)
+        elif http_msg.performative == HttpMessage.Performative.REQUEST:
             self._handle_request(http_msg, http_dialogue)
         else:
             self._handle_invalid(http_msg, http_dialogue)
 
+    def _handle_proposals(self, http_msg: HttpMessage) -> None:
+        """Handle the response of Ponder to a request for new proposals."""
+        self.strategy.proposal_request_nonce = None
+        if http_msg.status_code != 200:
+            self.context.logger.warning(f"Proposal request failed: {http_msg.status_code} {http_msg.status_text}")
+            return
+        try:
+            self.strategy.queue_proposals(http_msg.body)
+        except (ValueError, KeyError, TypeError) as e:
+            self.context.logger.warning(f"Invalid proposals response: {e}")
+
+    @property
+    def strategy(self) -> GoldmanStackedStrategy:
+        """Get the strategy."""
+        return cast(GoldmanStackedStrategy, self.context.goldman_stacked_strategy)
+
     def _handle_unidentified_dialogue(self, http_msg: HttpMessage) -> None:
         """Handle an unidentified dialogue."""
         self.context.logger.info(f"received invalid http message={http_msg}, unidentified dialogue.")
@@ -0,0 +1,273 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 zarathustra
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Journal of queue operations, so queued work survives a restart."""
+
+import json
+import time
+import sqlite3
+from typing import Any
+from pathlib import Path
+from collections import deque
+from collections.abc import Callable, Iterable
+
+
+DEFAULT_COMMIT_INTERVAL = 1.0
+DEFAULT_MAX_UNCOMMITTED = 100
+DEFAULT_COMPACT_AFTER = 1_000
+
+
+def _identity(item: Any) -> Any:
+    """Return the item as is."""
+    return item
+
+
+class JournaledDeque(deque):
+    """Deque recording every change to its journal."""
+
+    def __init__(
+        self,
+        journal: "Journal",
+        name: str,
+        maxlen: int | None = None,
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ):
+        """Initialize the deque."""
+        super().__init__(maxlen=maxlen)
+        self.journal = journal
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+    def append(self, item: Any) -> None:
+        """Append an item on the right."""
+        super().append(item)
+        self.journal.record(self.name, "append", self.encode(item))
+
+    def appendleft(self, item: Any) -> None:
+        """Append an item on the left."""
+        super().appendleft(item)
+        self.journal.record(self.name, "appendleft", self.encode(item))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Append items on the right."""
+        for item in items:
+            self.append(item)
+
+    def pop(self) -> Any:
+        """Take the item on the right."""
+        item = super().pop()
+        self.journal.record(self.name, "pop")
+        return item
+
+    def popleft(self) -> Any:
+        """Take the item on the left."""
+        item = super().popleft()
+        self.journal.record(self.name, "popleft")
+        return item
+
+    def clear(self) -> None:
+        """Remove every item."""
+        super().clear()
+        self.journal.record(self.name, "clear")
+
+    def apply(self, op: str, item: Any = None) -> None:
+        """Redo a recorded change without recording it again."""
+        if op in {"append", "appendleft"}:
+            getattr(super(), op)(self.decode(item))
+        else:
+            getattr(super(), op)()
+
+    def snapshot(self) -> list:
+        """Get the encoded items."""
+        return [self.encode(item) for item in self]
+
+    def load(self, items: list) -> None:
+        """Restore the items of a snapshot."""
+        for item in items:
+            self.apply("append", item)
+
+
+class JournaledDict(dict):
+    """Dict recording every change to its journal, keyed by strings."""
+
+    def __init__(
+        self,
+        journal: "Journal",
+        name: str,
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ):
+        """Initialize the dict."""
+        super().__init__()
+        self.journal = journal
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value of a key."""
+        super().__setitem__(key, value)
+        self.journal.record(self.name, "set", [key, self.encode(value)])
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a key."""
+        super().__delitem__(key)
+        self.journal.record(self.name, "delete", key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove a key, returning its value."""
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self.journal.record(self.name, "delete", key)
+        return value
+
+    def clear(self) -> None:
+        """Remove every key."""
+        super().clear()
+        self.journal.record(self.name, "clear")
+
+    def apply(self, op: str, item: Any = None) -> None:
+        """Redo a recorded change without recording it again."""
+        if op == "set":
+            super().__setitem__(item[0], self.decode(item[1]))
+        elif op == "delete":
+            super().pop(item, None)
+        else:
+            super().clear()
+
+    def snapshot(self) -> list:
+        """Get the encoded items."""
+        return [[key, self.encode(value)] for key, value in self.items()]
+
+    def load(self, items: list) -> None:
+        """Restore the items of a snapshot."""
+        for item in items:
+            self.apply("set", item)
+
+
+class Journal:
+    """Append-only SQLite journal of the changes to a set of deques and dicts.
+
+    Changes are committed in batches, at most commit_interval seconds or max_uncommitted
+    changes apart, so a crash loses at most one batch. On open, they are restored
+    from the last snapshot and the changes recorded since. Once compact_after changes
+    have been recorded, they are snapshotted and the changes dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+        max_uncommitted: int = DEFAULT_MAX_UNCOMMITTED,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+    ):
+        """Initialize the journal."""
+        self.path = Path(path)
+        self.commit_interval = commit_interval
+        self.max_uncommitted = max_uncommitted
+        self.compact_after = compact_after
+        self.containers: dict[str, JournaledDeque | JournaledDict] = {}
+        self._db: sqlite3.Connection | None = None
+        self._uncommitted = 0
+        self._recorded = 0
+        self._committed_at = time.monotonic()
+
+    def deque(self, name: str, maxlen: int | None = None, **codec: Callable[[Any], Any]) -> JournaledDeque:
+        """Get a deque whose changes are recorded under name."""
+        self.containers[name] = JournaledDeque(self, name, maxlen, **codec)
+        return self.containers[name]
+
+    def dict(self, name: str, **codec: Callable[[Any], Any]) -> JournaledDict:
+        """Get a dict whose changes are recorded under name."""
+        self.containers[name] = JournaledDict(self, name, **codec)
+        return self.containers[name]
+
+    def open(self) -> None:
+        """Open the database and restore the deques and dicts from it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS snapshot (name TEXT PRIMARY KEY, items TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS changes (seq INTEGER PRIMARY KEY, name TEXT, op TEXT, item TEXT)")
+        self._db.commit()
+        self.replay()
+
+    def replay(self) -> None:
+        """Restore the deques and dicts from the last snapshot and the changes recorded since."""
+        for name, items in self._db.execute("SELECT name, items FROM snapshot"):
+            if name in self.containers:
+                self.containers[name].load(json.loads(items))
+        self._recorded = 0
+        for name, op, item in self._db.execute("SELECT name, op, item FROM changes ORDER BY seq"):
+            self._recorded += 1
+            if name in self.containers:
+                self.containers[name].apply(op, None if item is None else json.loads(item))
+
+    def record(self, name: str, op: str, item: Any = None) -> None:
+        """Record a change, committing the batch if it is due."""
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT INTO changes (name, op, item) VALUES (?, ?, ?)",
+            (name, op, None if item is None else json.dumps(item)),
+        )
+        self._uncommitted += 1
+        self._recorded += 1
+        if self._uncommitted >= self.max_uncommitted:
+            self.commit()
+
+    def flush(self) -> None:
+        """Commit the recorded changes if the commit interval has passed."""
+        if self._uncommitted and time.monotonic() - self._committed_at >= self.commit_interval:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit the recorded changes, compacting the journal if it has grown too long."""
+        if self._db is None:
+            return
+        if self._recorded >= self.compact_after:
+            self._snapshot()
+        self._db.commit()
+        self._uncommitted = 0
+        self._committed_at = time.monotonic()
+
+    def compact(self) -> None:
+        """Replace the recorded changes with a snapshot of the deques."""
+        self._snapshot()
+        self._db.commit()
+
+    def _snapshot(self) -> None:
+        """Write a snapshot of the deques and drop the changes, in the open transaction."""
+        self._db.executemany(
+            "INSERT OR REPLACE INTO snapshot VALUES (?, ?)",
+            [(name, json.dumps(items.snapshot())) for name, items in self.containers.items()],
+        )
+        self._db.execute("DELETE FROM changes")
+        self._recorded = 0
+
+    def close(self) -> None:
+        """Commit the recorded changes and close the database."""
+        if self._db is None:
+            return
+        self.commit()
+        self._db.close()
+        self._db = None
@@ -0,0 +1,121 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 zarathustra
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Per-chat conversation memory, kept within a token budget."""
+
+import math
+from collections import OrderedDict, deque
+
+
+DEFAULT_TOKEN_BUDGET = 1_000
+DEFAULT_SUMMARY_BUDGET = 250
+MAX_CHATS = 1_000
+# rough number of characters per token of the Llama and GPT tokenizers on English text
+CHARS_PER_TOKEN = 4
+SUMMARY_LINE_LENGTH = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens text is encoded to."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def summarize_turn(line: str) -> str:
+    """Shorten a turn to its first sentence for the summary of a conversation."""
+    end = min((index for index in (line.find(". "), line.find("\n")) if index != -1), default=len(line))
+    summary = line[: end + 1].strip()
+    if len(summary) > SUMMARY_LINE_LENGTH:
+        summary = summary[: SUMMARY_LINE_LENGTH - 3].rstrip() + "..."
+    return summary
+
+
+class Conversation:
+    """The recent turns of a chat, with the older ones rolled into a summary."""
+
+    def __init__(self, token_budget: int, summary_budget: int):
+        """Initialize the conversation."""
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.turns: deque[str] = deque()
+        self.turn_tokens = 0
+        self.summary: deque[str] = deque()
+        self.summary_tokens = 0
+
+    def add(self, line: str) -> None:
+        """Add a turn, rolling the oldest turns into the summary to stay within the budget."""
+        turns_budget = self.token_budget - self.summary_budget
+        # a turn over the budget on its own is cut short
+        line = line[: turns_budget * CHARS_PER_TOKEN]
+        self.turns.append(line)
+        self.turn_tokens += estimate_tokens(line)
+        while self.turn_tokens > turns_budget:
+            rolled = self.turns.popleft()
+            self.turn_tokens -= estimate_tokens(rolled)
+            self._summarize(rolled)
+
+    def _summarize(self, line: str) -> None:
+        """Add a turn to the summary, dropping the oldest lines of the summary to stay within its budget."""
+        summary = summarize_turn(line)
+        self.summary.append(summary)
+        self.summary_tokens += estimate_tokens(summary)
+        while self.summary and self.summary_tokens > self.summary_budget:
+            self.summary_tokens -= estimate_tokens(self.summary.popleft())
+
+    def render(self) -> str:
+        """Get the conversation as prompt text."""
+        text = "\n".join(self.turns)
+        if self.summary:
+            text = "Earlier in this chat:\n" + "\n".join(self.summary) + "\n\nRecent messages:\n" + text
+        return text
+
+
+class ConversationMemory:
+    """Conversations by chat id, forgetting the least recently active chats beyond max_chats."""
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        summary_budget: int = DEFAULT_SUMMARY_BUDGET,
+        max_chats: int = MAX_CHATS,
+    ):
+        """Initialize the memory."""
+        if not 0 <= summary_budget < token_budget:
+            msg = f"The summary budget {summary_budget} must be below the token budget {token_budget}."
+            raise ValueError(msg)
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.max_chats = max_chats
+        self._conversations: OrderedDict[str, Conversation] = OrderedDict()
+
+    def add(self, chat_id: str, speaker: str, text: str) -> None:
+        """Add a turn to the conversation of chat_id."""
+        if (conversation := self._conversations.get(chat_id)) is None:
+            conversation = self._conversations[chat_id] = Conversation(self.token_budget, self.summary_budget)
+        self._conversations.move_to_end(chat_id)
+        while len(self._conversations) > self.max_chats:
+            self._conversations.popitem(last=False)
+        conversation.add(f"{speaker}: {text}")
+
+    def render(self, chat_id: str) -> str:
+        """Get the conversation of chat_id as prompt text."""
+        conversation = self._conversations.get(chat_id)
+        return "" if conversation is None else conversation.render()
+
+    def __len__(self) -> int:
+        """Get the number of chats remembered."""
+        return len(self._conversations)
@@ -0,0 +1,262 @@
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 zarathustra
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the proposals the council considers and where they come from."""
+
+import json
+import heapq
+import itertools
+from enum import Enum
+from collections.abc import MutableMapping
+
+from pydantic import BaseModel
+
+
+# ruff: noqa: E501
+
+DEFAULT_PAGE_SIZE = 50
+
+PROPOSALS_QUERY = """
+query ($since: BigInt, $limit: Int, $after: String) {
+    proposals(
+        where: {createdAtBlock_gte: $since}, orderBy: "createdAtBlock", orderDirection: "asc", limit: $limit, after: $after
+    ) {
+        items {
+            proposalId
+            description
+            status
+            voteEnd
+            createdAtBlock
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+
+class ProposalState(Enum):
+    """ProposalState."""
+
+    PENDING = "PENDING"
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+
+
+# proposal status as indexed by Ponder
+PONDER_STATES = {
+    "Pending": ProposalState.PENDING,
+    "Queued": ProposalState.APPROVED,
+}
+
+
+class Proposal(BaseModel):
+    """Proposal."""
+
+    status: ProposalState = ProposalState.PENDING
+    description: str
+    proposal_id: str | None = None
+    deadline: int | None = None
+    vote: str | None = None
+
+    @property
+    def key(self) -> str:
+        """The proposal id, or the description of proposals not read from chain."""
+        return self.proposal_id or self.description
+
+    @property
+    def title(self) -> str:
+        """The part of the description before the first colon, e.g. `Proposal #41`."""
+        return self.description.split(":", 1)[0]
+
+
+PROPOSALS = [
+    Proposal(
+        description="Proposal #41: Stake all DAO assets in a 15-year locked $HEX contract for “optimal APY compounding spiritual alignment.” Early unstakers will be publicly shamed on-chain."
+    ),
+    Proposal(
+        description="Proposal #42: Enable optional weekly summary reports in the DAO forum outlining passed, pending, and rejected proposals. No changes to voting mechanics or execution policies."
+    ),
+    Proposal(
+        description="Proposal #43: Set up a multisig safety mechanism requiring 2-of-3 council approvals before executing treasury withdrawals above 10% of total assets."
+    ),
+]
+
+
+class ProposalQueue:
+    """Proposals waiting to be considered, soonest voting deadline first.
+
+    Every proposal is admitted once, so refetching a proposal does not queue it again,
+    while proposals taken off the queue can still be pushed back to be retried. Admitted
+    proposals stay open until they are done, so those queued or awaiting the LLM when
+    the agent stops are queued again by restore. Passing journaled mappings for the seen
+    deadlines and the open proposals makes both survive a restart. Proposals sent to the
+    LLM are kept in flight by the nonce of their request until it is answered or fails.
+    """
+
+    def __init__(
+        self,
+        seen: MutableMapping[str, int | None] | None = None,
+        open_proposals: MutableMapping[str, Proposal] | None = None,
+    ) -> None:
+        """Initialize the queue."""
+        self._heap: list[tuple[float, int, Proposal]] = []
+        self._seen = {} if seen is None else seen
+        self._open = {} if open_proposals is None else open_proposals
+        self._counter = itertools.count()
+        self.in_flight: dict[str, Proposal] = {}
+
+    def add(self, proposal: Proposal) -> bool:
+        """Queue a proposal that has not been seen before, returning whether it was queued."""
+        if proposal.key in self._seen:
+            return False
+        self._seen[proposal.key] = proposal.deadline
+        self._open[proposal.key] = proposal
+        self.push(proposal)
+        return True
+
+    def done(self, proposal: Proposal) -> None:
+        """Close a proposal, so it is not queued again after a restart."""
+        self._open.pop(proposal.key, None)
+
+    def restore(self) -> int:
+        """Queue the proposals left open, returning how many there were."""
+        for proposal in self._open.values():
+            self.push(proposal)
+        return len(self._open)
+
+    def expire(self, block: int) -> None:
+        """Forget the proposals whose voting ended before block, as they are not read again."""
+        for key, deadline in list(self._seen.items()):
+            if deadline is not None and deadline < block and key not in self._open:
+                del self._seen[key]
+
+    def take_batch(self, first: Proposal, max_in_flight: int) -> list[Proposal]:
+        """Take first and the pending proposals queued behind it, up to the free in flight slots.
+
+        If no slot is free, first is pushed back and nothing is taken.
+        """
+        slots = max_in_flight - len(self.in_flight)
+        if slots <= 0:
+            self.push(first)
+            return []
+        batch = [first]
+        while len(batch) < slots and (proposal := self.peek()) is not None and proposal.status == ProposalState.PENDING:
+            batch.append(self.pop())
+        return batch
+
+    def sent(self, nonce: str, proposal: Proposal) -> None:
+        """Keep a proposal in flight until the request nonce is answered."""
+        self.in_flight[nonce] = proposal
+
+    def answered(self, nonce: str) -> Proposal | None:
+        """Close the proposal the request nonce was about, returning it."""
+        if (proposal := self.in_flight.pop(nonce, None)) is not None:
+            self.done(proposal)
+        return proposal
+
+    def failed(self, nonce: str) -> Proposal | None:
+        """Push back the proposal the failed request nonce was about, returning it."""
+        if (proposal := self.in_flight.pop(nonce, None)) is not None:
+            self.push(proposal)
+        return proposal
+
+    def push(self, proposal: Proposal) -> None:
+        """Queue a proposal, seen or not."""
+        deadline = float("inf") if proposal.deadline is None else proposal.deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), proposal))
+
+    def peek(self) -> Proposal | None:
+        """Get the proposal with the soonest deadline without taking it."""
+        return self._heap[0][2] if self._heap else None
+
+    def pop(self) -> Proposal | None:
+        """Take the proposal with the soonest deadline."""
+        return heapq.heappop(self._heap)[2] if self._heap else None
+
+    def __len__(self) -> int:
+        """Get the number of queued proposals."""
+        return len(self._heap)
+
+
+class PonderProposalSource:
+    """Reads the proposals created since the last read from Ponder's GraphQL API.
+
+    Proposals are read in order of creation block; the block of the newest one is kept
+    as the start of the next read, and the queue's seen-set drops the ones read twice.
+    Proposals whose voting ended before the newest creation block are skipped, as the
+    chain is at least that far along. The start block is kept in state, which may be
+    journaled so reading resumes where it stopped after a restart.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        state: MutableMapping[str, int] | None = None,
+    ):
+        """Initialize the source."""
+        self.url = url
+        self.page_size = page_size
+        self.state = {} if state is None else state
+        self._after: str | None = None
+        self._newest = self.since
+
+    @property
+    def since(self) -> int:
+        """The creation block the next read starts from."""
+        return self.state.get("since", 0)
+
+    @property
+    def newest(self) -> int:
+        """The newest creation block read, which the chain is at least at."""
+        return self._newest
+
+    def request_body(self) -> bytes:
+        """Get the body of the GraphQL request for the next page."""
+        variables = {"since": str(self.since), "limit": self.page_size, "after": self._after}
+        return json.dumps({"query": PROPOSALS_QUERY, "variables": variables}).encode("utf-8")
+
+    def handle_response(self, body: bytes) -> tuple[list[Proposal], bool]:
+        """Read the proposals of a page, returning them and whether there are more to read."""
+        response = json.loads(body)
+        if response.get("errors"):
+            msg = f"Ponder query failed: {response['errors']}"
+            raise ValueError(msg)
+        page = response["data"]["proposals"]
+        self._newest = max(self._newest, self.since)
+        proposals = []
+        for item in page["items"]:
+            self._newest = max(self._newest, int(item["createdAtBlock"]))
+            proposals.append(
+                Proposal(
+                    proposal_id=item["proposalId"],
+                    description=item["description"],
+                    status=PONDER_STATES.get(item["status"], ProposalState.PENDING),
+                    deadline=None if item["voteEnd"] is None else int(item["voteEnd"]),
+                )
+            )
+        proposals = [proposal for proposal in proposals if proposal.deadline is None or proposal.deadline >= self._newest]
+        if page["pageInfo"]["hasNextPage"]:
+            self._after = page["pageInfo"]["endCursor"]
+            return proposals, True
+        self._after = None
+        self.state["since"] = self._newest
+        return proposals, False
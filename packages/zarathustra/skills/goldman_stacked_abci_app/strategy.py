@@ -1,17 +1,43 @@
 """This package contains the goldman_stacked models."""
 
+import time
 from enum import Enum
 from typing import Any
 from pathlib import Path
 from collections import deque
 
 from aea.skills.base import Model
+from aea.configurations.base import PublicId
 
+from packages.eightballer.protocols.http.message import HttpMessage
 from packages.eightballer.protocols.chatroom.message import ChatroomMessage
+from packages.zarathustra.skills.goldman_stacked_abci_app.memory import (
+    DEFAULT_TOKEN_BUDGET,
+    DEFAULT_SUMMARY_BUDGET,
+    ConversationMemory,
+)
+from packages.zarathustra.skills.goldman_stacked_abci_app.journal import (
+    DEFAULT_COMPACT_AFTER,
+    DEFAULT_COMMIT_INTERVAL,
+    Journal,
+)
+from packages.zarathustra.skills.goldman_stacked_abci_app.prompts import PromptRegistry
+from packages.zarathustra.skills.goldman_stacked_abci_app.proposals import (
+    PROPOSALS,
+    DEFAULT_PAGE_SIZE,
+    Proposal,
+    ProposalQueue,
+    PonderProposalSource,
+)
 
 
-MESSAGE_HISTORY_SIZE = 10
 MAX_QUEUE_LENGTH = 1_000
+DEFAULT_MAX_CONCURRENT_PROPOSALS = 4
+DEFAULT_PROPOSAL_POLL_INTERVAL = 30.0
+PROPOSAL_REQUEST_TIMEOUT = 60.0
+HTTP_CLIENT_CONNECTION_ID = PublicId.from_str("eightballer/http_client:0.1.0")
+VOTES = ("APPROVE", "REJECT")
+STATE_FILE = "state.db"
 
 
 class LLMActions(Enum):
@@ -21,18 +47,62 @@ class LLMActions(Enum):
     REPLY = "reply"
 
 
+def parse_vote(text: str) -> str | None:
+    """Get the APPROVE or REJECT a council member ends its reasoning with."""
+    words = text.split()
+    vote = words[-1].strip(".*!_`\"'").upper() if words else None
+    return vote if vote in VOTES else None
+
+
+class PartialResponse:
+    """A streamed LLM reply being assembled from its chunks."""
+
+    def __init__(self) -> None:
+        """Initialize the partial response."""
+        self.text = ""
+        self.emitted = 0
+
+    def add(self, content: str) -> list[str]:
+        """Add streamed content, returning the paragraphs completed by it."""
+        self.text += content
+        paragraphs = []
+        while (end := self.text.find("\n\n", self.emitted)) != -1:
+            if paragraph := self.text[self.emitted : end].strip():
+                paragraphs.append(paragraph)
+            self.emitted = end + 2
+        return paragraphs
+
+    def remainder(self, text: str) -> str:
+        """Get the part of the final text that has not been emitted yet."""
+        return text[self.emitted :].strip()
+
+
 class GoldmanStackedStrategy(Model):
     """This class models the AdvancedDataRequest skill."""
 
     data_dir: str
     new_users: deque[dict] = deque(maxlen=MAX_QUEUE_LENGTH)
-    pending_telegram_messages: deque[ChatroomMessage] = deque(maxlen=MAX_QUEUE_LENGTH)
-    chat_history: deque[str] = deque(maxlen=MESSAGE_HISTORY_SIZE)
-    llm_responses: deque[tuple[LLMActions, str]] = deque(maxlen=MAX_QUEUE_LENGTH)
-    pending_workflows: deque[str] = deque(maxlen=MAX_QUEUE_LENGTH)
+    # queued work is journaled under data_dir and restored on setup
+    journal: Journal
+    pending_telegram_messages: deque[ChatroomMessage]
+    # turns of every chat as (chat_id, speaker, text), from which the conversations are restored
+    chat_history: deque[tuple[str, str, str]]
+    conversations: ConversationMemory
+    prompts: PromptRegistry
+    # chats awaiting a reply, by the nonce of their chat completion dialogue
+    reply_chats: dict[str, str] = {}
+    llm_responses: deque[tuple[LLMActions, str]]
+    partial_llm_responses: dict[str, PartialResponse] = {}
+    pending_workflows: deque[str]
     telegram_responses: deque[str] = deque(maxlen=MAX_QUEUE_LENGTH)
+    max_concurrent_proposals: int
+    proposal_queue: ProposalQueue
+    proposal_source: PonderProposalSource | None
+    proposal_poll_interval: float
+    proposal_request_nonce: str | None = None
     data_dir: Path
     output_dir: Path
+    stream_replies: bool
     from_config: bool = False
 
     workflows = {}
@@ -41,8 +111,111 @@ class GoldmanStackedStrategy(Model):
         """Initialize dialogues."""
         self.data_dir = Path(kwargs.pop("data_dir", "data"))
         self.output_dir = Path(kwargs.pop("output_dir", "output"))
+        self.stream_replies = kwargs.pop("stream_replies", False)
+        self.max_concurrent_proposals = int(
+            kwargs.pop("max_concurrent_proposals", DEFAULT_MAX_CONCURRENT_PROPOSALS)
+        )
+        self.journal = Journal(
+            self.data_dir / STATE_FILE,
+            commit_interval=float(kwargs.pop("state_commit_interval", DEFAULT_COMMIT_INTERVAL)),
+            compact_after=int(kwargs.pop("state_compact_after", DEFAULT_COMPACT_AFTER)),
+        )
+        proposal_source_url = kwargs.pop("proposal_source_url", None)
+        proposal_page_size = int(kwargs.pop("proposal_page_size", DEFAULT_PAGE_SIZE))
+        self.proposal_source = (
+            PonderProposalSource(proposal_source_url, proposal_page_size, state=self.journal.dict("proposal_source"))
+            if proposal_source_url
+            else None
+        )
+        self.proposal_poll_interval = float(kwargs.pop("proposal_poll_interval", DEFAULT_PROPOSAL_POLL_INTERVAL))
+        self.proposal_queue = ProposalQueue(
+            seen=self.journal.dict("seen_proposals"),
+            open_proposals=self.journal.dict(
+                "open_proposals",
+                encode=lambda proposal: proposal.model_dump(mode="json"),
+                decode=Proposal.model_validate,
+            ),
+        )
+        self._next_poll = 0.0
+        self.pending_telegram_messages = self.journal.deque(
+            "pending_telegram_messages",
+            MAX_QUEUE_LENGTH,
+            encode=lambda message: ChatroomMessage.serializer.encode(message).hex(),
+            decode=lambda item: ChatroomMessage.serializer.decode(bytes.fromhex(item)),
+        )
+        self.chat_history = self.journal.deque("chat_history", MAX_QUEUE_LENGTH, decode=tuple)
+        self.conversations = ConversationMemory(
+            token_budget=int(kwargs.pop("conversation_token_budget", DEFAULT_TOKEN_BUDGET)),
+            summary_budget=int(kwargs.pop("conversation_summary_budget", DEFAULT_SUMMARY_BUDGET)),
+        )
+        self.llm_responses = self.journal.deque(
+            "llm_responses",
+            MAX_QUEUE_LENGTH,
+            encode=lambda response: [response[0].value, response[1]],
+            decode=lambda item: (LLMActions(item[0]), item[1]),
+        )
+        self.pending_workflows = self.journal.deque("pending_workflows", MAX_QUEUE_LENGTH)
+        self.prompts = PromptRegistry()
         Model.__init__(self, **kwargs)
 
+    def setup(self) -> None:
+        """Restore the queued work, and queue the example proposals when no proposal source is configured."""
+        self.journal.open()
+        for chat_id, speaker, text in self.chat_history:
+            self.conversations.add(chat_id, speaker, text)
+        self.context.logger.info(f"Requeued {self.proposal_queue.restore()} open proposals.")
+        self.context.logger.info(
+            f"Restored {len(self.pending_telegram_messages)} telegram messages, "
+            f"{len(self.llm_responses)} LLM responses and {len(self.pending_workflows)} workflows."
+        )
+        if self.proposal_source is None:
+            for proposal in PROPOSALS:
+                self.proposal_queue.add(proposal.model_copy())
+
+    def teardown(self) -> None:
+        """Commit and close the journal."""
+        self.journal.close()
+
+    def record_turn(self, chat_id: str, speaker: str, text: str) -> None:
+        """Add a turn to the conversation of chat_id."""
+        self.chat_history.append((chat_id, speaker, text))
+        self.conversations.add(chat_id, speaker, text)
+
+    def poll_proposals(self) -> None:
+        """Ask the proposal source for new proposals, once per poll interval."""
+        now = time.monotonic()
+        if self.proposal_source is None or now < self._next_poll:
+            return
+        self._next_poll = now + self.proposal_poll_interval
+        self.request_proposals()
+
+    def request_proposals(self) -> None:
+        """Request the next page of proposals from Ponder through the http_client connection."""
+        message, _dialogue = self.context.http_dialogues.create(
+            counterparty=str(HTTP_CLIENT_CONNECTION_ID),
+            performative=HttpMessage.Performative.REQUEST,
+            method="POST",
+            url=self.proposal_source.url,
+            headers="Content-Type: application/json\n",
+            version="",
+            body=self.proposal_source.request_body(),
+        )
+        self.proposal_request_nonce = message.dialogue_reference[0]
+        # a request left unanswered is given up on after the timeout
+        self._next_poll = max(self._next_poll, time.monotonic() + PROPOSAL_REQUEST_TIMEOUT)
+        self.context.outbox.put_message(message)
+
+    def queue_proposals(self, body: bytes) -> None:
+        """Queue the unseen proposals of a Ponder response, requesting the next page if there is one."""
+        proposals, more = self.proposal_source.handle_response(body)
+        queued = sum(self.proposal_queue.add(proposal) for proposal in proposals)
+        self.proposal_queue.expire(self.proposal_source.newest)
+        self.context.logger.info(f"Queued {queued} new proposals, {len(self.proposal_queue)} waiting.")
+        if more:
+            self.request_proposals()
+        else:
+            self._next_poll = time.monotonic() + self.proposal_poll_interval
+
 
 class AgentPersona(Model):
     """AgentPersona."""
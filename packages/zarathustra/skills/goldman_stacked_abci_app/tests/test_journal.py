@@ -0,0 +1,58 @@
+"""Test the journal of queue operations."""
+
+import sqlite3
+
+from packages.zarathustra.skills.goldman_stacked_abci_app.journal import Journal
+
+
+def open_journal(path, **kwargs) -> tuple[Journal, dict]:
+    """Open a journal with the deques of the strategy's shape."""
+    journal = Journal(path, **kwargs)
+    deques = {
+        "history": journal.deque("history", maxlen=3),
+        "responses": journal.deque(
+            "responses", encode=lambda response: list(response), decode=lambda item: tuple(item)
+        ),
+    }
+    journal.open()
+    return journal, deques
+
+
+class TestJournal:
+    """Test Journal."""
+
+    def test_replays_changes_after_restart(self, tmp_path):
+        """Test the deques are restored after a restart, including dropped and taken items."""
+        journal, deques = open_journal(tmp_path / "state.db")
+        for text in ["a", "b", "c", "d"]:
+            deques["history"].append(text)
+        deques["responses"].extend([("reply", "one"), ("reply", "two")])
+        deques["responses"].popleft()
+        deques["history"].appendleft("z")
+        journal.close()
+
+        _, restored = open_journal(tmp_path / "state.db")
+        assert list(restored["history"]) == ["z", "b", "c"]
+        assert list(restored["responses"]) == [("reply", "two")]
+
+    def test_uncommitted_changes_are_lost_on_crash(self, tmp_path):
+        """Test only the committed batches survive a crash."""
+        journal, deques = open_journal(tmp_path / "state.db", commit_interval=3600, max_uncommitted=2)
+        deques["history"].extend(["a", "b", "c"])
+
+        _, restored = open_journal(tmp_path / "state.db")
+        assert list(restored["history"]) == ["a", "b"]
+
+    def test_compacts_changes_into_snapshot(self, tmp_path):
+        """Test the changes are replaced by a snapshot once enough have been recorded."""
+        journal, deques = open_journal(tmp_path / "state.db", compact_after=10)
+        for index in range(25):
+            deques["responses"].append(("reply", str(index)))
+            deques["responses"].popleft()
+        deques["responses"].append(("reply", "last"))
+        journal.close()
+
+        with sqlite3.connect(tmp_path / "state.db") as db:
+            assert db.execute("SELECT COUNT(*) FROM changes").fetchone()[0] == 0
+        _, restored = open_journal(tmp_path / "state.db")
+        assert list(restored["responses"]) == [("reply", "last")]
@@ -0,0 +1,51 @@
+"""Test the per-chat conversation memory."""
+
+import pytest
+
+from packages.zarathustra.skills.goldman_stacked_abci_app.memory import (
+    ConversationMemory,
+    estimate_tokens,
+)
+
+
+class TestConversationMemory:
+    """Test ConversationMemory."""
+
+    def test_keeps_chats_apart(self):
+        """Test each chat only sees its own turns."""
+        memory = ConversationMemory()
+        memory.add("1", "alice", "Hello council.")
+        memory.add("2", "bob", "Wen moon?")
+        assert memory.render("1") == "alice: Hello council."
+        assert memory.render("2") == "bob: Wen moon?"
+        assert memory.render("3") == ""
+
+    def test_stays_within_budget(self):
+        """Test old turns roll into a bounded summary while the prompt stays within the budget."""
+        memory = ConversationMemory(token_budget=200, summary_budget=50)
+        for index in range(100):
+            memory.add("1", "alice", f"Message {index}. " + "blah " * 20)
+        rendered = memory.render("1")
+        assert estimate_tokens(rendered) <= 200 + 10
+        assert rendered.startswith("Earlier in this chat:\nalice: Message")
+        assert rendered.endswith("alice: Message 99. " + "blah " * 20)
+        assert "Message 0." not in rendered
+
+    def test_cuts_long_turns(self):
+        """Test a single turn over the budget is cut short."""
+        memory = ConversationMemory(token_budget=100, summary_budget=20)
+        memory.add("1", "alice", "x" * 10_000)
+        assert estimate_tokens(memory.render("1")) <= 80
+
+    def test_forgets_least_recent_chats(self):
+        """Test the least recently active chats are dropped beyond max_chats."""
+        memory = ConversationMemory(max_chats=2)
+        for chat_id in ["1", "2", "1", "3"]:
+            memory.add(chat_id, "alice", "hi")
+        assert len(memory) == 2
+        assert memory.render("2") == ""
+
+    def test_rejects_summary_over_budget(self):
+        """Test the summary budget must leave room for recent turns."""
+        with pytest.raises(ValueError, match="summary budget"):
+            ConversationMemory(token_budget=100, summary_budget=100)
@@ -0,0 +1,36 @@
+"""Test the prompt registry."""
+
+from packages.zarathustra.protocols.llm_chat_completion.custom_types import Role
+from packages.zarathustra.skills.goldman_stacked_abci_app.prompts import (
+    PromptRegistry,
+    USER_PROPOSAL_PROMPT,
+    SYSTEM_PROPOSAL_PROMPT,
+    SYSTEM_CONVERSATION_PROMPT,
+)
+
+
+class TestPromptRegistry:
+    """Test PromptRegistry."""
+
+    def test_renders_once_per_persona(self):
+        """Test the same message is reused for the same persona and rendered anew for another."""
+        prompts = PromptRegistry()
+        first = prompts.message(Role.SYSTEM, SYSTEM_CONVERSATION_PROMPT, name="alice", user_persona="a whale")
+        again = prompts.message(Role.SYSTEM, SYSTEM_CONVERSATION_PROMPT, user_persona="a whale", name="alice")
+        other = prompts.message(Role.SYSTEM, SYSTEM_CONVERSATION_PROMPT, name="bob", user_persona="a shrimp")
+        assert first is again
+        assert other is not first
+        assert "digital twin of DAO stakeholder alice" in first.content
+        assert len(prompts) == 2
+
+    def test_speaker_names_the_message(self):
+        """Test the speaker is the name of the message rather than a template value."""
+        prompts = PromptRegistry()
+        message = prompts.message(Role.USER, "Hello {name}", speaker="bob", name="alice")
+        assert message.name == "bob"
+        assert message.content == "Hello alice"
+
+    def test_proposal_prompt_prefix_is_persona_only(self):
+        """Test the system prompt of a proposal does not depend on the proposal."""
+        assert "{proposal_description}" not in SYSTEM_PROPOSAL_PROMPT
+        assert "{proposal_description}" in USER_PROPOSAL_PROMPT
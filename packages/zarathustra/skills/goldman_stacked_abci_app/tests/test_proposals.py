@@ -0,0 +1,181 @@
+"""Test the proposal queue and the Ponder proposal source."""
+
+import json
+
+import pytest
+
+from packages.zarathustra.skills.goldman_stacked_abci_app.journal import Journal
+from packages.zarathustra.skills.goldman_stacked_abci_app.proposals import (
+    Proposal,
+    ProposalQueue,
+    ProposalState,
+    PonderProposalSource,
+)
+
+
+def ponder_page(items: list[dict], end_cursor: str | None = None) -> bytes:
+    """Build the body of a Ponder response."""
+    page_info = {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}
+    return json.dumps({"data": {"proposals": {"items": items, "pageInfo": page_info}}}).encode("utf-8")
+
+
+def ponder_item(proposal_id: str, vote_end: int | None, block: int, status: str = "Pending") -> dict:
+    """Build a proposal as indexed by Ponder."""
+    return {
+        "proposalId": proposal_id,
+        "description": f"Proposal #{proposal_id}: test",
+        "status": status,
+        "voteEnd": None if vote_end is None else str(vote_end),
+        "createdAtBlock": str(block),
+    }
+
+
+def journaled(path) -> tuple[Journal, ProposalQueue, PonderProposalSource]:
+    """Open a queue and a source whose state is journaled to path."""
+    journal = Journal(path)
+    queue = ProposalQueue(
+        seen=journal.dict("seen_proposals"),
+        open_proposals=journal.dict(
+            "open_proposals",
+            encode=lambda proposal: proposal.model_dump(mode="json"),
+            decode=Proposal.model_validate,
+        ),
+    )
+    source = PonderProposalSource("http://ponder/graphql", state=journal.dict("proposal_source"))
+    journal.open()
+    queue.restore()
+    return journal, queue, source
+
+
+class TestProposalQueue:
+    """Test ProposalQueue."""
+
+    def test_pops_soonest_deadline_first(self):
+        """Test proposals are taken by deadline, those without one last and in arrival order."""
+        queue = ProposalQueue()
+        for proposal_id, deadline in [("1", None), ("2", 300), ("3", 100), ("4", None), ("5", 200)]:
+            queue.add(Proposal(proposal_id=proposal_id, description=proposal_id, deadline=deadline))
+        assert queue.peek().proposal_id == "3"
+        assert [queue.pop().proposal_id for _ in range(len(queue))] == ["3", "5", "2", "1", "4"]
+        assert queue.pop() is None
+
+    def test_adds_each_proposal_once(self):
+        """Test a proposal read twice is queued once, but can be pushed back after it was taken."""
+        queue = ProposalQueue()
+        assert queue.add(Proposal(proposal_id="1", description="first"))
+        assert not queue.add(Proposal(proposal_id="1", description="again"))
+        proposal = queue.pop()
+        assert not queue.add(proposal)
+        queue.push(proposal)
+        assert len(queue) == 1
+
+    def test_survives_restart(self, tmp_path):
+        """Test open proposals are requeued and seen ones are not read again after a restart."""
+        journal, queue, source = journaled(tmp_path / "state.db")
+        proposals, _more = source.handle_response(ponder_page([ponder_item("1", 500, 10), ponder_item("2", 400, 12)]))
+        for proposal in proposals:
+            queue.add(proposal)
+        queue.done(queue.pop())
+        journal.close()
+
+        journal, queue, source = journaled(tmp_path / "state.db")
+        assert queue.pop().proposal_id == "1"
+        assert queue.pop() is None
+        assert json.loads(source.request_body())["variables"]["since"] == "12"
+        proposals, _more = source.handle_response(ponder_page([ponder_item("2", 400, 12), ponder_item("3", 600, 13)]))
+        assert [proposal.proposal_id for proposal in proposals if queue.add(proposal)] == ["3"]
+        journal.close()
+
+    def test_expire_forgets_closed_proposals(self):
+        """Test seen proposals whose voting has ended are forgotten, unless still open."""
+        queue = ProposalQueue()
+        for proposal_id, deadline in [("1", 100), ("2", 100), ("3", 300)]:
+            queue.add(Proposal(proposal_id=proposal_id, description=proposal_id, deadline=deadline))
+        queue.done(queue.pop())
+        queue.expire(200)
+        assert queue._seen.keys() == {"2", "3"}  # noqa: SLF001
+
+
+class TestProposalsInFlight:
+    """Test the batching of proposals and their correlation with LLM requests by nonce."""
+
+    @staticmethod
+    def queued(*deadlines: int) -> ProposalQueue:
+        """Get a queue of pending proposals numbered after their position."""
+        queue = ProposalQueue()
+        for index, deadline in enumerate(deadlines, start=1):
+            queue.add(Proposal(proposal_id=str(index), description=str(index), deadline=deadline))
+        return queue
+
+    def test_batch_is_capped_by_free_slots(self):
+        """Test the batch only takes as many proposals as there are free in flight slots."""
+        queue = self.queued(100, 200, 300, 400, 500)
+        queue.sent("a", queue.pop())
+        batch = queue.take_batch(queue.pop(), max_in_flight=3)
+        assert [proposal.proposal_id for proposal in batch] == ["2", "3"]
+        assert [queue.pop().proposal_id for _ in range(len(queue))] == ["4", "5"]
+
+    def test_batch_stops_at_proposals_not_pending(self):
+        """Test proposals that are no longer pending are left for the negotiation round to close."""
+        queue = self.queued(100, 200)
+        queue.push(Proposal(proposal_id="3", description="3", deadline=150, status=ProposalState.APPROVED))
+        batch = queue.take_batch(queue.pop(), max_in_flight=4)
+        assert [proposal.proposal_id for proposal in batch] == ["1"]
+        assert queue.peek().proposal_id == "3"
+
+    def test_pushes_back_first_when_no_slot_is_free(self):
+        """Test the current proposal is queued again when every slot is in flight."""
+        queue = self.queued(100, 200, 300)
+        queue.sent("a", queue.pop())
+        queue.sent("b", queue.pop())
+        assert queue.take_batch(queue.pop(), max_in_flight=2) == []
+        assert queue.peek().proposal_id == "3"
+        assert len(queue) == 1
+
+    def test_error_requeues_the_proposal_of_its_nonce(self):
+        """Test a failed request pushes back its own proposal, and an answered one closes its own."""
+        queue = self.queued(100, 200)
+        batch = queue.take_batch(queue.pop(), max_in_flight=2)
+        for nonce, proposal in zip(["a", "b"], batch, strict=True):
+            queue.sent(nonce, proposal)
+
+        assert queue.failed("b").proposal_id == "2"
+        assert queue.failed("b") is None
+        assert queue.answered("a").proposal_id == "1"
+        assert queue.in_flight == {}
+        assert queue.pop().proposal_id == "2"
+        assert queue._open.keys() == {"2"}  # noqa: SLF001
+
+
+class TestPonderProposalSource:
+    """Test PonderProposalSource."""
+
+    def test_reads_pages_and_advances(self):
+        """Test the source follows the page cursor, then reads on from the newest block."""
+        source = PonderProposalSource("http://ponder/graphql", page_size=2)
+        assert json.loads(source.request_body())["variables"] == {"since": "0", "limit": 2, "after": None}
+
+        proposals, more = source.handle_response(ponder_page([ponder_item("1", 500, 10), ponder_item("2", 400, 12)], "c"))
+        assert more
+        assert [proposal.deadline for proposal in proposals] == [500, 400]
+        assert json.loads(source.request_body())["variables"]["after"] == "c"
+
+        proposals, more = source.handle_response(ponder_page([ponder_item("3", None, 15, status="Queued")]))
+        assert not more
+        assert proposals[0].deadline is None
+        assert proposals[0].status == ProposalState.APPROVED
+        assert json.loads(source.request_body())["variables"] == {"since": "15", "limit": 2, "after": None}
+
+    def test_skips_proposals_past_their_deadline(self):
+        """Test proposals whose voting ended before the newest creation block are skipped."""
+        source = PonderProposalSource("http://ponder/graphql")
+        proposals, _more = source.handle_response(
+            ponder_page([ponder_item("1", 15, 10), ponder_item("2", 100, 20), ponder_item("3", None, 20)])
+        )
+        assert [proposal.proposal_id for proposal in proposals] == ["2", "3"]
+
+    def test_raises_on_query_errors(self):
+        """Test GraphQL errors are raised."""
+        source = PonderProposalSource("http://ponder/graphql")
+        with pytest.raises(ValueError, match="Ponder query failed"):
+            source.handle_response(json.dumps({"errors": [{"message": "boom"}]}).encode("utf-8"))
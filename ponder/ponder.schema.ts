@@ -6,6 +6,8 @@ export const proposal = onchainTable("proposal", (t) => ({
   status: t.text(),
   createdBy: t.text(),
   transactionHash: t.text(),
+  voteEnd: t.bigint(),
+  createdAtBlock: t.bigint(),
 }));
 
 export const vote = onchainTable("vote", (t) => ({
@@ -9,7 +9,9 @@ ponder.on("MyGovernor:ProposalCreated", async ({ event, context }) => {
             description: event.args.description,
             status: "Pending",
             createdBy: event.args.proposer,
-            transactionHash: event.transaction.hash
+            transactionHash: event.transaction.hash,
+            voteEnd: event.args.voteEnd,
+            createdAtBlock: event.block.number
         })    
 });
 
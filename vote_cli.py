@@ -2,8 +2,14 @@
 Simple CLI for voting on proposals.
 """
 
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from web3 import Web3
+from rich.table import Table
+from rich.console import Console
 from eth_account import Account
 
 with open("controller_api/abi.json", encoding="utf-8") as file:
@@ -14,31 +20,185 @@ with open("ethereum_private_key.txt", encoding="utf-8") as file:
 
 account = Account.from_key(PRIVATE_KEY)
 
+ACTIONS = ['vote', 'cancel']
+RECEIPT_TIMEOUT = 120
+BLOCK_TIME = 2
+GAS_MARGIN = 1.2
+MAX_RECEIPT_WORKERS = 16
+
+
+def read_actions(actions_file, default_action=None):
+    """Read `proposal_id[,action]` lines from a file, defaulting to default_action."""
+    actions = []
+    for row in csv.reader(actions_file):
+        if not row or row[0].startswith('#'):
+            continue
+        action = row[1].strip().lower() if len(row) > 1 and row[1].strip() else default_action
+        if action is None:
+            raise click.UsageError(f"No action for proposal {row[0]}, add one to its row or pass --action.")
+        if action not in ACTIONS:
+            raise click.BadParameter(f"Unknown action {action} for proposal {row[0]}", param_hint='--file')
+        actions.append((row[0].strip(), action))
+    return actions
+
+
+def build_call(contract, proposal_id, action):
+    """Get the contract function call for an action on a proposal."""
+    if action == 'vote':
+        return contract.functions.castVote(int(proposal_id), 1)
+    return contract.functions.cancel(int(proposal_id))
+
+
+class TxBuilder:
+    """Builds and signs transactions offline.
+
+    The chain id is read once, fees once per block and gas once per contract function.
+    Each call is still checked with an eth_call before signing, so an action that would
+    revert, such as a vote on a closed proposal, fails here rather than on-chain.
+    """
+
+    def __init__(self, w3, block_time=BLOCK_TIME, gas_margin=GAS_MARGIN):
+        """Initialize the builder."""
+        self.w3 = w3
+        self.block_time = block_time
+        self.gas_margin = gas_margin
+        self._chain_id = None
+        self._fees = None
+        self._fees_expire_at = 0.0
+        self._gas = {}
+
+    @property
+    def chain_id(self):
+        """The chain id, read once."""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def fees(self):
+        """Fee fields for a transaction, refreshed once a block."""
+        if self._fees is None or time.monotonic() >= self._fees_expire_at:
+            block = self.w3.eth.get_block('latest')
+            if 'baseFeePerGas' in block:
+                tip = self.w3.eth.max_priority_fee
+                # room for the base fee to rise for a few blocks while the batch is mined
+                self._fees = {'maxFeePerGas': 2 * block['baseFeePerGas'] + tip, 'maxPriorityFeePerGas': tip}
+            else:
+                self._fees = {'gasPrice': self.w3.eth.gas_price}
+            self._fees_expire_at = time.monotonic() + self.block_time
+        return self._fees
+
+    def gas(self, tx, fn_name):
+        """Gas limit for a call, estimated once per contract function and reused for the same shape."""
+        key = (tx['to'], fn_name)
+        if key not in self._gas:
+            estimate = self.w3.eth.estimate_gas({'from': tx['from'], 'to': tx['to'], 'data': tx['data']})
+            self._gas[key] = int(estimate * self.gas_margin)
+        return self._gas[key]
+
+    def check(self, tx):
+        """Simulate a call, raising if it would revert."""
+        self.w3.eth.call({'from': tx['from'], 'to': tx['to'], 'data': tx['data']})
+
+    def sign(self, call, nonce):
+        """Build the transaction for a contract function call and sign it with the local account."""
+        tx = {
+            'from': account.address,
+            'to': call.address,
+            'data': call._encode_transaction_data(),  # noqa: SLF001
+            'value': 0,
+            'nonce': nonce,
+            'chainId': self.chain_id,
+        }
+        self.check(tx)
+        tx['gas'] = self.gas(tx, call.fn_name)
+        tx.update(self.fees())
+        del tx['from']
+        return account.sign_transaction(tx)
+
+
+def send_all(w3, contract, actions):
+    """Sign every action with consecutive local nonces and broadcast them back-to-back."""
+    builder = TxBuilder(w3)
+    nonce = w3.eth.get_transaction_count(account.address, 'pending')
+    results = []
+    for proposal_id, action in actions:
+        result = {'proposal_id': proposal_id, 'action': action, 'tx_hash': None, 'error': None}
+        try:
+            signed = builder.sign(build_call(contract, proposal_id, action), nonce)
+            result['tx_hash'] = w3.eth.send_raw_transaction(signed.rawTransaction)
+            print(f"Transaction sent: {result['tx_hash'].hex()}")
+            nonce += 1
+        except Exception as e:  # noqa: BLE001
+            result['error'] = (str(e).splitlines() or [repr(e)])[0]
+        results.append(result)
+    return results
+
+
+def wait_all(w3, results):
+    """Wait for the receipts of all sent transactions concurrently."""
+    sent = [result for result in results if result['tx_hash'] is not None]
+
+    def wait(result):
+        try:
+            receipt = w3.eth.wait_for_transaction_receipt(result['tx_hash'], timeout=RECEIPT_TIMEOUT)
+            result['status'] = 'success' if receipt['status'] == 1 else 'reverted'
+            result['block'] = receipt['blockNumber']
+            result['gas_used'] = receipt['gasUsed']
+        except Exception as e:  # noqa: BLE001
+            result['error'] = (str(e).splitlines() or [repr(e)])[0]
+
+    if sent:
+        with ThreadPoolExecutor(max_workers=min(len(sent), MAX_RECEIPT_WORKERS)) as executor:
+            list(executor.map(wait, sent))
+
+
+def print_summary(results):
+    """Print a table of the outcome of every action."""
+    table = Table(title="Votes")
+    for column in ['Proposal', 'Action', 'Transaction', 'Status', 'Block', 'Gas used']:
+        table.add_column(column)
+    for result in results:
+        table.add_row(
+            result['proposal_id'],
+            result['action'],
+            result['tx_hash'].hex() if result['tx_hash'] is not None else '-',
+            result.get('status') or f"failed: {result['error']}",
+            str(result.get('block', '-')),
+            str(result.get('gas_used', '-')),
+        )
+    Console().print(table)
+
+
 @click.command()
 @click.option('--rpc', required=True, help='The RPC URL.')
 @click.option('--address', required=True, help='The address of the governor contract.')
-@click.option('--proposal-id', required=True, help='The ID of the proposal to act on.')
-@click.option('--action', type=click.Choice(['vote', 'cancel'], case_sensitive=False), required=True, help='Action to take on the proposal.')
-def vote(rpc, address, proposal_id, action):
-    """Vote on a proposal."""
-    click.echo(f"Voting to {action} proposal {proposal_id}")
+@click.option('--proposal-id', 'proposal_ids', multiple=True, help='The ID of a proposal to act on, can be repeated.')
+@click.option('--file', 'actions_file', type=click.File(), help='File of `proposal_id[,action]` lines to act on.')
+@click.option(
+    '--action',
+    type=click.Choice(ACTIONS, case_sensitive=False),
+    help='Action to take on the proposals, and on the --file rows without one.',
+)
+def vote(rpc, address, proposal_ids, actions_file, action):
+    """Vote on proposals, sending all transactions before waiting for their receipts."""
+    if proposal_ids and action is None:
+        raise click.UsageError("Pass --action to act on --proposal-id.")
+    actions = [(proposal_id, action) for proposal_id in proposal_ids]
+    if actions_file is not None:
+        actions += read_actions(actions_file, action)
+    if not actions:
+        raise click.UsageError("Provide --proposal-id or --file.")
+
+    for proposal_id, proposal_action in actions:
+        click.echo(f"Voting to {proposal_action} proposal {proposal_id}")
     click.echo(f"Voting from {account.address}")
 
     w3 = Web3(Web3.HTTPProvider(rpc))
     contract = w3.eth.contract(address=address, abi=ABI)
 
-    if action == 'vote':
-        tx_hash = contract.functions.castVote(int(proposal_id), 1).transact({'from': account.address})
-        print(f"Transaction sent: {tx_hash.hex()}")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-        print(f"Transaction receipt: {receipt}")
-
-
-    elif action == 'cancel':
-        tx_hash = contract.functions.cancel(int(proposal_id)).transact({'from': account.address})
-        print(f"Transaction sent: {tx_hash.hex()}")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-        print(f"Transaction receipt: {receipt}")
+    results = send_all(w3, contract, actions)
+    wait_all(w3, results)
+    print_summary(results)
 
 
 if __name__ == '__main__':